@@ -0,0 +1,96 @@
+"""Compares page load times on the mock portal with and without each resource blocking rule."""
+
+#Native Modules:
+import time
+
+#External Modules:
+from selenium.common.exceptions import WebDriverException
+
+#Internal Modules:
+from HAF.Benchmark.MockPortal import MockPortalClass
+from HAF.Driver.DriverHandler import LoadBareDriver, ApplyResourceBlocking, GetBlockedPatterns
+from HAF.Constants import Driver, Benchmark, CLIConstants
+
+
+def __GetRules() -> list[tuple[str, list[str]]]:
+    """
+    Private function: Gets every blocking rule to be measured, each URL pattern and resource type
+    on its own, plus the full profile used by :mod:`LoadDriver()`.\n
+    Returns a list of (rule name, blocked URL patterns) tuples, the first one blocks nothing.
+    """
+
+    rules = [('No Blocking', [])]
+    rules += [(pattern, [pattern]) for pattern in Driver.BLOCKED_URL_PATTERNS]
+    rules += [(f'Type: {resource_type}', GetBlockedPatterns([], [resource_type])) for resource_type in Driver.RESOURCE_TYPE_PATTERNS]
+    rules.append(('Driver Profile', GetBlockedPatterns()))
+    return rules
+
+
+def RunLoadReport(iterations:int = Benchmark.LOAD_ITERATIONS, print_message_flag:bool = True) -> list[dict]:
+    """
+    Loads the mock portal page 'iterations' times for each blocking rule and page load strategy
+    ('normal' and 'Driver.PAGE_LOAD_STRATEGY'), on a headless driver.\n
+    Returns a list of dictionaries with 'Strategy', 'Rule', 'Average', 'Best' and 'Gain' (percentage
+    saved against no blocking) keys.
+
+    Optional Arguments:
+        - iterations: Number (integer) of page loads measured for each rule.
+        - print_message_flag: A boolean indicating whether the report should be printed.
+
+    Dependencies:
+        - :mod:`__GetRules()`: For blocking rule listing.
+    """
+
+    portal = MockPortalClass()
+    url = portal.Start() + '/'
+    results:list[dict] = []
+
+    try:
+        for strategy in dict.fromkeys(['normal', Driver.PAGE_LOAD_STRATEGY]):
+            driver = LoadBareDriver('headless', strategy)
+            baseline = 0.0
+
+            try:
+                driver.execute_cdp_cmd('Network.setCacheDisabled', {'cacheDisabled': True})
+
+                for rule, patterns in __GetRules():
+                    ApplyResourceBlocking(driver, patterns)
+                    times = []
+
+                    for i in range(max(1, int(iterations))):
+                        driver.get('about:blank')
+                        start = time.perf_counter()
+                        driver.get(url)
+                        times.append(time.perf_counter() - start)
+
+                    average = sum(times) / len(times)
+                    baseline = baseline or average
+                    results.append({
+                        'Strategy': strategy,
+                        'Rule': rule,
+                        'Average': average,
+                        'Best': min(times),
+                        'Gain': (baseline - average) / baseline * 100 if baseline else 0.0
+                    })
+            finally:
+                try:
+                    driver.quit()
+                except WebDriverException:
+                    pass
+    finally:
+        portal.Stop()
+
+    if print_message_flag:
+        for strategy in dict.fromkeys(result['Strategy'] for result in results):
+            print(CLIConstants.LOAD_REPORT_HEADER.format(Iterations = iterations, Strategy = strategy))
+            for result in results:
+                if result['Strategy'] == strategy:
+                    print(CLIConstants.LOAD_REPORT_ROW.format(**result))
+        print('\n', end = '')
+
+    return results
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
@@ -0,0 +1,166 @@
+"""Local mock of Fenix ITSM portal pages, used to benchmark the driver without touching the real portal."""
+
+#Native Modules:
+import time
+import random
+import threading
+from typing import Callable
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+#Internal Modules:
+from HAF.Constants import Benchmark
+
+#Global Constants:
+PIXEL_PNG = bytes.fromhex(
+    '89504e470d0a1a0a0000000d4948445200000001000000010806000000'
+    '1f15c4890000000d49444154789c6360000002000100e221bc330000000049454e44ae426082'
+)
+CONTENT_TYPES = {
+    '.html': 'text/html; charset=utf-8',
+    '.js': 'application/javascript',
+    '.json': 'application/json',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.woff2': 'font/woff2'
+}
+
+
+class MockPortalClass():
+    """
+    Threaded HTTP server on 127.0.0.1 that serves mock portal pages, every page references slow
+    images, fonts, avatars and an analytics script, like the real portal does.\n
+    Extra routes can be added with :mod:`AddRoute()`, see MockSmartIT module for the ticket pages.
+    * Uses double undescore to specify private methods/attributes instead of the convenional single underscore.
+
+    Private Attributes:
+        - __routes: A dictionary of paths and their (status, content type, body, delay, jitter) tuples.
+        - __server: The running ThreadingHTTPServer, None if stopped.
+        - __thread: The thread serving requests, None if stopped.
+    """
+
+    def __init__(self) -> None:
+        """Creates a new MockPortalClass instance with the default portal page at '/'."""
+
+        self.__routes:dict[str, tuple[int, str, bytes | Callable[[], bytes], float, float]] = {}
+        self.__server:ThreadingHTTPServer | None = None
+        self.__thread:threading.Thread | None = None
+
+        #Slow resources, the delay is what resource blocking saves.
+        delay = Benchmark.MOCK_RESOURCE_DELAY
+        resources = []
+        for i in range(Benchmark.MOCK_IMAGES):
+            self.AddRoute(f'/img/banner{i}.png', PIXEL_PNG, delay = delay)
+            resources.append(f'<img src="/img/banner{i}.png">')
+        for i in range(Benchmark.MOCK_AVATARS):
+            self.AddRoute(f'/avatar/{i}.jpg', PIXEL_PNG, delay = delay)
+            resources.append(f'<img src="/avatar/{i}.jpg">')
+        for i in range(Benchmark.MOCK_FONTS):
+            self.AddRoute(f'/fonts/font{i}.woff2', b'', delay = delay)
+            resources.append(f'<style>@font-face {{font-family: f{i}; src: url(/fonts/font{i}.woff2);}} .f{i} {{font-family: f{i};}}</style><span class="f{i}">.</span>')
+        self.AddRoute('/analytics/collect.js', b'window.analytics = true;', delay = delay)
+
+        self.AddRoute('/', (
+            '<!DOCTYPE html><html><head><title>Mock Portal</title>'
+            '<script src="/analytics/collect.js"></script></head>'
+            f'<body><div id="main">{"".join(resources)}</div></body></html>'
+        ).encode(), '.html')
+
+
+    @property
+    def GetURL(self) -> str:
+        """
+        Returns the base URL of the running server, empty if stopped.
+
+        Usage:
+            >>> url:str = portal.GetURL
+        """
+
+        if self.__server is None:
+            return ''
+        return f'http://127.0.0.1:{self.__server.server_address[1]}'
+
+
+    def AddRoute(
+        self,
+        path:str,
+        body:bytes | Callable[[], bytes],
+        extension:str = '',
+        delay:float = 0,
+        status:int = 200,
+        jitter:float = 0
+    ) -> None:
+        """
+        Adds (or replaces) a route served by the mock portal.
+
+        Arguments:
+            - path: The URL path string, i.e. '/index.html'.
+            - body: The response body bytes, or a callable that returns them for every request.
+
+        Optional Arguments:
+            - extension: File extension string that sets the content type, defaults on the path extension.
+            - delay: Time (in seconds) the server waits before answering.
+            - status: The HTTP status code (integer).
+            - jitter: Time (in seconds) randomly added to or taken from 'delay' on every request.
+        """
+
+        extension = extension or ('.' + path.rsplit('.', 1)[-1] if '.' in path.rsplit('/', 1)[-1] else '.html')
+        self.__routes[path] = (status, CONTENT_TYPES.get(extension, 'application/octet-stream'), body, delay, jitter)
+
+
+    def Start(self, port:int = 0) -> str:
+        """
+        Starts serving on a background thread.\n
+        Returns the base URL of the server.
+
+        Optional Arguments:
+            - port: The TCP port (integer), defaults on any free port.
+        """
+
+        routes = self.__routes
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                status, content_type, body, delay, jitter = routes.get(self.path.split('?')[0], (404, 'text/plain', b'Not Found', 0, 0))
+
+                #Request bodies are drained so the browser never sees a reset connection.
+                self.rfile.read(int(self.headers.get('Content-Length') or 0))
+
+                delay = max(0, delay + random.uniform(-jitter, jitter))
+                if delay:
+                    time.sleep(delay)
+
+                if callable(body):
+                    body = body()
+
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('Cache-Control', 'no-store')
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_POST = do_GET
+
+            def log_message(self, *arguments) -> None:
+                pass #Keeps the CLI clean.
+
+        self.__server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self.__server.daemon_threads = True
+        self.__thread = threading.Thread(target = self.__server.serve_forever, name = 'HAF-MockPortal', daemon = True)
+        self.__thread.start()
+        return self.GetURL
+
+
+    def Stop(self) -> None:
+        """Stops the server (if running)."""
+
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__server = None
+            self.__thread = None
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
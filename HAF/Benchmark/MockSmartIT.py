@@ -0,0 +1,449 @@
+"""Local mock of the SmartIT smart recorder, ticket editor, designation menu and Microsoft login pages."""
+
+#Native Modules:
+import html
+import json
+import itertools
+
+#Internal Modules:
+from HAF.Benchmark.MockPortal import MockPortalClass
+from HAF.Driver.LocatorHandler import LOCATORS, XPATH_ROOTS, XPATH_STEP
+from HAF.Constants import MenuScripts, Benchmark
+
+#Global Constants:
+PORTAL_PATH = '/smartit/app/'
+LOGIN_PATH = '/login/'
+REST_PATH = '/smartit/rest/mock/'
+CREATE_PATH = '/smartit/rest/v2/sberequest' #Matches 'Network.TICKET_CREATE_PATTERN'.
+SESSION_COOKIE = 'smartit_session'
+
+#Element tag and attributes of locators that are a bare ID, by name suffix.
+LEAF_TAGS = (
+    ('Input', 'input', {'type': 'text'}),
+    ('Checkbox', 'input', {'type': 'checkbox'}),
+    ('Button', 'button', {'type': 'button'})
+)
+LEAF_ATTRIBUTES = {
+    'SmartRecorder.MainBar': {'contenteditable': 'true'}
+}
+
+#Body classes each element needs to be displayed, elements of pages missing here are always displayed.
+PAGE_SHOWS = {
+    'TicketEditor': 'ticket editing',
+    'DesignationMenu': 'ticket designation'
+}
+SHOWS = {
+    'Login.ProfileTile': 'tiles',
+    'Login.EmailInput': 'email',
+    'Login.PasswordInput': 'password',
+    'Login.MFATitle': 'mfa',
+    'Login.MFATimeoutCheckbox': 'mfa',
+    'Login.KeepSignedInCheckbox': 'kmsi',
+    'Login.ConfirmButton': 'kmsi',
+    'SmartRecorder.MainBar': 'recorder loaded',
+    'SmartRecorder.TemplateIcon': 'recorder catalog',
+    'SmartRecorder.CreateButton': 'recorder selected',
+    'TicketPage.TaskTab': 'ticket loaded',
+    'TicketPage.EditorButton': 'ticket tasks',
+    'TicketEditor.StatusOngoing': 'ticket editing status',
+    'TicketEditor.StatusConcluded': 'ticket editing status',
+    'TicketEditor.StatusReasonSolution': 'ticket editing reason',
+    'TicketEditor.DefinitionOption1': 'ticket editing definition1',
+    'TicketEditor.DefinitionOption4': 'ticket editing definition1',
+    'TicketEditor.DefinitionOption2': 'ticket editing definition2',
+    'TicketEditor.DefinitionOption3': 'ticket editing definition3',
+    'TicketEditor.CategoryOperational': 'ticket editing category',
+    'TicketEditor.CategoryTier1': 'ticket editing operational',
+    'TicketEditor.CategoryTier2Button': 'ticket editing tier1',
+    'TicketEditor.CategoryTier2': 'ticket editing tier2',
+    'TicketEditor.EditButton': 'ticket loaded',
+    'DesignationMenu.GroupAll': 'ticket designation groups',
+    'DesignationMenu.TeamInput': 'ticket designation teamsearch',
+    'DesignationMenu.FirstResult': 'ticket designation teams'
+}
+
+#'Page.Name:event': (request step, body classes added, body classes removed, script hook), requests
+#are answered after the mock latency and the classes are only changed once they are.
+ACTIONS = {
+    'Login.ProfileTile:click': ('login-tile', ['password'], ['tiles'], ''),
+    'Login.EmailInput:enter': ('login-email', ['password'], ['email'], ''),
+    'Login.PasswordInput:enter': ('login-password', ['mfa'], ['password'], 'ApproveMFA'),
+    'Login.ConfirmButton:click': ('login-kmsi', [], [], 'SignIn'),
+    'SmartRecorder.MainBar:input': ('', [], [], 'Search'),
+    'SmartRecorder.MainBar:enter': ('', [], [], 'Pick'),
+    'SmartRecorder.TemplateIcon:click': ('', ['selected'], [], ''),
+    'SmartRecorder.CreateButton:click': ('menu', [], [], 'OpenMenu'),
+    'TicketPage.TaskTab:click': ('', ['tasks'], [], ''),
+    'TicketPage.EditorButton:click': ('editor', ['editing'], [], ''),
+    'TicketEditor.StatusButton:click': ('', ['status'], [], ''),
+    'TicketEditor.StatusOngoing:click': ('', [], ['status'], ''),
+    'TicketEditor.StatusConcluded:click': ('', [], ['status'], ''),
+    'TicketEditor.StatusReasonButton:click': ('', ['reason'], [], ''),
+    'TicketEditor.StatusReasonSolution:click': ('', [], ['reason'], ''),
+    'TicketEditor.DefinitionButton1:click': ('', ['definition1'], [], ''),
+    'TicketEditor.DefinitionOption1:click': ('', [], ['definition1'], ''),
+    'TicketEditor.DefinitionOption4:click': ('', [], ['definition1'], ''),
+    'TicketEditor.DefinitionButton2:click': ('', ['definition2'], [], ''),
+    'TicketEditor.DefinitionOption2:click': ('', [], ['definition2'], ''),
+    'TicketEditor.DefinitionButton3:click': ('', ['definition3'], [], ''),
+    'TicketEditor.DefinitionOption3:click': ('', [], ['definition3'], ''),
+    'TicketEditor.CategoryButton:click': ('', ['category'], [], ''),
+    'TicketEditor.CategoryOperational:click': ('categories', ['operational'], [], ''),
+    'TicketEditor.CategoryTier1:click': ('', ['tier1'], [], ''),
+    'TicketEditor.CategoryTier2Button:click': ('', ['tier2'], [], ''),
+    'TicketEditor.CategoryTier2:click': ('', [], ['category', 'operational', 'tier1', 'tier2'], ''),
+    'TicketEditor.AssignToMe:click': ('assign', [], [], ''),
+    'TicketEditor.DesignationMenuButton:click': ('designation', ['designation'], [], ''),
+    'TicketEditor.SaveButton:click': ('save', [], ['editing'], ''),
+    'TicketEditor.EditButton:click': ('editor', ['editing'], [], ''),
+    'DesignationMenu.GroupButton:click': ('', ['groups'], [], ''),
+    'DesignationMenu.GroupAll:click': ('', [], ['groups'], ''),
+    'DesignationMenu.TeamButton:click': ('', ['teamsearch'], [], ''),
+    'DesignationMenu.TeamInput:input': ('teams', ['teams'], [], ''),
+    'DesignationMenu.ConfirmButton:click': ('', [], ['designation', 'groups', 'teamsearch', 'teams'], '')
+}
+
+#Request steps sent by the page scripts themselves, on top of the ones in 'ACTIONS'.
+SCRIPT_STEPS = ('home', 'recorder', 'ticket', 'users', 'templates', 'application', 'login-mfa')
+
+ENGINE_SCRIPT = '''
+    function Classes(add, remove) {
+        add.forEach(function(token) { document.body.classList.add(token); });
+        remove.forEach(function(token) { document.body.classList.remove(token); });
+    }
+
+    function Request(path, then, method) {
+        var xhr = new XMLHttpRequest();
+        xhr.open(method || 'GET', path);
+        xhr.onload = function() { if (then) { then(xhr.responseText); } };
+        xhr.send(method === 'POST' ? '{}' : null);
+    }
+
+    function Run(element, event) {
+        var action = ACTIONS[element.getAttribute('data-name') + ':' + event];
+        if (!action) { return false; }
+
+        function Apply() {
+            Classes(action[1], action[2]);
+            if (action[3]) { Hooks[action[3]](element); }
+        }
+        if (action[0]) { Request(REST_PATH + action[0], Apply); } else { Apply(); }
+        return true;
+    }
+
+    function Target(event) {
+        return event.target.closest ? event.target.closest('[data-name]') : null;
+    }
+
+    //Clicks are never forwarded by labels, the portal dropdowns are built inside them.
+    document.addEventListener('click', function(event) {
+        var element = Target(event);
+        if (element) {
+            Run(element, 'click');
+            if (element.type !== 'checkbox') { event.preventDefault(); }
+        }
+    });
+    document.addEventListener('keydown', function(event) {
+        var element = Target(event);
+        if (event.key === 'Enter' && element && Run(element, 'enter')) { event.preventDefault(); }
+    });
+    document.addEventListener('input', function(event) {
+        var element = Target(event);
+        if (element) { Run(element, 'input'); }
+    });
+'''
+PORTAL_SCRIPT = '''
+    var State = {route: 0, typing: false, mark: 0, template: ''};
+
+    Hooks.Search = function(element) {
+        var text = element.textContent;
+        if (!State.typing) {
+            if (text.indexOf('@') >= 0) { Request(REST_PATH + 'users'); }
+            return;
+        }
+        State.template = text.slice(State.mark).trim();
+        Request(REST_PATH + 'templates', function() { if (State.template) { Classes(['catalog'], []); } });
+    };
+
+    Hooks.Pick = function(element) {
+        State.typing = true;
+        State.mark = element.textContent.length;
+    };
+
+    //Ticket menu, built from the keyboard script of the template type so every TAB lands where it's expected.
+    Hooks.OpenMenu = function() {
+        var menu = document.createElement('aside'), heading = document.createElement('h2');
+        menu.id = 'mock-menu';
+        heading.tabIndex = -1;
+        heading.textContent = 'New ticket: ' + State.template;
+        menu.appendChild(heading);
+
+        (LAYOUTS[State.template] || LAYOUTS[DEFAULT_LAYOUT]).forEach(function(role) {
+            var control;
+            switch (role) {
+                case 'Body':
+                    control = document.createElement('textarea');
+                    break;
+                case 'Application':
+                    control = document.createElement('input');
+                    control.addEventListener('input', function() { Request(REST_PATH + 'application'); });
+                    break;
+                case 'Contact':
+                    control = document.createElement('input');
+                    break;
+                case 'Send':
+                    control = document.createElement('button');
+                    control.textContent = role;
+                    control.addEventListener('click', Send);
+                    break;
+                default:
+                    control = document.createElement('button');
+                    control.textContent = role;
+                    control.addEventListener('click', function() { control.classList.toggle('checked'); });
+            }
+            control.setAttribute('data-role', role);
+            menu.appendChild(control);
+        });
+
+        document.body.appendChild(menu);
+        heading.focus();
+    };
+
+    function Send() {
+        Request(CREATE_PATH, function(response) {
+            location.hash = '#/sberequest/' + JSON.parse(response).displayId;
+        }, 'POST');
+    }
+
+    function Route() {
+        var hash = location.hash, route = ++State.route, menu = document.getElementById('mock-menu');
+        var view = hash.indexOf('#/create/smart-recorder') === 0 ? 'recorder' : (hash.indexOf('#/sberequest/') === 0 ? 'ticket' : 'home');
+
+        if (menu) { menu.parentNode.removeChild(menu); }
+        document.querySelector('[data-name="SmartRecorder.MainBar"]').textContent = '';
+        State.typing = false;
+        State.template = '';
+        document.body.className = view;
+
+        Request(REST_PATH + view, function() { if (route === State.route) { Classes(['loaded'], []); } });
+    }
+
+    if (document.cookie.indexOf(SESSION_COOKIE + '=') < 0) {
+        location.replace(LOGIN_PATH + '?return=' + encodeURIComponent(location.href));
+    } else {
+        window.addEventListener('hashchange', Route);
+        Route();
+    }
+'''
+LOGIN_SCRIPT = '''
+    Hooks.ApproveMFA = function() {
+        Request(REST_PATH + 'login-mfa', function() { Classes(['kmsi'], ['mfa']); });
+    };
+
+    Hooks.SignIn = function() {
+        document.cookie = SESSION_COOKIE + '=' + Date.now() + '; path=/';
+        localStorage.setItem('mock_account', '1');
+        location.replace(new URLSearchParams(location.search).get('return') || PORTAL_PATH + '#/');
+    };
+
+    document.body.className = localStorage.getItem('mock_account') ? 'tiles' : 'email';
+'''
+PAGE_STYLE = '''
+    [data-name]:not(input):not(textarea) { display: inline-block; min-width: 1em; min-height: 1em; }
+    #mock-menu > * { display: block; margin: 4px; }
+'''
+
+
+def GetMenuLayouts() -> dict[str, list[str]]:
+    """
+    Gets the controls of the mock ticket menu of each template type, in TAB order, from the
+    keyboard scripts in 'MenuScripts.SCRIPTS'.\n
+    Returns a dictionary of template types and their list of control roles ('Body', 'Application',
+    'Contact', 'Option', 'Filler' or 'Send').
+    """
+
+    layouts:dict[str, list[str]] = {}
+
+    for ticket_type, script in MenuScripts.SCRIPTS.items():
+        roles:dict[int, str] = {}
+        position = 0
+
+        for step in script:
+            match step[0]:
+                case 'tab':
+                    position += int(step[1])
+                case 'space':
+                    roles[position] = 'Option'
+                case 'text' | 'insert':
+                    roles[position] = str(step[1])
+
+        roles[position] = 'Send' #The last key pressed sends the ticket.
+        layouts[ticket_type] = [roles.get(index, 'Filler') for index in range(1, position + 1)]
+
+    return layouts
+
+
+def __NewNode(tag:str, attributes:dict | None = None) -> dict:
+    """
+    Private function: Creates a new element node.\n
+    Returns a dictionary with 'Tag', 'Attributes', 'Text' and 'Children' keys.
+
+    Arguments:
+        - tag: The element tag string.
+
+    Optional Arguments:
+        - attributes: Dictionary of element attributes.
+    """
+
+    return {'Tag': tag, 'Attributes': dict(attributes or {}), 'Text': '', 'Children': []}
+
+
+def __GetChild(node:dict, tag:str, position:int) -> dict:
+    """
+    Private function: Gets the nth child of a tag, adding empty siblings until there are enough of them.\n
+    Returns the child node.
+
+    Arguments:
+        - node: The parent node dictionary.
+        - tag: The child tag string.
+        - position: The child position (integer) among its siblings of the same tag, starting at 1.
+    """
+
+    siblings = [child for child in node['Children'] if child['Tag'] == tag]
+    while len(siblings) < position:
+        siblings.append(__NewNode(tag))
+        node['Children'].append(siblings[-1])
+    return siblings[position - 1]
+
+
+def __RenderNode(node:dict) -> str:
+    """
+    Private function: Renders an element node and its children as HTML.
+
+    Arguments:
+        - node: The node dictionary.
+    """
+
+    attributes = ''.join(f' {key}="{html.escape(str(value))}"' for key, value in node['Attributes'].items() if value != '')
+    if node['Tag'] == 'input':
+        return f'<input{attributes}>'
+
+    children = ''.join(__RenderNode(child) for child in node['Children'])
+    return f'<{node["Tag"]}{attributes}>{html.escape(node["Text"])}{children}</{node["Tag"]}>'
+
+
+def __BuildDocument(title:str, pages:list[str], script:str, data:dict) -> bytes:
+    """
+    Private function: Builds a page where every locator of 'pages' resolves to its own element, with the
+    same tags and positions as the portal (see 'LOCATORS'), each element is displayed once the body has
+    its 'SHOWS' classes.\n
+    Returns the HTML document bytes.
+
+    Arguments:
+        - title: The document title string.
+        - pages: A list of locator page names.
+        - script: The page script string, run after 'ENGINE_SCRIPT'.
+        - data: Dictionary of global script variables and their values.
+    """
+
+    body = __NewNode('body')
+    anchors:dict[str, dict] = {}
+    tokens:set[str] = set()
+
+    for page in pages:
+        for name, xpath in LOCATORS[page].items():
+            for pattern, Root in XPATH_ROOTS:
+                match = pattern.match(xpath)
+                if match:
+                    break
+            else:
+                raise ValueError(f'Locator "{page}.{name}" has no supported root: "{xpath}".')
+
+            root = Root(match)
+            steps = [XPATH_STEP.match(step) for step in filter(None, xpath[match.end():].split('/'))]
+            if not all(steps):
+                raise ValueError(f'Locator "{page}.{name}" has unsupported steps: "{xpath}".')
+
+            #Anchors are added after the body own children, so they never shift body positions.
+            if root == 'html > body':
+                node = body
+            elif root not in anchors:
+                tag, attributes = root, {}
+                if root.startswith('#'):
+                    tag, attributes = 'section', {}
+                    if not steps:
+                        tag, attributes = next(((tag, attributes) for suffix, tag, attributes in LEAF_TAGS if name.endswith(suffix)), ('div', {}))
+                    attributes = {'id': root[1:], **attributes}
+                node = anchors[root] = __NewNode(tag, attributes)
+            else:
+                node = anchors[root]
+
+            for step in steps:
+                tag, position = step.groups()
+                node = __GetChild(node, tag, int(position or 1))
+
+            show = SHOWS.get(f'{page}.{name}', PAGE_SHOWS.get(page, ''))
+            tokens.update(show.split())
+            node['Attributes'].update({'data-name': f'{page}.{name}', 'data-show': show, **LEAF_ATTRIBUTES.get(f'{page}.{name}', {})})
+            if node['Tag'] not in ('input', 'textarea') and 'contenteditable' not in node['Attributes']:
+                node['Text'] = name
+
+    body['Children'].extend(anchors.values())
+
+    style = PAGE_STYLE + ''.join(f'body:not(.{token}) [data-show~="{token}"] {{ display: none !important; }}\n' for token in sorted(tokens))
+    variables = ''.join(f'var {key} = {json.dumps(value)};\n' for key, value in data.items())
+
+    #Scripts run last, so the page is fully built by then.
+    return (
+        f'<!DOCTYPE html><html><head><title>{html.escape(title)}</title><style>{style}</style></head>'
+        + __RenderNode(body).removesuffix('</body>')
+        + f'<script>{variables}var Hooks = {{}};\n{ENGINE_SCRIPT}{script}</script></body></html>'
+    ).encode()
+
+
+def AddSmartITRoutes(portal:MockPortalClass, latency:float = Benchmark.MOCK_LATENCY, jitter:float = Benchmark.MOCK_JITTER) -> None:
+    """
+    Adds the SmartIT single page app (at 'PORTAL_PATH', with the portal hash routes), the Microsoft
+    login pages (at 'LOGIN_PATH') and their requests to a mock portal.\n
+    The app asks for login until the session cookie is set, the login goes through the email,
+    password, MFA (approved on its own) and "keep me signed in" screens, then the profile tile.
+
+    Arguments:
+        - portal: The MockPortalClass instance, routes should be added before it's started.
+
+    Optional Arguments:
+        - latency: Time (in seconds) every page and request takes to be answered.
+        - jitter: Time (in seconds) randomly added to or taken from 'latency'.
+    """
+
+    data = {
+        'ACTIONS': ACTIONS,
+        'LAYOUTS': GetMenuLayouts(),
+        'DEFAULT_LAYOUT': next(iter(MenuScripts.SCRIPTS)),
+        'PORTAL_PATH': PORTAL_PATH,
+        'LOGIN_PATH': LOGIN_PATH,
+        'REST_PATH': REST_PATH,
+        'CREATE_PATH': CREATE_PATH,
+        'SESSION_COOKIE': SESSION_COOKIE
+    }
+
+    portal.AddRoute(PORTAL_PATH, __BuildDocument('SmartIT', ['SmartRecorder', 'TicketPage', 'TicketEditor', 'DesignationMenu'], PORTAL_SCRIPT, data), '.html', latency, jitter = jitter)
+    portal.AddRoute(LOGIN_PATH, __BuildDocument('Sign in to your account', ['Login'], LOGIN_SCRIPT, data), '.html', latency, jitter = jitter)
+
+    for step in dict.fromkeys(list(SCRIPT_STEPS) + [action[0] for action in ACTIONS.values() if action[0]]):
+        portal.AddRoute(REST_PATH + step, b'{}', '.json', latency, jitter = jitter)
+
+    #Every created ticket gets the next ID, read by the driver from the response or the ticket page URL.
+    ticket_IDs = itertools.count(Benchmark.MOCK_FIRST_TICKET_ID)
+    portal.AddRoute(
+        CREATE_PATH,
+        lambda: json.dumps({'id': 'AGGAA5V0GEXAMPLE', 'displayId': str(next(ticket_IDs))}).encode(),
+        '.json',
+        latency,
+        jitter = jitter
+    )
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
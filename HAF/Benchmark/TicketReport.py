@@ -0,0 +1,256 @@
+"""Registers open, close and escalate tickets on the mock SmartIT portal and reports their latency percentiles."""
+
+#Native Modules:
+import io
+import os
+import math
+import time
+import shutil
+import tempfile
+import threading
+import contextlib
+import configparser
+from typing import Iterator
+
+#External Modules:
+from selenium.common.exceptions import WebDriverException
+
+#Internal Modules:
+from HAF.Benchmark.MockPortal import MockPortalClass
+from HAF.Benchmark.MockSmartIT import AddSmartITRoutes, PORTAL_PATH, LOGIN_PATH
+from HAF.Driver.DriverHandler import LoadDriver
+from HAF.Ticket.TicketHandler import TicketProcessor
+from HAF.FileHandler.Latency import LatencyClass, SetLatencyProfile
+from HAF.FileHandler.JsonHandler import SaveJson
+from HAF.Constants import URL, MicrosoftLogin, Session, Paths, Benchmark, CLIConstants
+
+#Global Constants:
+SANDBOX_CONFIG = {
+    'Microsoft': {'email': 'benchmark@example.com', 'password': 'Benchmark#0'},
+    'Log': {'counter': '0'},
+    'GUI': {'language': 'en-US', 'auto_open': '0'}
+}
+
+
+class StepRecorderClass(LatencyClass):
+    """
+    Latency profile that also keeps every sample recorded since it was last drained, so step times
+    can be reported over the whole benchmark instead of the rolling window.
+    * Uses double undescore to specify private methods/attributes instead of the convenional single underscore.
+
+    Private Attributes:
+        - __recorded: A dictionary of step names and their list of times (in seconds) since the last drain.
+        - __recorded_lock: A threading lock guarding '__recorded'.
+    """
+
+    def __init__(self) -> None:
+        """Creates a new StepRecorderClass instance, loaded like LatencyClass."""
+
+        super().__init__()
+        self.__recorded:dict[str, list[float]] = {}
+        self.__recorded_lock = threading.Lock()
+
+
+    def Record(self, step:str, seconds:float, timeout_default:float | None = None) -> None:
+        """
+        Adds a new observed time to a step window and to the recorded samples, the benchmark
+        keeps the real time of timed out waits.
+
+        Arguments:
+            - step: A string with the step name.
+            - seconds: Time (in seconds) the step took to become ready.
+
+        Optional Arguments:
+            - timeout_default: The hand-tuned timeout (in seconds) of a wait that timed out, see LatencyClass.
+        """
+
+        super().Record(step, seconds, timeout_default)
+        with self.__recorded_lock:
+            self.__recorded.setdefault(str(step), []).append(float(seconds))
+
+
+    def Drain(self) -> dict[str, list[float]]:
+        """Returns the samples recorded since the last call and clears them."""
+
+        with self.__recorded_lock:
+            recorded, self.__recorded = self.__recorded, {}
+        return recorded
+
+
+def __Percentile(values:list[float], percentile:float) -> float:
+    """
+    Private function: Gets the nearest-rank percentile of a list of times, like :mod:`GetPercentile()`.\n
+    Returns the percentile value (in seconds), 0 for an empty list.
+
+    Arguments:
+        - values: A list of times (in seconds).
+        - percentile: The percentile (0 to 100) that should be calculated.
+    """
+
+    if not values:
+        return 0.0
+
+    values = sorted(values)
+    return values[max(math.ceil(percentile / 100 * len(values)), 1) - 1]
+
+
+@contextlib.contextmanager
+def __Sandbox(base_url:str, folder:str) -> Iterator[StepRecorderClass]:
+    """
+    Private function: Points the portal and login URLs at the mock portal and every file written by
+    ticket processing (log, persistent, latency, journal, health and config files) at 'folder', with
+    a fresh latency profile, everything is restored on exit.\n
+    Yields the StepRecorderClass instance shared while inside the sandbox.
+
+    Arguments:
+        - base_url: The mock portal base URL string.
+        - folder: The sandbox directory path string.
+    """
+
+    portal_url = base_url + PORTAL_PATH
+    redirects = [
+        (URL, 'PORTAL_URL', portal_url + '#/'),
+        (URL, 'SMART_RECORDER_URL', portal_url + '#/create/smart-recorder'),
+        (URL, 'TICKED_ID_PREFIX', portal_url + '#/sberequest/'),
+        (MicrosoftLogin, 'LOGIN_URL_PREFIX', base_url + LOGIN_PATH),
+        (Session, 'KEEPALIVE_URL', portal_url),
+        (Paths, 'DICTIONARY_JSON_PATH', os.path.join(folder, 'dictionary.json')),
+        (Paths, 'CONFIG_INI_PATH', os.path.join(folder, 'config.ini')),
+        (Paths, 'LOG_TXT_PATH', os.path.join(folder, 'log.txt')),
+        (Paths, 'PERSISTENT_JSON_PATH', os.path.join(folder, 'persistent.json')),
+        (Paths, 'LATENCY_JSON_PATH', os.path.join(folder, 'latency.json')),
+        (Paths, 'HEALTH_LOG_PATH', os.path.join(folder, 'health.txt')),
+        (Paths, 'JOURNAL_FOLDER_PATH', os.path.join(folder, 'Journal', ''))
+    ]
+    originals = [(group, name, getattr(group, name)) for group, name, value in redirects]
+
+    for group, name, value in redirects:
+        setattr(group, name, value)
+
+    try:
+        SaveJson(Benchmark.TICKET_TEMPLATES, Paths.DICTIONARY_JSON_PATH)
+
+        configfile = configparser.ConfigParser()
+        configfile.read_dict(SANDBOX_CONFIG)
+        with open(Paths.CONFIG_INI_PATH, 'w') as file:
+            configfile.write(file)
+
+        recorder = StepRecorderClass()
+        previous = SetLatencyProfile(recorder)
+        try:
+            yield recorder
+        finally:
+            SetLatencyProfile(previous)
+    finally:
+        for group, name, value in originals:
+            setattr(group, name, value)
+
+
+def RunTicketReport(
+    iterations:int = Benchmark.TICKET_ITERATIONS,
+    latency:float = Benchmark.MOCK_LATENCY,
+    jitter:float = Benchmark.MOCK_JITTER,
+    block_flag:bool = True,
+    print_message_flag:bool = True
+) -> list[dict]:
+    """
+    Registers one ticket of each benchmark template (see 'Benchmark.TICKET_TEMPLATES') per iteration
+    on the mock SmartIT portal, with a headless driver that logs in through the mock Microsoft pages.\n
+    Portal URLs and ticket files are redirected while it runs (see :mod:`__Sandbox()`), so no other
+    driver should be processing tickets meanwhile.\n
+    Returns a list of dictionaries with 'Process_Type', 'Step', 'Samples', 'P50', 'P95' and 'P99' keys,
+    the end-to-end time of registered tickets is reported as the 'Total' step.
+
+    Optional Arguments:
+        - iterations: Number (integer) of tickets registered for each template.
+        - latency: Time (in seconds) every mock page and request takes to be answered.
+        - jitter: Time (in seconds) randomly added to or taken from 'latency'.
+        - block_flag: A boolean indicating whether the benchmark driver should block resources (see
+        :mod:`LoadDriver()`), enabled regardless of 'Driver.BLOCK_RESOURCES'.
+        - print_message_flag: A boolean indicating whether the report should be printed.
+
+    Dependencies:
+        - :mod:`AddSmartITRoutes()`: For the mock portal pages.
+        - :mod:`__Sandbox()`: For URL and file redirection.
+        - :mod:`__Percentile()`: For percentile calculation.
+    """
+
+    iterations = max(1, int(iterations))
+    portal = MockPortalClass()
+    AddSmartITRoutes(portal, latency, jitter)
+    base_url = portal.Start()
+    folder = tempfile.mkdtemp(prefix = 'HAF-Benchmark-')
+
+    samples:dict[str, dict[str, list[float]]] = {process_type: {} for process_type in Benchmark.TICKET_TEMPLATES}
+    errors:dict[str, str] = {}
+
+    try:
+        with __Sandbox(base_url, folder) as recorder:
+            #Ticket processing messages are kept out of the report.
+            with contextlib.redirect_stdout(io.StringIO()):
+                driver = LoadDriver(os.path.join(folder, 'Profile', ''), 'headless', False, False, block_flag, False)
+            recorder.Drain() #Login steps aren't part of any ticket.
+
+            try:
+                for i in range(iterations):
+                    for process_type in Benchmark.TICKET_TEMPLATES:
+                        call_data = {
+                            'Required': dict(Benchmark.TICKET_CALL['Required'], Call_Type = process_type),
+                            'Optional': dict(Benchmark.TICKET_CALL['Optional'])
+                        }
+
+                        start = time.perf_counter()
+                        try:
+                            with contextlib.redirect_stdout(io.StringIO()):
+                                log = TicketProcessor(driver, call_data)
+                        except Exception as error:
+                            errors[process_type] = str(error).strip().split('\n')[0] or type(error).__name__
+                            log = None
+                        total = time.perf_counter() - start
+
+                        steps = samples[process_type]
+                        for step, values in recorder.Drain().items():
+                            steps.setdefault(step, []).extend(values)
+                        if log is not None:
+                            steps.setdefault('Total', []).append(total)
+            finally:
+                try:
+                    driver.quit()
+                except WebDriverException:
+                    pass
+    finally:
+        portal.Stop()
+        shutil.rmtree(folder, ignore_errors = True)
+
+    results:list[dict] = []
+    for process_type, steps in samples.items():
+        for step in sorted(steps, key = lambda step: (step != 'Total', -__Percentile(steps[step], 50))):
+            results.append({
+                'Process_Type': process_type,
+                'Step': step,
+                'Samples': len(steps[step]),
+                'P50': __Percentile(steps[step], 50),
+                'P95': __Percentile(steps[step], 95),
+                'P99': __Percentile(steps[step], 99)
+            })
+
+    if print_message_flag:
+        print(CLIConstants.TICKET_REPORT_HEADER.format(Iterations = iterations, Latency = latency, Jitter = jitter))
+        for process_type, steps in samples.items():
+            print(CLIConstants.TICKET_REPORT_SECTION.format(
+                Process_Type = process_type,
+                Registered = len(steps.get('Total', [])),
+                Iterations = iterations,
+                Last_Error = f' (last error: {errors[process_type]})' if process_type in errors else ''
+            ))
+            for result in results:
+                if result['Process_Type'] == process_type:
+                    print(CLIConstants.TICKET_REPORT_ROW.format(**result))
+        print('\n', end = '')
+
+    return results
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
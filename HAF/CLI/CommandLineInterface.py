@@ -43,6 +43,18 @@ def CommandLineInterface(driver:webdriver.Chrome) -> bool:
             case 'details':
                 DetailsCommand().execute(command_list)
 
+            case 'benchmark':
+                BenchmarkCommand(driver).execute(command_list)
+
+            case 'trace':
+                TraceCommand(driver).execute(command_list)
+
+            case 'metrics':
+                MetricsCommand().execute(command_list)
+
+            case 'perf':
+                PerfCommand().execute(command_list)
+
             case 'help':
                 HelpCommand().execute(command_list)
 
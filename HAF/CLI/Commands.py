@@ -1,5 +1,8 @@
 """Defines command behavior."""
 
+#Native Modules:
+from concurrent.futures import Future
+
 #External Modules:
 from selenium import webdriver
 
@@ -7,8 +10,20 @@ from selenium import webdriver
 from HAF.GUI.GUIHandler import GUI
 from HAF.FileHandler.Logger import LogClass
 from HAF.FileHandler.Config import ConfigClass
-from HAF.Constants import CLIConstants, LogConstants
-from HAF.Ticket.TicketHandler import TicketProcessor
+from HAF.FileHandler.JsonHandler import LoadJson
+from HAF.Constants import CLIConstants, LogConstants, Paths
+from HAF.Ticket.TicketHandler import TicketProcessor, ResumeTicket, TicketSentError
+from HAF.Driver.DriverPool import GetDriverPool, ShutdownDriverPool
+from HAF.Driver.TabPipeline import GetTabPipeline, ShutdownTabPipeline
+from HAF.Driver.RetryHandler import CircuitOpenError
+from HAF.Driver.SessionKeeper import StopSessionKeeper
+from HAF.Driver.DriverLock import GetDriverLock
+from HAF.Driver.CommandTracer import StartTrace, StopTrace, TraceDriver
+from HAF.Metrics.Instruments import IsMetricsEnabled
+from HAF.Metrics.Exporter import StartMetrics, StopMetrics, RenderMetrics
+from HAF.Driver.StepProfiler import StartProfiling, StopProfiling, IsProfiling, PrintPerfReport
+from HAF.Benchmark.LoadReport import RunLoadReport
+from HAF.Benchmark.TicketReport import RunTicketReport
 
 
 class GuiCommand():
@@ -119,7 +134,11 @@ class CallCommand():
 
     Description = 'Registers call data as ticket.'
     Subcommands = {
-        'register': 'register a ticket based on its dictonary type.'
+        'register': 'register a ticket based on its dictonary type.',
+        'submit': 'queues the call to be registered by the driver pool in the background.',
+        'pipe': 'queues the call to be registered in a background tab of the current browser.',
+        'resume': 'resumes the newest interrupted ticket from its last saved step, without creating it again.',
+        'pool': 'shows the driver pool health.'
     }
     Usage = ['call [subcommand]']
 
@@ -150,7 +169,40 @@ class CallCommand():
             case 1: #Command has a valid subcommand, executes, the subcommand.
                 match command_list[1]:
                     case 'register':
-                        TicketProcessor(self.__driver)
+                        try:
+                            TicketProcessor(self.__driver)
+                        except CircuitOpenError as error:
+                            print(f"- ERROR 06: 'Portal Unavailable', {error}\n")
+                        except TicketSentError as error:
+                            print(f"- ERROR 09: 'Ticket Interrupted', {error} Use \"call resume\" to clear it once checked.\n")
+
+                    case 'resume':
+                        try:
+                            ResumeTicket(self.__driver)
+                        except CircuitOpenError as error:
+                            print(f"- ERROR 06: 'Portal Unavailable', {error}\n")
+                        except TicketSentError as error:
+                            print(f"- ERROR 09: 'Ticket Interrupted', {error} Use \"call resume\" to clear it once checked.\n")
+
+                    case 'submit':
+                        pool = GetDriverPool(primary = self.__driver)
+                        pool.Submit(LoadJson(Paths.CALL_JSON_PATH)).add_done_callback(self.__onPoolDone)
+                        print(f'- Call queued ({pool.GetPending} pending on {pool.GetSize} drivers).\n')
+
+                    case 'pipe':
+                        pipeline = GetTabPipeline(self.__driver)
+                        pipeline.Submit(LoadJson(Paths.CALL_JSON_PATH)).add_done_callback(self.__onPoolDone)
+                        print(f'- Call queued ({pipeline.GetPending} pending on {pipeline.GetSize} tabs).\n')
+
+                    case 'pool':
+                        pool = GetDriverPool(False)
+
+                        if pool is None:
+                            print('- Driver pool is not running, use "call submit" to start it.\n')
+                        else:
+                            for index, health in enumerate(pool.GetHealth()):
+                                print(CLIConstants.POOL_HEALTH_TEMPLATE.format(Index = index, **health))
+                            print(f'- {pool.GetPending} calls pending.\n')
 
             case 2: #Invalid was sent by the user, prints standard invalid subcommand message.
                 print(CLIConstants.INVALID_SUBCOMMAND.format(Command = command_list[0], Subcommand = command_list[1]))
@@ -162,6 +214,20 @@ class CallCommand():
                 print(CLIConstants.TOO_FEW_ARGUMENTS.format(Command = command_list[0]))
 
 
+    def __onPoolDone(self, future:Future) -> None:
+        """
+        Private method: Reports the result of a call processed by the driver pool or tab pipeline.
+
+        Arguments:
+            - future: The finished Future returned by the driver pool or tab pipeline.
+        """
+
+        if future.exception() is not None:
+            print(f"\n- ERROR 04: 'Pooled call failed', {future.exception()}\n")
+        elif future.result() is not None:
+            print(f'\n- Pooled call registered as ticket {future.result().GetTicketID}. Use "details" for more details.\n')
+
+
     def __validate(self, command_list:list[str]) -> int:
         """
         Private method: Validates the command and its arguments (if existant).
@@ -292,6 +358,376 @@ class DetailsCommand():
             return False
 
 
+class BenchmarkCommand():
+    """
+    'benchmark' command class.\n
+    * Uses double undescore to specify private methods/attributes instead of the convenional single underscore.
+
+    Attributes:
+        - Description: Command description.
+        - Subcommands: A dictionary of available subcommands and their description, blank 
+        if no subcommand is available.
+        - Usage: list off command usages.
+
+    Private Attributes:
+        - __driver: A loaded Chrome webdriver object.
+    """
+
+    Description = 'Measures driver performance against a local mock portal.'
+    Subcommands = {
+        'load': 'compares page load times with and without each resource blocking rule.',
+        'ticket': 'registers open, close and escalate tickets on a mock SmartIT portal and reports step latency percentiles.'
+    }
+    Usage = ['benchmark [subcommand]']
+
+
+    def __init__(self, driver:webdriver.Chrome) -> None:
+        """
+        Initializes an instance of BenchmarkCommand class.
+
+        Arguments:
+            - driver: A loaded Chrome webdriver object.
+        """
+
+        self.__driver = driver
+
+
+    def execute(self, command_list:list[str]) -> None:
+        """
+        Executes the 'benchmark' command.\n
+        
+        Arguments:
+            - command_list: A formatted list conatining the full command run by the user.
+
+        Dependencies:
+            - :mod:`__validation()`: For command validation, see its documentation for return values.
+        """
+
+        match self.__validate(command_list):
+            case 1: #Command has a valid subcommand, executes, the subcommand.
+                match command_list[1]:
+                    case 'load':
+                        print('- Running load benchmark, this may take a while.')
+                        RunLoadReport()
+
+                    case 'ticket':
+                        #Portal URLs are redirected to the mock portal while the benchmark runs.
+                        if GetDriverPool(False) is not None or GetTabPipeline(self.__driver, False) is not None:
+                            print("- ERROR 07: 'Benchmark Unavailable', the driver pool or tab pipeline is running, restart HAF before benchmarking tickets.\n")
+                        else:
+                            print('- Running ticket benchmark, this may take a while.')
+                            with GetDriverLock(self.__driver): #Keeps the session keeper off the mock portal.
+                                RunTicketReport()
+
+            case 2: #Invalid was sent by the user, prints standard invalid subcommand message.
+                print(CLIConstants.INVALID_SUBCOMMAND.format(Command = command_list[0], Subcommand = command_list[1]))
+
+            case 3: #Too many arguments were sent by the user, prints standard too many arguments message.
+                print(CLIConstants.TOO_MANY_ARGUMENTS.format(Command = command_list[0]))
+
+            case 4: #No subcommand was sent by the user, prints standard too few arguments message.
+                print(CLIConstants.TOO_FEW_ARGUMENTS.format(Command = command_list[0]))
+
+
+    def __validate(self, command_list:list[str]) -> int:
+        """
+        Private method: Validates the command and its arguments (if existant).
+
+        Return:
+            - 1 if the command has a valid argument.
+            - 2 if the subcommand is invalid.
+            - 3 if too many arguments were given to the command.
+            - 4 if the command has no argument.
+        
+        Arguments:
+            - command_list: Formatted command list to be validated.
+        """
+
+        command_size = len(command_list)
+
+        if command_size > 1:
+            if command_size < 3:
+                if command_list[1] in self.Subcommands:
+                    return 1
+                else:
+                    return 2
+            else:
+                return 3
+        else:
+            return 4
+
+
+class TraceCommand():
+    """
+    'trace' command class.\n
+    * Uses double undescore to specify private methods/attributes instead of the convenional single underscore.
+
+    Attributes:
+        - Description: Command description.
+        - Subcommands: A dictionary of available subcommands and their description, blank 
+        if no subcommand is available.
+        - Usage: list off command usages.
+
+    Private Attributes:
+        - __driver: A loaded Chrome webdriver object.
+    """
+
+    Description = 'Records every WebDriver command issued by ticket processing.'
+    Subcommands = {
+        'start': 'starts recording commands, pooled and pipelined tickets included.',
+        'stop': 'stops recording, saves a Chrome trace (viewable in about:tracing or Perfetto) and prints command counts and times per flow.'
+    }
+    Usage = ['trace [subcommand]']
+
+
+    def __init__(self, driver:webdriver.Chrome) -> None:
+        """
+        Initializes an instance of TraceCommand class.
+
+        Arguments:
+            - driver: A loaded Chrome webdriver object.
+        """
+
+        self.__driver = driver
+
+
+    def execute(self, command_list:list[str]) -> None:
+        """
+        Executes the 'trace' command.\n
+        
+        Arguments:
+            - command_list: A formatted list conatining the full command run by the user.
+
+        Dependencies:
+            - :mod:`__validation()`: For command validation, see its documentation for return values.
+        """
+
+        match self.__validate(command_list):
+            case 1: #Command has a valid subcommand, executes, the subcommand.
+                match command_list[1]:
+                    case 'start':
+                        if StartTrace():
+                            TraceDriver(self.__driver)
+                            print('- Tracing WebDriver commands, use "trace stop" to save the trace.\n')
+                        else:
+                            print('- Tracing is already running.\n')
+
+                    case 'stop':
+                        if StopTrace() is None:
+                            print('- Tracing is not running, use "trace start" to start it.\n')
+
+            case 2: #Invalid was sent by the user, prints standard invalid subcommand message.
+                print(CLIConstants.INVALID_SUBCOMMAND.format(Command = command_list[0], Subcommand = command_list[1]))
+
+            case 3: #Too many arguments were sent by the user, prints standard too many arguments message.
+                print(CLIConstants.TOO_MANY_ARGUMENTS.format(Command = command_list[0]))
+
+            case 4: #No subcommand was sent by the user, prints standard too few arguments message.
+                print(CLIConstants.TOO_FEW_ARGUMENTS.format(Command = command_list[0]))
+
+
+    def __validate(self, command_list:list[str]) -> int:
+        """
+        Private method: Validates the command and its arguments (if existant).
+
+        Return:
+            - 1 if the command has a valid argument.
+            - 2 if the subcommand is invalid.
+            - 3 if too many arguments were given to the command.
+            - 4 if the command has no argument.
+        
+        Arguments:
+            - command_list: Formatted command list to be validated.
+        """
+
+        command_size = len(command_list)
+
+        if command_size > 1:
+            if command_size < 3:
+                if command_list[1] in self.Subcommands:
+                    return 1
+                else:
+                    return 2
+            else:
+                return 3
+        else:
+            return 4
+
+
+class MetricsCommand():
+    """
+    'metrics' command class.\n
+    * Uses double undescore to specify private methods/attributes instead of the convenional single underscore.
+
+    Attributes:
+        - Description: Command description.
+        - Subcommands: A dictionary of available subcommands and their description, blank 
+        if no subcommand is available.
+        - Usage: list off command usages.
+    """
+
+    Description = 'Records ticket, step, login and driver metrics and serves them to Prometheus.'
+    Subcommands = {
+        'start': 'starts recording metrics and serving them on localhost.',
+        'stop': 'stops the metrics endpoint and saves a snapshot of the recorded metrics.',
+        'show': 'prints the recorded metrics.'
+    }
+    Usage = ['metrics [subcommand]']
+
+
+    def execute(self, command_list:list[str]) -> None:
+        """
+        Executes the 'metrics' command.\n
+        
+        Arguments:
+            - command_list: A formatted list conatining the full command run by the user.
+
+        Dependencies:
+            - :mod:`__validation()`: For command validation, see its documentation for return values.
+        """
+
+        match self.__validate(command_list):
+            case 1: #Command has a valid subcommand, executes, the subcommand.
+                match command_list[1]:
+                    case 'start':
+                        StartMetrics()
+                        print('\n', end = '')
+
+                    case 'stop':
+                        if IsMetricsEnabled():
+                            StopMetrics()
+                            print(f'- Metrics saved to "{Paths.METRICS_SNAPSHOT_PATH}".\n')
+                        else:
+                            print('- Metrics are not being recorded, use "metrics start" to start them.\n')
+
+                    case 'show':
+                        print(RenderMetrics() or '- No metrics were recorded yet.\n')
+
+            case 2: #Invalid was sent by the user, prints standard invalid subcommand message.
+                print(CLIConstants.INVALID_SUBCOMMAND.format(Command = command_list[0], Subcommand = command_list[1]))
+
+            case 3: #Too many arguments were sent by the user, prints standard too many arguments message.
+                print(CLIConstants.TOO_MANY_ARGUMENTS.format(Command = command_list[0]))
+
+            case 4: #No subcommand was sent by the user, prints standard too few arguments message.
+                print(CLIConstants.TOO_FEW_ARGUMENTS.format(Command = command_list[0]))
+
+
+    def __validate(self, command_list:list[str]) -> int:
+        """
+        Private method: Validates the command and its arguments (if existant).
+
+        Return:
+            - 1 if the command has a valid argument.
+            - 2 if the subcommand is invalid.
+            - 3 if too many arguments were given to the command.
+            - 4 if the command has no argument.
+        
+        Arguments:
+            - command_list: Formatted command list to be validated.
+        """
+
+        command_size = len(command_list)
+
+        if command_size > 1:
+            if command_size < 3:
+                if command_list[1] in self.Subcommands:
+                    return 1
+                else:
+                    return 2
+            else:
+                return 3
+        else:
+            return 4
+
+
+class PerfCommand():
+    """
+    'perf' command class.\n
+    * Uses double undescore to specify private methods/attributes instead of the convenional single underscore.
+
+    Attributes:
+        - Description: Command description.
+        - Subcommands: A dictionary of available subcommands and their description, blank 
+        if no subcommand is available.
+        - Usage: list off command usages.
+    """
+
+    Description = 'Profiles ticket steps from inside the browser, splitting them into server, render and idle time.'
+    Subcommands = {
+        'start': 'starts profiling every named ticket step (adds a few WebDriver commands to each step).',
+        'stop': 'stops profiling and saves the step report.',
+        'report': 'ranks the profiled steps by server, render and idle time, idle steps are the waits worth cutting.'
+    }
+    Usage = ['perf [subcommand]']
+
+
+    def execute(self, command_list:list[str]) -> None:
+        """
+        Executes the 'perf' command.\n
+        
+        Arguments:
+            - command_list: A formatted list conatining the full command run by the user.
+
+        Dependencies:
+            - :mod:`__validation()`: For command validation, see its documentation for return values.
+        """
+
+        match self.__validate(command_list):
+            case 1: #Command has a valid subcommand, executes, the subcommand.
+                match command_list[1]:
+                    case 'start':
+                        StartProfiling()
+                        print('- Profiling ticket steps, use "perf report" to see them.\n')
+
+                    case 'stop':
+                        if IsProfiling():
+                            StopProfiling()
+                            print(f'- Step report saved to "{Paths.PERF_JSON_PATH}".\n')
+                        else:
+                            print('- Ticket steps are not being profiled, use "perf start" to start it.\n')
+
+                    case 'report':
+                        PrintPerfReport()
+
+            case 2: #Invalid was sent by the user, prints standard invalid subcommand message.
+                print(CLIConstants.INVALID_SUBCOMMAND.format(Command = command_list[0], Subcommand = command_list[1]))
+
+            case 3: #Too many arguments were sent by the user, prints standard too many arguments message.
+                print(CLIConstants.TOO_MANY_ARGUMENTS.format(Command = command_list[0]))
+
+            case 4: #No subcommand was sent by the user, prints standard too few arguments message.
+                print(CLIConstants.TOO_FEW_ARGUMENTS.format(Command = command_list[0]))
+
+
+    def __validate(self, command_list:list[str]) -> int:
+        """
+        Private method: Validates the command and its arguments (if existant).
+
+        Return:
+            - 1 if the command has a valid argument.
+            - 2 if the subcommand is invalid.
+            - 3 if too many arguments were given to the command.
+            - 4 if the command has no argument.
+        
+        Arguments:
+            - command_list: Formatted command list to be validated.
+        """
+
+        command_size = len(command_list)
+
+        if command_size > 1:
+            if command_size < 3:
+                if command_list[1] in self.Subcommands:
+                    return 1
+                else:
+                    return 2
+            else:
+                return 3
+        else:
+            return 4
+
+
 class HelpCommand():
     """
     'exit' command class.\n
@@ -310,6 +746,10 @@ class HelpCommand():
         'call': 'Shows "call" command information.',
         'ticket': 'Shows "ticket" command information.',
         'details': 'Shows "details" command information.',
+        'benchmark': 'Shows "benchmark" command information.',
+        'trace': 'Shows "trace" command information.',
+        'metrics': 'Shows "metrics" command information.',
+        'perf': 'Shows "perf" command information.',
         'help': 'Shows this screen.',
         'exit': 'Shows "exit" command information.'
     }
@@ -355,6 +795,26 @@ class HelpCommand():
                         Available_Subcommands = DetailsCommand.Subcommands
                         Command_Usage = DetailsCommand.Usage
 
+                    case 'benchmark':
+                        Command_Description = BenchmarkCommand.Description
+                        Available_Subcommands = BenchmarkCommand.Subcommands
+                        Command_Usage = BenchmarkCommand.Usage
+
+                    case 'trace':
+                        Command_Description = TraceCommand.Description
+                        Available_Subcommands = TraceCommand.Subcommands
+                        Command_Usage = TraceCommand.Usage
+
+                    case 'metrics':
+                        Command_Description = MetricsCommand.Description
+                        Available_Subcommands = MetricsCommand.Subcommands
+                        Command_Usage = MetricsCommand.Usage
+
+                    case 'perf':
+                        Command_Description = PerfCommand.Description
+                        Available_Subcommands = PerfCommand.Subcommands
+                        Command_Usage = PerfCommand.Usage
+
                     case 'help':
                         Command_Description = self.Description
                         Available_Subcommands = self.Subcommands
@@ -391,6 +851,10 @@ class HelpCommand():
                     call_Description = CallCommand.Description,
                     ticket_Description = TicketCommand.Description,
                     details_Description = DetailsCommand.Description,
+                    benchmark_Description = BenchmarkCommand.Description,
+                    trace_Description = TraceCommand.Description,
+                    metrics_Description = MetricsCommand.Description,
+                    perf_Description = PerfCommand.Description,
                     help_Description = self.Description,
                     exit_Description = ExitCommand.Description
                 ))
@@ -513,6 +977,13 @@ class ExitCommand():
 
         if self.__validate(command_list): #Command is valid, executes the command.
             print('- Closing HAF...')
+            ShutdownDriverPool()
+            ShutdownTabPipeline()
+            StopTrace() #Saves the trace of a tracing left running.
+            StopMetrics() #Saves the metrics snapshot, if metrics were recorded.
+            if IsProfiling():
+                StopProfiling()
+            StopSessionKeeper(self.__driver)
             self.__driver.quit()
             return True
         else: #Command is invalid (has arguments), prints the standard invalid subcommand message.
@@ -5,6 +5,7 @@ Constant values definition module.
  
 #Native Modules:
 import pathlib
+import os
 
 
 class URL:
@@ -16,19 +17,133 @@ class URL:
     ABOUT_PROJECT_URL = 'https://github.com/Iskeletu/HAF/blob/master/README.md'
 
 
+class Network:
+    """Group of DevTools network monitoring related global variables, see NetworkHandler module."""
+
+    TICKET_CREATE_PATTERN = r'/smartit/rest/.*sberequest'
+    TICKET_ID_KEYS = ('displayId', 'id')
+    TRACKED_EVENTS = ('Network.requestWillBeSent', 'Network.loadingFinished', 'Network.loadingFailed')
+    MAX_BUFFERED_EVENTS = 2000
+    PERF_LOGGING_PREFS = {'enableNetwork': True, 'enablePage': False}
+
+
+class Driver:
+    """Group of Chrome webdriver related global variables."""
+
+    MODE = 'standard'
+    VALID_MODES = [
+        'standard',
+        'background',
+        'headless'
+    ]
+
+    #Keeps Chrome rendering at full speed while minimized, covered or in a background tab.
+    BACKGROUND_ARGUMENTS = [
+        '--disable-background-timer-throttling',
+        '--disable-backgrounding-occluded-windows',
+        '--disable-renderer-backgrounding',
+        '--disable-features=CalculateNativeWinOcclusion'
+    ]
+    HEADLESS_WINDOW_SIZE = '1920,1080'
+
+    #Used to find the installed Chrome without network access.
+    CHROME_VERSION_REGISTRY_KEY = 'Software\\Google\\Chrome\\BLBeacon'
+    CHROME_BINARY_REGISTRY_KEY = 'Software\\Microsoft\\Windows\\CurrentVersion\\App Paths\\chrome.exe'
+    CHROME_BINARY_NAMES = [
+        'chrome',
+        'google-chrome',
+        'google-chrome-stable'
+    ]
+
+    #Persistent session: HAF attaches to a Chrome instance that outlives it through this port.
+    PERSISTENT_SESSION = False
+    REMOTE_DEBUGGING_PORT = 9222
+
+    #Performance profile: pages are handed over on DOMContentLoaded and never wait for blocked resources.
+    #Blocking is opt-in as it hides portal images and media from operators, benchmarks always enable it.
+    PAGE_LOAD_STRATEGY = 'eager'
+    BLOCK_RESOURCES = False
+    BLOCKED_URL_PATTERNS = [
+        '*google-analytics.com*',
+        '*googletagmanager.com*',
+        '*/analytics/*',
+        '*/avatar*'
+    ]
+    BLOCKED_RESOURCE_TYPES = [
+        'image',
+        'media'
+    ]
+    RESOURCE_TYPE_PATTERNS = {
+        'image': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.ico'],
+        'font': ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'],
+        'media': ['*.mp4', '*.webm', '*.mp3', '*.ogg']
+    }
+
+    #All of the values are in seconds.
+    IMPLICIT_WAIT = 10
+    ATTACH_PROBE_TIMEOUT = 0.5
+    ATTACH_TIMEOUT = 15
+
+
 class MicrosoftLogin:
     """Group of Microsoft login page global variables"""
 
+    LOGIN_URL_PREFIX = 'https://login.microsoftonline.com/'
+
+    #Login screens in detection order, each one identified by a visible 'Login' locator.
+    SCREENS = [
+        ('KMSI', 'KeepSignedInCheckbox'),
+        ('MFA', 'MFATitle'),
+        ('Password', 'PasswordInput'),
+        ('Email', 'EmailInput'),
+        ('Tiles', 'ProfileTile')
+    ]
+    RETRY_SCREENS = ['Tiles', 'Email', 'Password', 'KMSI'] #Screens handled again when stuck, MFA waits for the operator.
+
+    #All of the values are in seconds.
+    LOGIN_TIMEOUT = 300 #Overall deadline, includes waiting for MFA approval.
+    SCREEN_TIMEOUT = 30 #Screens in 'RETRY_SCREENS' that don't change for this long are handled again.
+
+
+class Wait:
+    """Group of condition-based wait related global variables."""
+
+    #All of the values are in seconds.
+    POLL_FREQUENCY = 0.1
+    XHR_QUIET_PERIOD = 0.3
+    ELEMENT_TIMEOUT = 10
+
+
+class Input:
+    """Group of text entry related global variables, see InputHandler module."""
+
+    METHOD_FAILURES = 3 #Failed attempts in a row before a field stops trying its remembered text method first.
+
+
+class Latency:
+    """
+    Group of self-calibrating step timeout related global variables.
+    * Step timeouts become the chosen percentile of the observed times plus a margin.
+    """
+
+    WINDOW_SIZE = 50 #Samples kept per step.
+    MIN_SAMPLES = 10 #Samples needed before replacing hand-tuned values.
+    PERCENTILE = 95
+    MARGIN = 0.25 #Fraction of the percentile added on top of it.
+
     #All of the values are in seconds.
-    ANIMATION_DELAY = 1
+    MIN_TIMEOUT = 0.5
+    MAX_FACTOR = 3 #Multiplier of the hand-tuned value.
 
 
 class Menu:
-    """Group of Fenix ITSM javascript menu related global variables."""
+    """
+    Group of Fenix ITSM javascript menu related global variables.
+    * Load delays are used as upper bounds for condition-based waits, see WaitHandler module.
+    """
 
     #All of the values are in seconds.
     GENERAL_ANIMATION_DELAY = 0.4
-    GENERAL_TAB_DELAY = 0.1
 
     USER_LOAD_DELAY = 3
 
@@ -43,6 +158,250 @@ class Menu:
     DESIGNATIONMENU_TEAMLOAD_DELAY = 2
 
 
+class MenuScripts:
+    """
+    Group of ticket creation menu keyboard navigation scripts, one for each ticket template 'Type'.\n
+    Scripts are compiled into as few keystroke batches as possible, see MenuScript module.
+
+    Steps:
+        - ('tab', count): Presses TAB 'count' times.
+        - ('space',): Presses SPACE.
+        - ('text', field): Types a field, valid fields are 'Body', 'Application' and 'Contact'.
+        - ('insert', field): Ends the batch and inserts a field in a single operation (see InputHandler module).
+        - ('animation',): Pauses for 'Menu.GENERAL_ANIMATION_DELAY' inside the batch.
+        - ('xhr', step, timeout): Ends the batch and waits for the XHR traffic to go quiet.
+        - ('settle', step, timeout): Ends the batch and waits for the Angular digest to settle.
+    """
+
+    TICKET = [
+        #Ticket description.
+        ('tab', 1), ('insert', 'Body'),
+
+        #Fills "How is this affecting you?" field.
+        ('tab', 1), ('space',), ('animation',),
+        ('tab', 4), ('space',), ('animation',),
+
+        #Fills "Degree of affectation" field.
+        ('tab', 1), ('space',), ('animation',),
+        ('tab', 1), ('space',), ('animation',),
+
+        #Fills "Application" field.
+        ('tab', 1), ('text', 'Application'),
+        ('xhr', 'TicketMenu_Application', Menu.TICKETMENU_APPLICATION_DELAY),
+
+        #Fills "Phone contact" field.
+        ('tab', 3), ('text', 'Contact'),
+        ('settle', 'TicketMenu_SendButton', Menu.TICKETMENU_SENDBUTTON_DELAY),
+
+        #Sends ticket.
+        ('tab', 3), ('animation',),
+        ('tab', 1), ('space',)
+    ]
+
+    MFA = [
+        #Ticket description.
+        ('tab', 2), ('insert', 'Body'),
+        ('settle', 'TicketMenu_SendButton', Menu.TICKETMENU_SENDBUTTON_DELAY),
+
+        #Sends ticket.
+        ('tab', 3), ('animation',),
+        ('tab', 1), ('space',)
+    ]
+
+    SCRIPTS = {
+        'ticket': TICKET,
+        'mfa': MFA
+    }
+
+
+class Pool:
+    """Group of driver pool related global variables."""
+
+    SIZE = max(1, (os.cpu_count() or 2) // 2) #Number of pooled Chrome drivers.
+    DRIVER_MODE = 'background' #Pooled drivers must not depend on window focus.
+    MAX_CONSECUTIVE_FAILURES = 2 #Failed tickets in a row before a driver is respawned.
+    PROFILE_IGNORE_PATTERNS = [
+        'Singleton*',
+        '*.lock',
+        'lockfile',
+        'Cache',
+        'Code Cache',
+        'GPUCache'
+    ]
+
+
+class Pipeline:
+    """Group of single browser tab pipeline related global variables."""
+
+    TABS = 3 #Number of tabs (and calls in flight) sharing the main driver.
+
+
+class Session:
+    """Group of portal session keepalive related global variables, see SessionKeeper module."""
+
+    KEEPALIVE = True
+    KEEPALIVE_URL = 'https://prosegur-smartit.onbmc.com/smartit/app/' #Any page that needs a logged in session.
+
+    #Cookies whose expiry is tracked, the earliest one is taken as the session expiry.
+    COOKIE_DOMAINS = [
+        'prosegur-smartit.onbmc.com',
+        'login.microsoftonline.com'
+    ]
+    COOKIE_NAME_PATTERN = r'(?i)session|sso|auth'
+
+    #All of the values are in seconds.
+    INTERVAL = 300
+    BUSY_RETRY = 15 #Retry delay while the driver is processing a ticket.
+    RENEW_MARGIN = 600 #Sessions expiring within this margin are renewed ahead of time.
+
+
+class Health:
+    """Group of driver resource governor related global variables, see HealthMonitor module."""
+
+    SAMPLE_EVERY = 5 #Tickets processed on a tab between samples.
+
+    #All of the values are in megabytes.
+    TAB_HEAP_LIMIT = 512 #JS heap used by a tab before it's replaced.
+    DRIVER_RSS_LIMIT = 3072 #Resident memory of the whole Chrome process tree before the driver is replaced.
+
+
+class Trace:
+    """Group of WebDriver command tracing related global variables, see CommandTracer module."""
+
+    MAX_EVENTS = 200000 #Commands recorded before new ones are only counted, bounds trace memory.
+    MAX_ARGUMENT_LENGTH = 120 #Characters kept from locators, URLs and scripts.
+    NO_FLOW = '(no flow)' #Flow of commands issued outside ticket processing (e.g. session keepalive).
+
+
+class Metrics:
+    """
+    Group of instrumentation and metrics endpoint related global variables, see Metrics package.
+    * Spans record a '<name>_seconds' histogram and a '<name>_total' counter, both labeled with their outcome.
+    """
+
+    ENABLED = False #Instruments only check a flag while disabled, 'metrics start' enables them at runtime.
+    HOST = '127.0.0.1' #The endpoint is never exposed outside this machine.
+    PORT = 9464
+    PREFIX = 'haf_'
+
+    #Histogram bucket upper bounds, in seconds.
+    BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+    DESCRIPTIONS = {
+        'ticket': 'Tickets processed, by template, process type and outcome.',
+        'ticket_stage': 'Ticket open, close and escalate stages (close and escalate include open).',
+        'step': 'Observed readiness time of each ticket step.',
+        'log_register': 'Ticket logs written to file.',
+        'driver_load': 'Chrome webdrivers loaded, by mode.',
+        'login': 'Microsoft logins.',
+        'login_screen': 'Microsoft login screens handled, by screen.',
+        'step_server': 'Time each ticket step spent awaiting portal responses (see StepProfiler module).',
+        'step_render': 'Browser script, layout and style time during each ticket step.',
+        'step_idle': 'Time each ticket step waited with neither portal responses nor browser work pending.',
+        'text_entry': 'Time taken to enter text into each ticket field, by field and accepted method.'
+    }
+
+
+class Profile:
+    """
+    Group of browser-side step profiling related global variables, see StepProfiler module.
+    * Each named wait is split into server time (awaiting responses), render time and idle time.
+    """
+
+    ENABLED = False #Every profiled step costs three extra WebDriver commands, 'perf start' enables it at runtime.
+    RENDER_METRICS = ('ScriptDuration', 'LayoutDuration', 'RecalcStyleDuration') #DevTools 'Performance.getMetrics' names.
+    RESOURCE_BUFFER_SIZE = 2000 #Resource timing entries kept by each page.
+    REPORT_ROWS = 10 #Steps shown in each ranking.
+
+
+class Retry:
+    """
+    Group of retry policy and circuit breaker related global variables, see RetryHandler module.
+    * Backoffs are randomized between half and all of their value, doubling on every attempt.
+    """
+
+    #Operation: (max attempts, first backoff, max backoff, deadline), time values are in seconds.
+    POLICIES = {
+        'OpenTicket': (3, 1.0, 8.0, 120.0),
+        'Navigate': (3, 0.5, 4.0, 60.0),
+        'PortalLoad': (3, 2.0, 10.0, 120.0)
+    }
+    DEFAULT_POLICY = (2, 0.5, 4.0, 30.0)
+
+    #Circuit breaker: failed attempts in a row (on any driver) before the portal is taken as down.
+    FAILURE_THRESHOLD = 5
+    OPEN_TIME = 30.0 #Seconds calls fail fast before a single trial call is let through.
+
+
+class Benchmark:
+    """Group of benchmark and mock portal related global variables, see Benchmark package."""
+
+    LOAD_ITERATIONS = 5 #Page loads measured for each blocking rule.
+
+    #Resources served by the mock portal pages.
+    MOCK_IMAGES = 8
+    MOCK_FONTS = 2
+    MOCK_AVATARS = 4
+    MOCK_RESOURCE_DELAY = 0.3 #In seconds.
+
+    #Mock SmartIT pages and requests, see MockSmartIT module (all of the values are in seconds).
+    MOCK_LATENCY = 0.2 #Server time of every page and portal request.
+    MOCK_JITTER = 0.1 #Randomly added to or taken from the latency.
+    MOCK_FIRST_TICKET_ID = 1000000
+
+    #Ticket benchmark: every iteration registers one ticket of each template.
+    TICKET_ITERATIONS = 10
+    TICKET_TEMPLATES = {
+        'open': {
+            'Type': 'ticket',
+            'Process-Type': 'open',
+            'Body': 'Benchmark ticket for {User_ID} ({Contact}) on {Hostname}.',
+            'Application': 'Benchmark'
+        },
+        'close': {
+            'Type': 'ticket',
+            'Process-Type': 'close',
+            'Title': 'Benchmark - {Hostname}',
+            'Body': 'Benchmark ticket for {User_ID} ({Contact}) on {Hostname}.',
+            'Application': 'Benchmark',
+            'Answer': ['Benchmark solution for {User_ID}.']
+        },
+        'escalate': {
+            'Type': 'ticket',
+            'Process-Type': 'escalate',
+            'Title': 'Benchmark - {Hostname}',
+            'Body': 'Benchmark ticket for {User_ID} ({Contact}) on {Hostname}.',
+            'Application': 'Benchmark',
+            'Team': 'VE.INFRA.BR.SERVICE DESK'
+        }
+    }
+    TICKET_CALL = {
+        'Required': {
+            'User_ID': 'benchmark',
+            'Contact': '0000-0000',
+            'Hostname': 'benchmark-host',
+            'Call_Type': ''
+        },
+        'Optional': {
+            'Solution': 0,
+            'Variable': 'None'
+        }
+    }
+
+
+class Journal:
+    """
+    Group of ticket step journal related global variables.
+    * Steps are only checkpointed once the portal has saved them, unsaved editor changes are lost anyway.
+    """
+
+    SENT = 'Sent' #Creation request sent, the ticket ID couldn't be read.
+    CREATED = 'Created'
+    DESIGNATED = 'Designated' #Title, status, definition, category and self designation saved.
+    CONCLUDED = 'Concluded'
+    ESCALATED = 'Escalated'
+
+
 class Paths:
     """
     Group of path related global variables.
@@ -55,7 +414,15 @@ class Paths:
     DICTIONARY_JSON_PATH = f'{__PROJECT_DIRECTORY}\\Autofill Dictionary\\dictionary.json'
     BUFFERING_GIF = f'{__PROJECT_DIRECTORY}\\Lib\\Resources\\buffering.gif'
     PERSISTENT_JSON_PATH = f'{__PROJECT_DIRECTORY}\\Log\\persistent.json'
+    LATENCY_JSON_PATH = f'{__PROJECT_DIRECTORY}\\Log\\latency.json'
+    HEALTH_LOG_PATH = f'{__PROJECT_DIRECTORY}\\Log\\health.txt'
+    JOURNAL_FOLDER_PATH = f'{__PROJECT_DIRECTORY}\\Log\\Journal\\'
+    TRACE_FOLDER_PATH = f'{__PROJECT_DIRECTORY}\\Log\\Trace\\'
+    METRICS_SNAPSHOT_PATH = f'{__PROJECT_DIRECTORY}\\Log\\metrics.prom'
+    PERF_JSON_PATH = f'{__PROJECT_DIRECTORY}\\Log\\perf.json'
     CHROME_PROFILE_PATH = f'{__PROJECT_DIRECTORY}\\Lib\\ChromeProfile\\'
+    CHROME_POOL_PATH = f'{__PROJECT_DIRECTORY}\\Lib\\ChromePool\\'
+    DRIVER_CACHE_JSON_PATH = f'{__PROJECT_DIRECTORY}\\Lib\\driver_cache.json'
     RESOURCES_FOLDER_PATH = f'{__PROJECT_DIRECTORY}\\Lib\\Resources\\'
     CONFIG_INI_PATH = f'{__PROJECT_DIRECTORY}\\Lib\\config.ini'
     CALL_JSON_PATH = f'{__PROJECT_DIRECTORY}\\Call\\call.json'
@@ -112,6 +479,10 @@ class CLIConstants:
         'call',
         'ticket',
         'details',
+        'benchmark',
+        'trace',
+        'metrics',
+        'perf',
         'help',
         'exit'
     ]
@@ -123,6 +494,10 @@ class CLIConstants:
         '\t- call: {call_Description}\n'
         '\t- ticket: {ticket_Description}\n'
         '\t- details: {details_Description}\n'
+        '\t- benchmark: {benchmark_Description}\n'
+        '\t- trace: {trace_Description}\n'
+        '\t- metrics: {metrics_Description}\n'
+        '\t- perf: {perf_Description}\n'
         '\t- help: {help_Description}\n'
         '\t- exit: {exit_Description}\n'
     )
@@ -140,6 +515,36 @@ class CLIConstants:
     TOO_MANY_ARGUMENTS = 'Too many arguments were given to "{Command}" command!\nUse "help {Command}" for more information.\n'
     TOO_FEW_ARGUMENTS = 'Missing arguments to "{Command}" command!\nUse "help {Command}" for more information.\n'
 
+    STARTUP_REPORT_TEMPLATE = (
+        '- Startup Times:\n'
+        '{Phases}'
+        '\t- Total: {Total:.2f}s'
+    )
+    STARTUP_REPORT_PHASE = '\t- {Phase}: {Time:.2f}s\n'
+
+    LOAD_REPORT_HEADER = '- Page Load Report ({Iterations} loads each, strategy "{Strategy}"):'
+    LOAD_REPORT_ROW = '\t- {Rule:<32} {Average:>7.3f}s avg | {Best:>7.3f}s best | {Gain:>+6.1f}%'
+
+    TICKET_REPORT_HEADER = '- Ticket Latency Report ({Iterations} tickets each, mock latency {Latency:.2f}s +/- {Jitter:.2f}s):'
+    TICKET_REPORT_SECTION = '\t- {Process_Type}: {Registered}/{Iterations} registered{Last_Error}'
+    TICKET_REPORT_ROW = '\t\t- {Step:<28} {P50:>7.3f}s p50 | {P95:>7.3f}s p95 | {P99:>7.3f}s p99 | {Samples} samples'
+
+    TRACE_REPORT_HEADER = '- WebDriver Command Trace ({Events} commands over {Seconds:.1f}s{Dropped}), saved to "{Path}":'
+    TRACE_REPORT_SECTION = '\t- {Flow}: {Runs} runs in {Seconds:.3f}s | {Commands} commands in {Command_Seconds:.3f}s | {Other_Seconds:.3f}s outside WebDriver'
+    TRACE_REPORT_ROW = '\t\t- {Command:<40} {Count:>6} calls | {Seconds:>8.3f}s total | {Average:>8.1f}ms avg'
+
+    PERF_REPORT_HEADER = '- Browser-Side Step Report ({Samples} profiled steps, averages per step):'
+    PERF_REPORT_SECTION = '\t- Ranked by {Ranking} time:'
+    PERF_REPORT_ROW = (
+        '\t\t- {Step:<28} {Wall:>7.3f}s wait | {Server:>7.3f}s server | {Render:>7.3f}s render | '
+        '{Idle:>7.3f}s idle | {Requests:>5.1f} requests | {Long_Tasks:>4.1f} long tasks | {Samples} samples'
+    )
+
+    POOL_HEALTH_TEMPLATE = (
+        '- Driver {Index}: {Status} | Processed: {Processed} | '
+        'Failures: {Failures} ({Consecutive_Failures} in a row) | Session: {Session} | Last Error: {Last_Error}'
+    )
+
 
 class GUIConstants:
     """
@@ -0,0 +1,432 @@
+"""Records every WebDriver command issued while tracing is on, as a Chrome trace and a per flow summary."""
+
+#Native Modules:
+import os
+import time
+import weakref
+import threading
+import contextlib
+from datetime import datetime
+from typing import Iterator
+
+#External Modules:
+from selenium import webdriver
+
+#Internal Modules:
+from HAF.FileHandler.JsonHandler import SaveJson
+from HAF.Constants import Trace, Paths, CLIConstants
+
+#Global Constants:
+FIND_COMMANDS = ('findElement', 'findElements', 'findChildElement', 'findChildElements')
+SCRIPT_COMMANDS = ('executeScript', 'executeAsyncScript', 'w3cExecuteScript', 'w3cExecuteScriptAsync')
+TEXT_COMMANDS = ('sendKeysToElement', 'sendKeysToActiveElement') #Typed text may hold credentials, only its length is kept.
+
+
+class CommandTracerClass():
+    """
+    Collects WebDriver command round trips and ticket flow spans as Chrome trace events (viewable
+    in 'about:tracing' or Perfetto), along with their counts and times for each flow.
+    * Uses double undescore to specify private methods/attributes instead of the convenional single underscore.
+
+    Private Attributes:
+        - __origin: The 'time.perf_counter()' value tracing started at, event timestamps are relative to it.
+        - __events: A list of trace event dictionaries.
+        - __dropped: Number (integer) of commands counted but not recorded after 'Trace.MAX_EVENTS'.
+        - __threads: A set of the thread IDs whose name was already recorded.
+        - __commands: A dictionary of flows and their dictionary of commands with [count, seconds] lists.
+        - __flows: A dictionary of flows and their [runs, seconds] list.
+        - __lock: A threading lock guarding every other attribute, commands come from several threads.
+    """
+
+    def __init__(self) -> None:
+        """Creates a new CommandTracerClass instance, starting its clock."""
+
+        self.__origin = time.perf_counter()
+        self.__events:list[dict] = [{
+            'name': 'process_name',
+            'ph': 'M',
+            'pid': os.getpid(),
+            'tid': 0,
+            'args': {'name': 'HAF'}
+        }]
+        self.__dropped = 0
+        self.__threads:set[int] = set()
+        self.__commands:dict[str, dict[str, list]] = {}
+        self.__flows:dict[str, list] = {}
+        self.__lock = threading.Lock()
+
+
+    @property
+    def GetElapsed(self) -> float:
+        """
+        Returns the time (in seconds) since tracing started.
+
+        Usage:
+            >>> elapsed:float = tracer.GetElapsed
+        """
+
+        return time.perf_counter() - self.__origin
+
+
+    def AddCommand(self, flow:str, command:str, args:dict, start:float, duration:float) -> None:
+        """
+        Records a WebDriver command round trip.
+
+        Arguments:
+            - flow: A string with the flow the command was issued by.
+            - command: A string with the command name.
+            - args: A dictionary with the command details shown in the trace.
+            - start: The 'time.perf_counter()' value the command was sent at.
+            - duration: Time (in seconds) the command took to be answered.
+
+        Dependencies:
+            - :mod:`__AddEvent()`: For trace event creation.
+        """
+
+        with self.__lock:
+            totals = self.__commands.setdefault(flow, {}).setdefault(command, [0, 0.0])
+            totals[0] += 1
+            totals[1] += duration
+            self.__AddEvent(command, 'webdriver', dict(args, flow = flow), start, duration)
+
+
+    def AddFlow(self, flow:str, start:float, duration:float) -> None:
+        """
+        Records a flow (i.e. a ticket process type) run.
+
+        Arguments:
+            - flow: A string with the flow name.
+            - start: The 'time.perf_counter()' value the flow started at.
+            - duration: Time (in seconds) the flow took to finish.
+
+        Dependencies:
+            - :mod:`__AddEvent()`: For trace event creation.
+        """
+
+        with self.__lock:
+            totals = self.__flows.setdefault(flow, [0, 0.0])
+            totals[0] += 1
+            totals[1] += duration
+            self.__AddEvent(flow, 'flow', {}, start, duration)
+
+
+    def AddStep(self, flow:str, step:str, args:dict, start:float, duration:float) -> None:
+        """
+        Records a profiled ticket step (see StepProfiler module), with its server, render and idle times.
+
+        Arguments:
+            - flow: A string with the flow the step belongs to.
+            - step: A string with the step name.
+            - args: A dictionary with the step times shown in the trace.
+            - start: The 'time.perf_counter()' value the step started at.
+            - duration: Time (in seconds) the step took.
+
+        Dependencies:
+            - :mod:`__AddEvent()`: For trace event creation.
+        """
+
+        with self.__lock:
+            self.__AddEvent(step, 'step', dict(args, flow = flow), start, duration)
+
+
+    def GetSummary(self) -> list[dict]:
+        """
+        Returns a list with one dictionary per flow, sorted by total time, with the following keys:
+            - Flow: The flow name.
+            - Runs: Number of flow runs, 0 for 'Trace.NO_FLOW'.
+            - Seconds: Total flow time, the command time for 'Trace.NO_FLOW'.
+            - Commands: Number of commands issued by the flow.
+            - Command_Seconds: Total round trip time of the flow commands.
+            - Other_Seconds: Flow time spent outside WebDriver round trips (waits, sleeps and Python).
+            - Rows: A list of dictionaries with 'Command', 'Count', 'Seconds' and 'Average' (in
+            milliseconds) keys, sorted by total time.
+        """
+
+        with self.__lock:
+            summary:list[dict] = []
+
+            for flow in set(self.__commands) | set(self.__flows):
+                commands = self.__commands.get(flow, {})
+                runs, seconds = self.__flows.get(flow, [0, 0.0])
+                command_seconds = sum(totals[1] for totals in commands.values())
+
+                summary.append({
+                    'Flow': flow,
+                    'Runs': runs,
+                    'Seconds': seconds if runs else command_seconds,
+                    'Commands': sum(totals[0] for totals in commands.values()),
+                    'Command_Seconds': command_seconds,
+                    'Other_Seconds': max(seconds - command_seconds, 0.0) if runs else 0.0,
+                    'Rows': sorted([
+                        {
+                            'Command': command,
+                            'Count': count,
+                            'Seconds': total,
+                            'Average': total / count * 1000
+                        } for command, (count, total) in commands.items()
+                    ], key = lambda row: -row['Seconds'])
+                })
+
+        return sorted(summary, key = lambda flow: -flow['Seconds'])
+
+
+    def Save(self, path:str) -> None:
+        """
+        Writes the recorded events to a Chrome trace event JSON file.
+
+        Arguments:
+            - path: A string with the trace file path.
+        """
+
+        with self.__lock:
+            data = {
+                'traceEvents': list(self.__events),
+                'displayTimeUnit': 'ms',
+                'otherData': {'dropped_commands': self.__dropped}
+            }
+
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+        SaveJson(data, path)
+
+
+    def GetDropped(self) -> int:
+        """Returns the number of commands counted but not recorded after 'Trace.MAX_EVENTS'."""
+
+        with self.__lock:
+            return self.__dropped
+
+
+    def GetCommandCount(self) -> int:
+        """Returns the number of commands counted, recorded or not."""
+
+        with self.__lock:
+            return sum(totals[0] for commands in self.__commands.values() for totals in commands.values())
+
+
+    def __AddEvent(self, name:str, category:str, args:dict, start:float, duration:float) -> None:
+        """
+        Private method: Appends a complete ('X') trace event on the calling thread, '__lock' should be held.
+
+        Arguments:
+            - name: A string with the event name.
+            - category: A string with the event category.
+            - args: A dictionary with the event details.
+            - start: The 'time.perf_counter()' value the event started at.
+            - duration: Time (in seconds) the event took.
+        """
+
+        if len(self.__events) >= Trace.MAX_EVENTS:
+            if category == 'webdriver':
+                self.__dropped += 1
+            return
+
+        thread = threading.current_thread()
+        if thread.ident not in self.__threads:
+            self.__threads.add(thread.ident)
+            self.__events.append({
+                'name': 'thread_name',
+                'ph': 'M',
+                'pid': os.getpid(),
+                'tid': thread.ident,
+                'args': {'name': thread.name}
+            })
+
+        self.__events.append({
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': round((start - self.__origin) * 1e6, 1),
+            'dur': round(duration * 1e6, 1),
+            'pid': os.getpid(),
+            'tid': thread.ident,
+            'args': args
+        })
+
+
+#Global Variables:
+__tracer:CommandTracerClass | None = None #Running tracer, commands are only recorded while it's set.
+__tracer_lock = threading.Lock()
+__traced:weakref.WeakSet = weakref.WeakSet() #Drivers whose 'execute' method is already wrapped.
+__flow = threading.local() #Flow of the calling thread, see TraceFlow().
+
+
+def __DescribeCommand(command:str, params:dict | None) -> tuple[str, dict]:
+    """
+    Private function: Gets the name and the details shown in the trace of a WebDriver command.\n
+    Returns a (name, details dictionary) tuple, typed text is never kept.
+
+    Arguments:
+        - command: A string with the WebDriver command name (e.g. 'findElement').
+        - params: The dictionary of command parameters.
+    """
+
+    params = params or {}
+    limit = Trace.MAX_ARGUMENT_LENGTH
+
+    if command == 'executeCdpCommand':
+        return f'{command} {params.get("cmd", "")}', {}
+    if command in FIND_COMMANDS:
+        return command, {'using': str(params.get('using', '')), 'value': str(params.get('value', ''))[:limit]}
+    if command in SCRIPT_COMMANDS:
+        return command, {'script': ' '.join(str(params.get('script', '')).split())[:limit]}
+    if command in TEXT_COMMANDS:
+        return command, {'length': len(str(params.get('text', '')))}
+    if command == 'get':
+        return command, {'url': str(params.get('url', ''))[:limit]}
+    return command, {}
+
+
+def StartTrace() -> bool:
+    """
+    Starts recording the commands of traced drivers (see :mod:`TraceDriver()`).
+
+    Return:
+        - True if tracing was started.
+        - False if it was already running.
+    """
+
+    global __tracer
+
+    with __tracer_lock:
+        if __tracer is not None:
+            return False
+        __tracer = CommandTracerClass()
+        return True
+
+
+def StopTrace(print_message_flag:bool = True) -> str | None:
+    """
+    Stops tracing, saves the trace to 'Paths.TRACE_FOLDER_PATH' and prints its summary.\n
+    Returns the trace file path string, None if tracing wasn't running.
+
+    Optional Arguments:
+        - print_message_flag: A boolean indicating whether the summary should be printed.
+    """
+
+    global __tracer
+
+    with __tracer_lock:
+        tracer, __tracer = __tracer, None
+
+    if tracer is None:
+        return None
+
+    path = f'{Paths.TRACE_FOLDER_PATH}trace-{datetime.now().strftime("%Y%m%d-%H%M%S")}.json'
+    tracer.Save(path)
+
+    if print_message_flag:
+        dropped = tracer.GetDropped()
+        print(CLIConstants.TRACE_REPORT_HEADER.format(
+            Events = tracer.GetCommandCount(),
+            Seconds = tracer.GetElapsed,
+            Dropped = f', {dropped} not recorded' if dropped else '',
+            Path = path
+        ))
+        for flow in tracer.GetSummary():
+            print(CLIConstants.TRACE_REPORT_SECTION.format(**flow))
+            for row in flow['Rows']:
+                print(CLIConstants.TRACE_REPORT_ROW.format(**row))
+        print('\n', end = '')
+
+    return path
+
+
+def IsTracing() -> bool:
+    """
+    Return:
+        - True if tracing is running.
+        - False otherwise.
+    """
+
+    return __tracer is not None
+
+
+def TraceDriver(driver:webdriver.Chrome) -> None:
+    """
+    Wraps the driver 'execute' method, which every Selenium command (including element ones) goes
+    through, so its round trips are recorded while tracing is running.\n
+    Does nothing if tracing isn't running or the driver is already wrapped, wrapped drivers only
+    check a global once per command after tracing stops.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+
+    Dependencies:
+        - :mod:`__DescribeCommand()`: For trace event details.
+    """
+
+    if __tracer is None:
+        return
+
+    with __tracer_lock:
+        if driver in __traced:
+            return
+        __traced.add(driver)
+
+    execute = driver.execute
+
+    def TracedExecute(driver_command:str, params:dict | None = None) -> dict:
+        tracer = __tracer
+        if tracer is None:
+            return execute(driver_command, params)
+
+        name, args = __DescribeCommand(driver_command, params)
+        start = time.perf_counter()
+        try:
+            return execute(driver_command, params)
+        except Exception as error:
+            args['error'] = type(error).__name__
+            raise
+        finally:
+            tracer.AddCommand(getattr(__flow, 'name', Trace.NO_FLOW), name, args, start, time.perf_counter() - start)
+
+    driver.execute = TracedExecute
+
+
+def TraceStep(step:str, start:float, duration:float, **details) -> None:
+    """
+    Records a profiled ticket step under the flow of the calling thread, does nothing if tracing
+    isn't running.
+
+    Arguments:
+        - step: A string with the step name.
+        - start: The 'time.perf_counter()' value the step started at.
+        - duration: Time (in seconds) the step took.
+
+    Optional Arguments:
+        - details: Step times (in seconds) and counts shown in the trace.
+    """
+
+    tracer = __tracer
+    if tracer is not None:
+        tracer.AddStep(getattr(__flow, 'name', Trace.NO_FLOW), str(step), details, start, duration)
+
+
+@contextlib.contextmanager
+def TraceFlow(name:str) -> Iterator[None]:
+    """
+    Attributes the commands issued by the calling thread to a flow (i.e. a ticket process type)
+    and records the flow run while tracing is running.
+
+    Arguments:
+        - name: A string with the flow name.
+    """
+
+    tracer = __tracer
+    if tracer is None:
+        yield
+        return
+
+    previous = getattr(__flow, 'name', Trace.NO_FLOW)
+    __flow.name = str(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        __flow.name = previous
+        tracer.AddFlow(str(name), start, time.perf_counter() - start)
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
@@ -0,0 +1,121 @@
+"""Runs batches of DOM operations on Fenix ITSM portal in a single WebDriver call."""
+
+#External Modules:
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
+
+#Internal Modules:
+from HAF.Constants import Wait
+
+#Global Constants:
+DOM_BATCH_SCRIPT = '''
+    var steps = arguments[0], timeout = arguments[1], poll = arguments[2], done = arguments[arguments.length - 1];
+
+    function Find(selector) {
+        var element = (selector[0] === '/' || selector[0] === '(')
+            ? document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+            : document.querySelector(selector);
+        if (!element || element.disabled) { return null; }
+        var box = element.getBoundingClientRect();
+        return (box.width > 0 || box.height > 0) ? element : null;
+    }
+
+    function SetValue(element, value) {
+        var setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), 'value');
+        if (setter && setter.set) { setter.set.call(element, value); } else { element.value = value; }
+        element.dispatchEvent(new Event('input', {bubbles: true}));
+        element.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+
+    function Run(index, deadline) {
+        if (index >= steps.length) { return done({ok: true}); }
+
+        var step = steps[index], element = Find(step[1]);
+        if (!element) {
+            if (Date.now() >= deadline) { return done({ok: false, index: index, reason: 'element not found or not interactable'}); }
+            return setTimeout(function() { Run(index, deadline); }, poll);
+        }
+
+        try {
+            switch (step[0]) {
+                case 'click':
+                    element.scrollIntoView({block: 'center'});
+                    element.click();
+                    break;
+                case 'text':
+                    element.focus();
+                    SetValue(element, step[2]);
+                    break;
+                case 'select':
+                    var option = Array.prototype.find.call(element.options || [], function(option) {
+                        return option.value === step[2] || option.text.trim() === step[2];
+                    });
+                    if (!option) { return done({ok: false, index: index, reason: 'option "' + step[2] + '" not found'}); }
+                    SetValue(element, option.value);
+                    break;
+                default:
+                    return done({ok: false, index: index, reason: 'unknown action'});
+            }
+        } catch (error) {
+            return done({ok: false, index: index, reason: String(error)});
+        }
+
+        setTimeout(function() { Run(index + 1, Date.now() + timeout); }, 0);
+    }
+
+    Run(0, Date.now() + timeout);
+'''
+
+
+class DomBatchError(Exception):
+    """
+    Raised when a step of a DOM batch fails, the steps before it were already performed.
+
+    Attributes:
+        - index: Index (integer) of the failed step in the batch, -1 if unknown.
+        - action: Action string of the failed step.
+        - xpath: Selector string (XPath or CSS) of the failed step.
+        - reason: String describing the failure.
+    """
+
+    def __init__(self, index:int, action:str, xpath:str, reason:str) -> None:
+        self.index = index
+        self.action = action
+        self.xpath = xpath
+        self.reason = reason
+        super().__init__(f'DOM batch step {index} ({action} "{xpath}") failed: {reason}.')
+
+
+def RunDomBatch(driver:webdriver.Chrome, steps:list[tuple], timeout:float = Wait.ELEMENT_TIMEOUT) -> None:
+    """
+    Resolves and performs a list of DOM operations inside the page with a single WebDriver call,
+    each step waits up to 'timeout' for its element to be displayed and enabled.\n
+    Raises a DomBatchError naming the failed step.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+        - steps: A list of steps, each one being either (selectors may be XPath or CSS, see LocatorHandler module):
+            - ('click', selector): Clicks an element.
+            - ('text', selector, text): Replaces an input value, firing the framework input events.
+            - ('select', selector, option): Selects a native select option by value or text.
+
+    Optional Arguments:
+        - timeout: Deadline (in seconds) for each step element to be found.
+    """
+
+    steps = [list(step) for step in steps]
+    driver.set_script_timeout(timeout * max(len(steps), 1) + 1)
+
+    try:
+        result = driver.execute_async_script(DOM_BATCH_SCRIPT, steps, int(timeout * 1000), int(Wait.POLL_FREQUENCY * 1000))
+    except TimeoutException:
+        raise DomBatchError(-1, 'batch', '', 'script timed out before every step was performed')
+
+    if not (result or {}).get('ok'):
+        index = int((result or {}).get('index', 0))
+        raise DomBatchError(index, steps[index][0], steps[index][1], (result or {}).get('reason', 'no result'))
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
@@ -1,121 +1,666 @@
 """Does most interactions with Selenium API."""
 
 #Native Modules:
+import os
+import re
 import time
+import shutil
+import weakref
+import threading
+import subprocess
+import urllib.request
 
 #External Modules:
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import WebDriverException, SessionNotCreatedException, TimeoutException
 
 #Internal Modules:
+from HAF.Driver.LocatorHandler import FindElement, Locator
+from HAF.Driver.RetryHandler import RunWithRetry
+from HAF.Driver.SessionKeeper import StartSessionKeeper
+from HAF.Driver.SessionHandler import ImportSession, ConfirmImport, GetImportStatus
 from HAF.FileHandler.Config import ConfigClass
-from HAF.Constants import URL, MicrosoftLogin, Paths
+from HAF.FileHandler.JsonHandler import LoadJson, SaveJson
+from HAF.Metrics.Instruments import Instrumented, Increment, IsMetricsEnabled
+from HAF.Metrics.Exporter import StartMetrics
+from HAF.Constants import URL, MicrosoftLogin, Paths, Driver, Network, Wait, Session, CLIConstants
 
+#Global Constants:
+LOGIN_SCREEN_SCRIPT = '''
+    var screens = arguments[0], previous = arguments[1], prefix = arguments[2], portal = arguments[3];
+    var done = arguments[arguments.length - 1];
 
-def __MicrosoftLogin(driver:webdriver.Chrome) -> None:
+    function Visible(selector) {
+        var element = (selector[0] === '/' || selector[0] === '(')
+            ? document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+            : document.querySelector(selector);
+        if (!element || element.disabled) { return false; }
+        var box = element.getBoundingClientRect();
+        return box.width > 0 || box.height > 0;
+    }
+
+    function Probe() {
+        if (location.href.indexOf(portal) === 0) {
+            return document.readyState === 'complete' ? 'Portal' : '';
+        }
+        if (location.href.indexOf(prefix) !== 0) {
+            return ''; //SSO redirects and blank pages, the wait goes on until they navigate away.
+        }
+        for (var i = 0; i < screens.length; i++) {
+            if (Visible(screens[i][1])) { return screens[i][0]; }
+        }
+        return '';
+    }
+
+    var observer = new MutationObserver(Check);
+    function Check() {
+        var screen = Probe();
+        if (!screen || screen === previous) { return false; }
+        observer.disconnect();
+        document.removeEventListener('readystatechange', Check);
+        done(screen);
+        return true;
+    }
+
+    if (!Check()) {
+        observer.observe(document, {childList: true, subtree: true, attributes: true});
+        document.addEventListener('readystatechange', Check);
+    }
+'''
+CHECK_IF_PRESENT_SCRIPT = '''
+    var selector = arguments[0];
+    var element = (selector[0] === '/' || selector[0] === '(')
+        ? document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+        : document.querySelector(selector);
+    if (element && !element.checked) { element.click(); }
+'''
+
+#Global Variables:
+__driver_modes:weakref.WeakKeyDictionary = weakref.WeakKeyDictionary() #Driver mode of each loaded driver.
+__blocked_patterns:weakref.WeakKeyDictionary = weakref.WeakKeyDictionary() #Blocked URL patterns of each loaded driver.
+__resolve_lock = threading.Lock() #Pooled drivers may be loaded at the same time.
+
+
+def __GetChromeVersion() -> str:
+    """
+    Private function: Gets the installed Chrome major version without any network access.
+
+    Return:
+        - The major version string (i.e. '104').
+        - An empty string if Chrome version could not be found.
+    """
+
+    #Windows stores the installed version on the registry.
+    try:
+        import winreg
+
+        for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+            try:
+                with winreg.OpenKey(hive, Driver.CHROME_VERSION_REGISTRY_KEY) as key:
+                    return str(winreg.QueryValueEx(key, 'version')[0]).split('.')[0]
+            except OSError:
+                pass
+    except ImportError:
+        pass
+
+    #Falls back to asking the Chrome binary itself.
+    for binary in Driver.CHROME_BINARY_NAMES:
+        try:
+            output = subprocess.run([binary, '--version'], capture_output = True, text = True, timeout = 5).stdout
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+
+        version = re.search(r'(\d+)\.\d+\.\d+', output)
+        if version:
+            return version.group(1)
+
+    return ''
+
+
+def __ResolveChromeDriver(force_flag:bool = False) -> str:
+    """
+    Private function: Gets the chromedriver binary path from the local driver cache, only
+    resolving it through webdriver_manager (network) when the installed Chrome major version
+    doesn't match the cached one.\n
+    Returns the chromedriver binary path string.
+
+    Optional Arguments:
+        - force_flag: A boolean indicating whether the cache should be ignored and updated.
+
+    Dependencies:
+        - :mod:`__GetChromeVersion()`: For installed Chrome version detection.
+    """
+
+    with __resolve_lock:
+        chrome_version = __GetChromeVersion()
+
+        try:
+            cache = LoadJson(Paths.DRIVER_CACHE_JSON_PATH)
+        except (OSError, ValueError):
+            cache = {}
+
+        if (
+            not force_flag and chrome_version and
+            cache.get('Chrome_Version') == chrome_version and
+            os.path.isfile(str(cache.get('Driver_Path')))
+        ):
+            return str(cache['Driver_Path'])
+
+        driver_path = ChromeDriverManager().install()
+        SaveJson({'Chrome_Version': chrome_version, 'Driver_Path': driver_path}, Paths.DRIVER_CACHE_JSON_PATH)
+        return driver_path
+
+
+def __PrintStartupReport(phases:list[tuple[str, float]]) -> None:
+    """
+    Private function: Prints how long each phase of the driver startup took.
+
+    Arguments:
+        - phases: A list of (phase name, time in seconds) tuples.
+    """
+
+    report = ''.join(
+        CLIConstants.STARTUP_REPORT_PHASE.format(Phase = phase, Time = seconds) for phase, seconds in phases
+    )
+    print(CLIConstants.STARTUP_REPORT_TEMPLATE.format(
+        Phases = report,
+        Total = sum(seconds for phase, seconds in phases)
+    ))
+
+
+def __WaitForLoginScreen(driver:webdriver.Chrome, previous:str, timeout:float) -> str:
+    """
+    Private function: Waits for the login flow to show a screen other than 'previous', the page is
+    probed once and then only again on DOM changes (see 'LOGIN_SCREEN_SCRIPT').\n
+    Returns the screen name string (see 'MicrosoftLogin.SCREENS', 'Portal' once a portal page is
+    loaded), empty if the deadline was reached or the page was unloaded while waiting (pages outside
+    the login flow and the portal, like SSO redirects, are never reported).
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+        - previous: The screen name string that was already handled.
+        - timeout: Deadline (in seconds) for the wait.
+    """
+
+    screens = [(screen, Locator('Login', name)) for screen, name in MicrosoftLogin.SCREENS]
+    driver.set_script_timeout(max(timeout, Wait.POLL_FREQUENCY))
+
+    try:
+        return str(driver.execute_async_script(
+            LOGIN_SCREEN_SCRIPT,
+            screens,
+            previous,
+            MicrosoftLogin.LOGIN_URL_PREFIX,
+            URL.PORTAL_URL.split('#')[0] #The portal may load before its route is set.
+        ) or '')
+    except WebDriverException:
+        return ''
+
+
+@Instrumented('login')
+def __MicrosoftLogin(driver:webdriver.Chrome, print_message_flag:bool = True) -> None:
     """
     Private function: Tries to log into Microsoft account, will stop 
-    for manual insertion of confirmation code if MFA is requested.
+    for manual insertion of confirmation code if MFA is requested.\n
+    Each login screen is handled as soon as it's shown, a TimeoutException is raised if the portal
+    isn't reached within 'MicrosoftLogin.LOGIN_TIMEOUT'.
 
     Arguments:
         - driver: A loaded Chrome webdriver object.
+
+    Optional Arguments:
+        - print_message_flag: A boolean indicating whether the "Logged in" message should be printed.
+
+    Dependencies:
+        - :mod:`__WaitForLoginScreen()`: For login screen detection.
     """
 
     config = ConfigClass()
-    time.sleep(MicrosoftLogin.ANIMATION_DELAY)
+    deadline = time.monotonic() + MicrosoftLogin.LOGIN_TIMEOUT
+    handled = ''
+
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutException(f'Microsoft login did not finish after {MicrosoftLogin.LOGIN_TIMEOUT} seconds (last screen: "{handled}").')
 
-    #Checks if current URL is not Microsoft login page.
-    if driver.current_url.startswith('https://login.microsoftonline.com/'):
-        driver.implicitly_wait(MicrosoftLogin.ANIMATION_DELAY)
+        wait_start = time.monotonic()
+        screen = __WaitForLoginScreen(driver, handled, min(remaining, MicrosoftLogin.SCREEN_TIMEOUT))
+        if not screen:
+            #Input screens stuck for too long (i.e. a lost key press) are handled again, the MFA
+            #screen is left alone while the operator approves it.
+            if handled in MicrosoftLogin.RETRY_SCREENS and time.monotonic() - wait_start >= MicrosoftLogin.SCREEN_TIMEOUT:
+                handled = ''
+            time.sleep(Wait.POLL_FREQUENCY)
+            continue
 
-        #Checks if Microsoft is asking for profile selection.
         try:
+            match screen:
+                case 'Portal':
+                    break
+
+                case 'Tiles': #Microsoft is asking for profile selection.
+                    FindElement(driver, 'Login', 'ProfileTile').click()
+
+                case 'Email':
+                    FindElement(driver, 'Login', 'EmailInput').send_keys(config.GetEmail + Keys.ENTER)
+
+                case 'Password':
+                    FindElement(driver, 'Login', 'PasswordInput').send_keys(config.GetPassword + Keys.ENTER)
+
+                case 'MFA':
+                    print('- MFA Confirmation Requested.')
+                    driver.execute_script(CHECK_IF_PRESENT_SCRIPT, Locator('Login', 'MFATimeoutCheckbox')) #Checks 14 day MFA timeout if available.
+
+                case 'KMSI':
+                    FindElement(driver, 'Login', 'KeepSignedInCheckbox').click()
+                    FindElement(driver, 'Login', 'ConfirmButton').click()
+        except WebDriverException:
+            continue #Screen changed while being handled, it's probed again.
+
+        handled = screen
+        Increment('login_screen_total', screen = screen)
+
+    if print_message_flag:
+        print('- Logged in.\n')
+
+
+def RenewLogin(driver:webdriver.Chrome) -> None:
+    """
+    Logs the driver in again from scratch, the driver lock should be held.\n
+    The portal and Microsoft session cookies (see 'Session.COOKIE_DOMAINS' and 'Session.COOKIE_NAME_PATTERN')
+    are dropped first, as reloading the portal on a session that is still valid doesn't extend it.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+
+    Dependencies:
+        - :mod:`__MicrosoftLogin()`: For microsoft log-in.
+    """
+
+    for cookie in driver.execute_cdp_cmd('Network.getAllCookies', {}).get('cookies', []):
+        domain = str(cookie.get('domain', ''))
+        if domain.lstrip('.') in Session.COOKIE_DOMAINS and re.search(Session.COOKIE_NAME_PATTERN, str(cookie.get('name', ''))):
+            driver.execute_cdp_cmd('Network.deleteCookies', {
+                'name': cookie['name'],
+                'domain': domain,
+                'path': cookie.get('path', '/')
+            })
+
+    RunWithRetry('PortalLoad', lambda: driver.get(URL.PORTAL_URL), driver)
+    __MicrosoftLogin(driver, False)
+
+
+def GetDriverMode(driver:webdriver.Chrome) -> str:
+    """
+    Returns the mode string (see Driver class in Constants module) the driver was loaded with.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+    """
+
+    return __driver_modes.get(driver, 'standard')
+
+
+def FocusPage(driver:webdriver.Chrome) -> None:
+    """
+    Makes the current tab behave as focused so keyboard menu navigation works regardless of the
+    window state, only 'standard' mode drivers still need the window to be restored for that.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+    """
+
+    #Focus emulation is set per tab, so it is applied on every call.
+    driver.execute_cdp_cmd('Emulation.setFocusEmulationEnabled', {'enabled': True})
+    driver.execute_script('window.focus();')
+
+    #Chrome throttles minimized windows unless the driver was loaded in background mode.
+    if GetDriverMode(driver) == 'standard':
+        try:
+            driver.maximize_window()
+        except WebDriverException:
+            pass #Webdriver gives unknown exception if driver is minimezed for some reason...
+
+
+def GetBlockedPatterns(
+    url_patterns:list[str] = Driver.BLOCKED_URL_PATTERNS,
+    resource_types:list[str] = Driver.BLOCKED_RESOURCE_TYPES
+) -> list[str]:
+    """
+    Gets the DevTools URL patterns ('*' wildcards) blocked for a set of rules, resource types are
+    translated into their file extensions (see 'Driver.RESOURCE_TYPE_PATTERNS').\n
+    Returns a list of URL pattern strings.
+
+    Optional Arguments:
+        - url_patterns: A list of URL pattern strings.
+        - resource_types: A list of resource type strings, i.e. 'image', 'font' or 'media'.
+    """
+
+    patterns = list(url_patterns)
+    for resource_type in resource_types:
+        patterns += Driver.RESOURCE_TYPE_PATTERNS.get(resource_type, [])
+    return list(dict.fromkeys(patterns))
+
+
+def ApplyResourceBlocking(driver:webdriver.Chrome, patterns:list[str] | None = None) -> None:
+    """
+    Blocks requests to the driver blocked URL patterns on its current tab, must be called for
+    every tab opened after the driver was loaded.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+
+    Optional Arguments:
+        - patterns: A list of URL pattern strings (see :mod:`GetBlockedPatterns()`) that replaces the
+        driver blocked patterns, defaults on the patterns set when the driver was loaded.
+    """
+
+    if patterns is not None:
+        __blocked_patterns[driver] = list(patterns)
+
+    patterns = __blocked_patterns.get(driver, [])
+    if patterns:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+
+
+def __GetChromeArguments(profile_path:str, mode:str) -> list[str]:
+    """
+    Private function: Gets the Chrome command line arguments for a profile and driver mode.\n
+    Returns a list of argument strings.
+
+    Arguments:
+        - profile_path: A string with the Chrome user data directory.
+        - mode: A string with the driver mode, see :mod:`LoadDriver()`.
+    """
+
+    arguments = [
+        f'--user-data-dir={profile_path}',
+        '--disable-extensions'
+    ]
+
+    match mode:
+        case 'standard':
+            arguments.append('--start-maximized')
+
+        case 'background':
+            arguments.append('--start-maximized')
+            arguments.extend(Driver.BACKGROUND_ARGUMENTS)
+
+        case 'headless':
+            arguments.append('--headless=new')
+            arguments.append(f'--window-size={Driver.HEADLESS_WINDOW_SIZE}')
+            arguments.extend(Driver.BACKGROUND_ARGUMENTS)
+
+    return arguments
+
+
+def __GetChromeBinary() -> str:
+    """
+    Private function: Gets the installed Chrome binary path.
+
+    Return:
+        - The Chrome binary path string.
+        - An empty string if Chrome could not be found.
+    """
+
+    #Windows registers the Chrome binary on the registry.
+    try:
+        import winreg
+
+        for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
             try:
-                driver.find_element(By.XPATH, '//*[@id="tilesHolder"]/div[1]/div/div[1]/div/div[2]/div').click()
-            except NoSuchElementException:
+                with winreg.OpenKey(hive, Driver.CHROME_BINARY_REGISTRY_KEY) as key:
+                    return str(winreg.QueryValue(key, None))
+            except OSError:
                 pass
+    except ImportError:
+        pass
 
-            if driver.current_url.endswith('/login') == False: #TODO: confirm if this is always true.
-                driver.find_element(By.XPATH, '//*[@id="i0118"]').send_keys(config.GetPassword + Keys.ENTER)
-        except NoSuchElementException:
-            driver.find_element(By.XPATH, '//*[@id="i0116"]').send_keys(config.GetEmail + Keys.ENTER)
-            time.sleep(MicrosoftLogin.ANIMATION_DELAY)
-            driver.find_element(By.XPATH, '//*[@id="i0118"]').send_keys(config.GetPassword + Keys.ENTER)
-        time.sleep(MicrosoftLogin.ANIMATION_DELAY)
+    for binary in Driver.CHROME_BINARY_NAMES:
+        binary_path = shutil.which(binary)
+        if binary_path:
+            return binary_path
 
-        #Checks if MFA is being requested.
-        if driver.current_url.endswith('/login'):
-            try:
-                driver.find_element(By.XPATH, '//*[@id="KmsiCheckboxField"]').click()
-                driver.find_element(By.XPATH, '//*[@id="idSIButton9"]').click()
-                MFA_flag = False
-            except NoSuchElementException:
-                print('- MFA Confirmation Requested.')
+    return ''
+
+
+def __IsDebuggerRunning(port:int) -> bool:
+    """
+    Private function: Checks whether a Chrome instance is listening on a remote debugging port.
 
-                try: #Checks 14 day MFA timeout if available.
-                    driver.find_element(By.XPATH, '//*[@id="idChkBx_SAOTCAS_TD"]').click()
-                except NoSuchElementException:
-                    pass
+    Return:
+        - True if a Chrome instance answered.
+        - False otherwise.
 
-                MFA_flag = True
+    Arguments:
+        - port: The remote debugging port (integer).
+    """
 
-            while MFA_flag:
-                if driver.current_url == 'https://login.microsoftonline.com/common/SAS/ProcessAuth':
-                    driver.find_element(By.XPATH, '//*[@id="KmsiCheckboxField"]').click()
-                    driver.find_element(By.XPATH, '//*[@id="idSIButton9"]').click()
+    try:
+        with urllib.request.urlopen(f'http://127.0.0.1:{port}/json/version', timeout = Driver.ATTACH_PROBE_TIMEOUT):
+            return True
+    except (OSError, ValueError):
+        return False
 
-                    MFA_flag = False
 
-                time.sleep(MicrosoftLogin.ANIMATION_DELAY)
+def __StartPersistentChrome(profile_path:str, mode:str, port:int) -> None:
+    """
+    Private function: Starts a Chrome instance detached from this process with remote debugging
+    enabled, so it (and its logged in session) outlives HAF.
 
-        driver.implicitly_wait(10)
+    Arguments:
+        - profile_path: A string with the Chrome user data directory.
+        - mode: A string with the driver mode, see :mod:`LoadDriver()`.
+        - port: The remote debugging port (integer).
 
-    print('- Logged in.\n')
+    Dependencies:
+        - :mod:`__GetChromeBinary()`: For Chrome binary path.
+        - :mod:`__GetChromeArguments()`: For Chrome command line arguments.
+        - :mod:`__IsDebuggerRunning()`: For Chrome startup detection.
+    """
+
+    binary_path = __GetChromeBinary()
+    if not binary_path:
+        raise FileNotFoundError('Chrome binary could not be found for persistent session.')
+
+    command = [binary_path, f'--remote-debugging-port={port}'] + __GetChromeArguments(profile_path, mode) + [URL.PORTAL_URL]
+
+    if os.name == 'nt':
+        subprocess.Popen(
+            command,
+            creationflags = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
+            close_fds = True
+        )
+    else:
+        subprocess.Popen(command, start_new_session = True, close_fds = True)
 
+    deadline = time.monotonic() + Driver.ATTACH_TIMEOUT
+    while not __IsDebuggerRunning(port):
+        if time.monotonic() > deadline:
+            raise TimeoutError(f'Persistent Chrome did not open remote debugging port {port}.')
+        time.sleep(Wait.POLL_FREQUENCY)
 
-def LoadDriver() -> webdriver.Chrome:
+
+@Instrumented('driver_load')
+def LoadDriver(
+    profile_path:str = Paths.CHROME_PROFILE_PATH,
+    mode:str = Driver.MODE,
+    persistent_flag:bool = Driver.PERSISTENT_SESSION,
+    print_message_flag:bool = True,
+    block_flag:bool = Driver.BLOCK_RESOURCES,
+    keepalive_flag:bool = Session.KEEPALIVE,
+    session:dict | None = None
+) -> webdriver.Chrome:
     """
     Configures and loads a Chrome webdriver instance.\n
     Returns the Chrome webdriver instace when the Fenix page is loaded.
 
+    Optional Arguments:
+        - profile_path: A string with the Chrome user data directory, every running driver
+        needs its own directory.
+        - mode: A string with the driver mode:
+            - 'standard': Visible window, menu navigation restores it when minimized.
+            - 'background': Visible window that is never throttled, safe to be minimized or covered.
+            - 'headless': No window at all, for unattended processing.
+        - persistent_flag: A boolean indicating whether the driver should attach to a Chrome instance
+        that outlives HAF (through 'Driver.REMOTE_DEBUGGING_PORT'), starting it if none is running.
+        Restarting HAF then reuses the running browser and its logged in session.
+        - print_message_flag: A boolean indicating whether CLI messages should be printed.
+        - block_flag: A boolean indicating whether the resources in 'Driver.BLOCKED_URL_PATTERNS' and
+        'Driver.BLOCKED_RESOURCE_TYPES' should be blocked, pages are never waited for them.
+        - keepalive_flag: A boolean indicating whether the portal session should be kept alive and
+        renewed in the background, see SessionKeeper module.
+        - session: A session dictionary exported from a logged in driver (see :mod:`ExportSession()`),
+        imported before the portal is first loaded so no new login is needed (ignored when attached
+        to a persistent Chrome instance).
+
     Dependencies:
-        - :mod:`MicrosoftLogin()`: For microsoft log-in if needed.
+        - :mod:`__ResolveChromeDriver()`: For cached chromedriver resolution.
+        - :mod:`ApplyResourceBlocking()`: For resource blocking.
+        - :mod:`ImportSession()`: For shared session import.
+        - :mod:`RunWithRetry()`: For portal loading with the 'PortalLoad' retry policy.
+        - :mod:`__StartPersistentChrome()`: For persistent Chrome startup.
+        - :mod:`__MicrosoftLogin()`: For microsoft log-in if needed.
+        - :mod:`StartSessionKeeper()`: For background session keepalive.
+        - :mod:`__PrintStartupReport()`: For startup timing report.
+        - :mod:`StartMetrics()`: For the metrics endpoint, when metrics are enabled.
     """
 
+    phases:list[tuple[str, float]] = []
+    phase_start = time.perf_counter()
+
+    #Metrics enabled from startup ('Metrics.ENABLED') are served as soon as the first driver loads.
+    if IsMetricsEnabled():
+        StartMetrics(print_message_flag)
+
+    if mode not in Driver.VALID_MODES:
+        raise ValueError(f'Invalid driver mode "{mode}", valid modes are: {Driver.VALID_MODES}.')
+
+    driver_path = __ResolveChromeDriver()
+    phases.append(('Driver Resolution', time.perf_counter() - phase_start)); phase_start = time.perf_counter()
+
     #Loads browser profile and sets driver preferences.
     options = Options()
-    options.add_argument('start-maximized')
-    options.add_argument(f'user-data-dir={Paths.CHROME_PROFILE_PATH}')
-    options.add_argument('--disable-extensions')
-    options.add_experimental_option('excludeSwitches', ['enable-logging'])
-    driver = webdriver.Chrome(service = Service(ChromeDriverManager().install()), options = options)
-    driver.implicitly_wait(10)
-
-    #Loads Fenix ISTM portal.
-    driver.switch_to.new_window()
-    driver.get(URL.PORTAL_URL)
-
-    #Closes default tabs.
-    handle = driver.window_handles
-    if len(handle) == 3:
-        driver.switch_to.window(handle[0]); driver.close()
-        driver.switch_to.window(handle[1]); driver.close()
-        driver.switch_to.window(handle[2])
+    options.page_load_strategy = Driver.PAGE_LOAD_STRATEGY
+    attached_flag = False
+
+    if persistent_flag:
+        #Chrome arguments are set when the persistent instance is started.
+        attached_flag = __IsDebuggerRunning(Driver.REMOTE_DEBUGGING_PORT)
+        if not attached_flag:
+            __StartPersistentChrome(profile_path, mode, Driver.REMOTE_DEBUGGING_PORT)
+        options.debugger_address = f'127.0.0.1:{Driver.REMOTE_DEBUGGING_PORT}'
     else:
-        driver.switch_to.window(handle[0]); driver.close()
-        driver.switch_to.window(handle[1])
+        for argument in __GetChromeArguments(profile_path, mode):
+            options.add_argument(argument)
+        options.add_experimental_option('excludeSwitches', ['enable-logging'])
+
+    #Enables network events in the performance log, see NetworkHandler module.
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    options.add_experimental_option('perfLoggingPrefs', Network.PERF_LOGGING_PREFS)
+
+    #A Chrome update between launches makes the cached driver outdated, it is resolved again once.
+    try:
+        driver = webdriver.Chrome(service = Service(driver_path), options = options)
+    except SessionNotCreatedException:
+        driver = webdriver.Chrome(service = Service(__ResolveChromeDriver(True)), options = options)
 
-    print('- Driver Loaded.')
+    driver.implicitly_wait(Driver.IMPLICIT_WAIT)
+    __driver_modes[driver] = mode
+    __blocked_patterns[driver] = GetBlockedPatterns() if block_flag else []
+    phases.append(('Chrome Attach' if attached_flag else 'Chrome Launch', time.perf_counter() - phase_start))
+    phase_start = time.perf_counter()
+
+    if attached_flag:
+        #Reuses the portal tab of the running session if there is one.
+        for handle in driver.window_handles:
+            driver.switch_to.window(handle)
+            if driver.current_url.startswith(URL.PORTAL_URL):
+                ApplyResourceBlocking(driver)
+                break
+        else:
+            ApplyResourceBlocking(driver)
+            RunWithRetry('PortalLoad', lambda: driver.get(URL.PORTAL_URL), driver)
+
+        phases.append(('Portal Load', time.perf_counter() - phase_start)); phase_start = time.perf_counter()
+    else:
+        #Loads Fenix ISTM portal, with the shared session if there is one.
+        driver.switch_to.new_window()
+        ApplyResourceBlocking(driver)
+        if session:
+            ImportSession(driver, session)
+        RunWithRetry('PortalLoad', lambda: driver.get(URL.PORTAL_URL), driver)
+
+        if session:
+            ConfirmImport(driver, __WaitForLoginScreen(driver, '', MicrosoftLogin.SCREEN_TIMEOUT) == 'Portal')
+            if print_message_flag and GetImportStatus(driver) == 'rejected':
+                print('- Shared session was rejected, logging in.')
+        phases.append(('Portal Load', time.perf_counter() - phase_start)); phase_start = time.perf_counter()
+
+        #Closes default tabs.
+        handle = driver.window_handles
+        if len(handle) == 3:
+            driver.switch_to.window(handle[0]); driver.close()
+            driver.switch_to.window(handle[1]); driver.close()
+            driver.switch_to.window(handle[2])
+        else:
+            driver.switch_to.window(handle[0]); driver.close()
+            driver.switch_to.window(handle[1])
+
+        phases.append(('Tab Cleanup', time.perf_counter() - phase_start)); phase_start = time.perf_counter()
+
+    if print_message_flag:
+        print('- Driver Attached.' if attached_flag else '- Driver Loaded.')
 
     #Checks if Microsoft log-in is begin requested.
-    __MicrosoftLogin(driver)
+    __MicrosoftLogin(driver, print_message_flag)
+    phases.append(('Login', time.perf_counter() - phase_start))
+
+    if keepalive_flag:
+        StartSessionKeeper(driver, RenewLogin)
+
+    if print_message_flag:
+        __PrintStartupReport(phases)
+        print('- Use "help" for command information.')
+    return driver
+
+
+def LoadBareDriver(
+    mode:str = 'headless',
+    page_load_strategy:str = Driver.PAGE_LOAD_STRATEGY,
+    patterns:list[str] | None = None
+) -> webdriver.Chrome:
+    """
+    Loads a Chrome webdriver instance with a temporary profile and no portal or log-in, for
+    benchmarks against local mock pages.\n
+    Returns the Chrome webdriver instance.
+
+    Optional Arguments:
+        - mode: A string with the driver mode, see :mod:`LoadDriver()`.
+        - page_load_strategy: 'normal', 'eager' or 'none', see Selenium documentation.
+        - patterns: A list of blocked URL pattern strings, see :mod:`GetBlockedPatterns()`.
+
+    Dependencies:
+        - :mod:`__ResolveChromeDriver()`: For cached chromedriver resolution.
+        - :mod:`ApplyResourceBlocking()`: For resource blocking.
+    """
+
+    options = Options()
+    options.page_load_strategy = page_load_strategy
+    for argument in __GetChromeArguments('', mode):
+        if not argument.startswith('--user-data-dir'):
+            options.add_argument(argument)
+    options.add_experimental_option('excludeSwitches', ['enable-logging'])
 
-    print('- Use "help" for command information.')
+    driver = webdriver.Chrome(service = Service(__ResolveChromeDriver()), options = options)
+    __driver_modes[driver] = mode
+    ApplyResourceBlocking(driver, patterns or [])
     return driver
 
 
@@ -0,0 +1,221 @@
+"""Coordinates threads sharing a single Chrome webdriver."""
+
+#Native Modules:
+import time
+import weakref
+import threading
+
+#External Modules:
+from selenium import webdriver
+
+
+class DriverLockClass():
+    """
+    Reentrant lock owned by a single Chrome webdriver, every thread using the driver should hold it.\n
+    Threads may be bound to a browser tab, the tab is switched to whenever they (re)acquire the lock.
+    * Uses double undescore to specify private methods/attributes instead of the convenional single underscore.
+
+    Private Attributes:
+        - __driver: A weak reference to the loaded Chrome webdriver object.
+        - __lock: The underlying threading reentrant lock.
+        - __owner: Identifier (integer) of the thread holding the lock, None if released.
+        - __depth: Number (integer) of times the owner thread acquired the lock.
+        - __yielded: Number (integer) of threads that handed the lock over with Yield() and wait to get it back.
+        - __home_handle: Window handle string used by threads not bound to a tab.
+        - __active_handle: Window handle string the driver is currently switched to.
+        - __thread_data: Thread-local storage with the tab handle bound to each thread.
+    """
+
+    def __init__(self, driver:webdriver.Chrome) -> None:
+        """
+        Creates a new DriverLockClass instance.
+
+        Arguments:
+            - driver: A loaded Chrome webdriver object, its current window becomes the home tab.
+        """
+
+        self.__driver = weakref.ref(driver)
+        self.__lock = threading.RLock()
+        self.__owner:int | None = None
+        self.__depth = 0
+        self.__yielded = 0
+        self.__home_handle = str(driver.current_window_handle)
+        self.__active_handle = self.__home_handle
+        self.__thread_data = threading.local()
+
+
+    @property
+    def IsOwned(self) -> bool:
+        """
+        Returns:
+            - True if the calling thread holds this lock.
+            - False otherwise.
+
+        Usage:
+            >>> owned:bool = lock.IsOwned
+        """
+
+        return self.__owner == threading.get_ident()
+
+
+    @property
+    def IsYielded(self) -> bool:
+        """
+        Returns:
+            - True if another thread handed the driver over in the middle of its work (see :mod:`Yield()`).
+            - False otherwise.
+
+        Usage:
+            >>> yielded:bool = lock.IsYielded
+        """
+
+        return self.__yielded > 0
+
+
+    @property
+    def GetActiveHandle(self) -> str:
+        """
+        Returns the window handle string the driver was last switched to by this lock.
+
+        Usage:
+            >>> handle:str = lock.GetActiveHandle
+        """
+
+        return self.__active_handle
+
+
+    @property
+    def GetBoundHandle(self) -> str:
+        """
+        Returns the window handle string the calling thread is bound to, the home tab if unbound.
+
+        Usage:
+            >>> handle:str = lock.GetBoundHandle
+        """
+
+        return getattr(self.__thread_data, 'handle', None) or self.__home_handle
+
+
+    def BindTab(self, handle:str | None) -> None:
+        """
+        Binds the calling thread to a browser tab, use None to go back to the home tab.
+
+        Arguments:
+            - handle: A window handle string.
+        """
+
+        self.__thread_data.handle = handle
+
+
+    def SwitchTab(self, handle:str) -> None:
+        """
+        Switches the driver to another tab and makes it the calling thread tab (or the home tab for
+        unbound threads), the lock must be held by the calling thread.
+
+        Arguments:
+            - handle: A window handle string.
+        """
+
+        if not self.IsOwned:
+            raise RuntimeError('Driver lock must be held to switch tabs.')
+
+        driver = self.__driver()
+        if driver is not None and handle != self.__active_handle:
+            driver.switch_to.window(handle)
+            self.__active_handle = handle
+
+        if getattr(self.__thread_data, 'handle', None):
+            self.__thread_data.handle = handle
+        else:
+            self.__home_handle = handle
+
+
+    def Acquire(self, blocking:bool = True) -> bool:
+        """
+        Acquires the lock, switching the driver to the calling thread tab on the outermost acquire.\n
+        Returns True if the lock was acquired, False otherwise.
+
+        Optional Arguments:
+            - blocking: A boolean indicating whether the call should wait for the lock.
+        """
+
+        if not self.__lock.acquire(blocking):
+            return False
+
+        self.__owner = threading.get_ident()
+        self.__depth += 1
+
+        if self.__depth == 1:
+            handle = getattr(self.__thread_data, 'handle', None) or self.__home_handle
+            driver = self.__driver()
+
+            if driver is not None and handle != self.__active_handle:
+                driver.switch_to.window(handle)
+                self.__active_handle = handle
+
+        return True
+
+
+    def Release(self) -> None:
+        """Releases the lock once."""
+
+        self.__depth -= 1
+        if self.__depth == 0:
+            self.__owner = None
+        self.__lock.release()
+
+
+    def Yield(self, seconds:float) -> None:
+        """
+        Fully releases the lock for 'seconds' so other threads can use the driver, then reacquires
+        it with the same depth (and tab).
+
+        Arguments:
+            - seconds: Time (in seconds) the driver is handed over for.
+        """
+
+        depth = self.__depth
+        if depth:
+            self.__yielded += 1
+        for i in range(depth):
+            self.Release()
+
+        time.sleep(seconds)
+
+        for i in range(depth):
+            self.Acquire()
+        if depth:
+            self.__yielded -= 1
+
+
+    def __enter__(self) -> 'DriverLockClass':
+        self.Acquire()
+        return self
+
+
+    def __exit__(self, *exception_info) -> None:
+        self.Release()
+
+
+#Global lock registry, entries are dropped with their drivers.
+__locks:weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+__locks_lock = threading.Lock()
+
+
+def GetDriverLock(driver:webdriver.Chrome) -> DriverLockClass:
+    """
+    Returns the DriverLockClass instance of a driver, creating it on the first call.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+    """
+
+    with __locks_lock:
+        if driver not in __locks:
+            __locks[driver] = DriverLockClass(driver)
+        return __locks[driver]
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
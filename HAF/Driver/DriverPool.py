@@ -0,0 +1,342 @@
+"""Runs several Chrome webdrivers behind a ticket work queue for parallel call registering."""
+
+#Native Modules:
+import queue
+import weakref
+import shutil
+import threading
+from concurrent.futures import Future
+
+#External Modules:
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+#Internal Modules:
+from HAF.Driver.DriverLock import GetDriverLock
+from HAF.Driver.DriverHandler import LoadDriver
+from HAF.Driver.SessionHandler import ExportSession, GetImportStatus
+from HAF.Driver.RetryHandler import GetCircuitBreaker, CircuitOpenError
+from HAF.Driver.SessionKeeper import StopSessionKeeper
+from HAF.Driver.HealthMonitor import SetReplaceable, PopRecycleReason
+from HAF.FileHandler.Logger import LogClass
+from HAF.Ticket.TicketHandler import TicketProcessor
+from HAF.Constants import Paths, Pool
+
+
+class DriverPoolClass():
+    """
+    Pool of Chrome webdrivers, each with its own cloned browser profile, that takes calls from
+    a thread-safe job queue and processes them on whichever driver is idle.
+    * Uses double undescore to specify private methods/attributes instead of the convenional single underscore.
+
+    Private Attributes:
+        - __jobs: A queue of (Future, call data dictionary) tuples, None tells a worker to stop.
+        - __health: A list with one health dictionary per driver, see :mod:`GetHealth()`.
+        - __lock: A threading lock guarding '__health'.
+        - __workers: A list with one worker thread per driver.
+        - __primary: A weak reference to the logged in driver whose session is shared with pooled
+        drivers, None if each driver logs in on its own.
+    """
+
+    def __init__(self, size:int = Pool.SIZE, primary:webdriver.Chrome | None = None) -> None:
+        """
+        Creates a new DriverPoolClass instance and starts its worker threads, drivers are
+        loaded by each worker in parallel before their first job.
+
+        Optional Arguments:
+            - size: Number (integer) of Chrome drivers in the pool.
+            - primary: A logged in Chrome webdriver object, its session is exported to every pooled
+            driver so scaling out doesn't need new logins (see SessionHandler module).
+        """
+
+        self.__primary = weakref.ref(primary) if primary is not None else None
+
+        self.__jobs:queue.Queue[tuple[Future, dict] | None] = queue.Queue()
+        self.__lock = threading.Lock()
+        self.__health = [
+            {
+                'Status': 'Starting',
+                'Processed': 0,
+                'Failures': 0,
+                'Consecutive_Failures': 0,
+                'Session': 'none',
+                'Last_Error': ''
+            } for i in range(max(1, int(size)))
+        ]
+
+        self.__workers = [
+            threading.Thread(target = self.__Worker, args = (index,), name = f'HAF-Driver-{index}', daemon = True)
+            for index in range(len(self.__health))
+        ]
+        for worker in self.__workers:
+            worker.start()
+
+
+    @property
+    def GetSize(self) -> int:
+        """
+        Returns the number of drivers in this pool.
+
+        Usage:
+            >>> size:int = pool.GetSize
+        """
+
+        return len(self.__health)
+
+
+    @property
+    def GetPending(self) -> int:
+        """
+        Returns the approximate number of calls waiting for an idle driver.
+
+        Usage:
+            >>> pending:int = pool.GetPending
+        """
+
+        return self.__jobs.qsize()
+
+
+    def GetHealth(self) -> list[dict]:
+        """
+        Returns a copy of the health dictionary of each driver, with the following keys:
+            - Status: 'Starting', 'Idle', 'Busy', 'Waiting', 'Recycling', 'Respawning' or 'Stopped'.
+            - Processed: Number of calls registered by the driver.
+            - Failures: Number of calls that failed on the driver.
+            - Consecutive_Failures: Failures since the last successful call.
+            - Session: Import status of the shared session, see :mod:`GetImportStatus()`.
+            - Last_Error: String of the last exception raised on the driver.
+        """
+
+        with self.__lock:
+            return [dict(health) for health in self.__health]
+
+
+    def Submit(self, call_data:dict) -> Future:
+        """
+        Queues a call to be registered by the next idle driver.\n
+        Returns a Future that resolves to the LogClass object returned by :mod:`TicketProcessor()`.
+
+        Arguments:
+            - call_data: Dictionary with call data.
+        """
+
+        future = Future()
+        self.__jobs.put((future, dict(call_data)))
+        return future
+
+
+    def Shutdown(self, wait:bool = True) -> None:
+        """
+        Stops every worker once the queued calls are processed and quits their drivers.
+
+        Optional Arguments:
+            - wait: A boolean indicating whether this call should block until every worker stops.
+        """
+
+        for i in self.__workers:
+            self.__jobs.put(None)
+
+        if wait:
+            for worker in self.__workers:
+                worker.join()
+
+
+    def __UpdateHealth(self, index:int, **changes) -> None:
+        """
+        Private method: Updates a driver health dictionary.
+
+        Arguments:
+            - index: Index (integer) of the driver in the pool.
+            - changes: Keys and values to be updated.
+        """
+
+        with self.__lock:
+            self.__health[index].update(changes)
+
+
+    def __CloneProfile(self, index:int) -> str:
+        """
+        Private method: Copies the main Chrome profile into the driver own profile directory, so
+        its session is inherited without sharing the profile lock.\n
+        Returns the cloned profile directory path.
+
+        Arguments:
+            - index: Index (integer) of the driver in the pool.
+        """
+
+        profile_path = f'{Paths.CHROME_POOL_PATH}{index}\\'
+
+        try:
+            shutil.copytree(
+                Paths.CHROME_PROFILE_PATH,
+                profile_path,
+                ignore = shutil.ignore_patterns(*Pool.PROFILE_IGNORE_PATTERNS),
+                dirs_exist_ok = True
+            )
+        except shutil.Error:
+            pass #Files locked by the running main driver are skipped, everything else is copied.
+
+        return profile_path
+
+
+    def __ExportPrimarySession(self) -> dict | None:
+        """
+        Private method: Exports the primary driver session, waiting for the primary driver to be idle.\n
+        Returns the session dictionary, None if there is no primary driver or it couldn't be exported.
+
+        Dependencies:
+            - :mod:`ExportSession()`: For session export.
+        """
+
+        primary = self.__primary() if self.__primary is not None else None
+        if primary is None:
+            return None
+
+        try:
+            with GetDriverLock(primary):
+                return ExportSession(primary)
+        except WebDriverException:
+            return None
+
+
+    def __Worker(self, index:int) -> None:
+        """
+        Private method: Worker thread loop, processes queued calls on its own driver and respawns
+        it after 'Pool.MAX_CONSECUTIVE_FAILURES' failed calls in a row.
+
+        Arguments:
+            - index: Index (integer) of the driver in the pool.
+
+        Dependencies:
+            - :mod:`__CloneProfile()`: For driver profile creation.
+            - :mod:`__ExportPrimarySession()`: For shared session export.
+            - :mod:`__UpdateHealth()`: For health tracking.
+        """
+
+        driver:webdriver.Chrome | None = None
+
+        while True:
+            if driver is None:
+                try:
+                    driver = LoadDriver(self.__CloneProfile(index), Pool.DRIVER_MODE, False, False, session = self.__ExportPrimarySession())
+                    SetReplaceable(driver)
+                    self.__UpdateHealth(index, Status = 'Idle', Session = GetImportStatus(driver))
+                except Exception as error:
+                    #Profile copies, persistent attaches and an open circuit fail with other exceptions,
+                    #the worker keeps running so its queued calls still get an answer.
+                    self.__UpdateHealth(index, Status = 'Respawning', Last_Error = f'{type(error).__name__}: {error}')
+
+            job = self.__jobs.get()
+            if job is None:
+                break
+
+            #Queued calls wait while the portal is down instead of failing one after another, the
+            #first one released runs the trial call while the others keep waiting for its outcome.
+            if GetCircuitBreaker().GetState != 'closed':
+                self.__UpdateHealth(index, Status = 'Waiting')
+                GetCircuitBreaker().WaitUntilClosed(claim_flag = True)
+
+            future, call_data = job
+            if not future.set_running_or_notify_cancel():
+                GetCircuitBreaker().ReleaseClaim()
+                continue
+
+            try:
+                if driver is None:
+                    raise WebDriverException('Driver could not be loaded.')
+
+                self.__UpdateHealth(index, Status = 'Busy')
+                log:LogClass | None = TicketProcessor(driver, call_data)
+            except Exception as error:
+                GetCircuitBreaker().ReleaseClaim()
+                future.set_exception(error)
+
+                #A portal outage isn't the driver fault, it doesn't count toward a respawn.
+                with self.__lock:
+                    health = self.__health[index]
+                    health['Failures'] += 1
+                    if not isinstance(error, CircuitOpenError):
+                        health['Consecutive_Failures'] += 1
+                    health['Last_Error'] = str(error)
+                    respawn = health['Consecutive_Failures'] >= Pool.MAX_CONSECUTIVE_FAILURES
+
+                #Replaces unhealthy drivers, the new one is loaded before the next job.
+                if respawn or driver is None:
+                    self.__UpdateHealth(index, Status = 'Respawning', Consecutive_Failures = 0)
+                    try:
+                        if driver is not None:
+                            StopSessionKeeper(driver)
+                            driver.quit()
+                    except WebDriverException:
+                        pass
+                    driver = None
+                else:
+                    self.__UpdateHealth(index, Status = 'Idle')
+            else:
+                GetCircuitBreaker().ReleaseClaim()
+                future.set_result(log)
+
+                with self.__lock:
+                    health = self.__health[index]
+                    health['Processed'] += 1
+                    health['Consecutive_Failures'] = 0
+                    health['Status'] = 'Idle'
+
+                #Drivers that grew too large are replaced before the next job, with the shared session.
+                if PopRecycleReason(driver):
+                    self.__UpdateHealth(index, Status = 'Recycling')
+                    try:
+                        StopSessionKeeper(driver)
+                        driver.quit()
+                    except WebDriverException:
+                        pass
+                    driver = None
+
+        if driver is not None:
+            try:
+                StopSessionKeeper(driver)
+                driver.quit()
+            except WebDriverException:
+                pass
+        self.__UpdateHealth(index, Status = 'Stopped')
+
+
+#Global shared pool, lazily started by GetDriverPool().
+__pool:DriverPoolClass | None = None
+__pool_lock = threading.Lock()
+
+
+def GetDriverPool(start_flag:bool = True, primary:webdriver.Chrome | None = None) -> DriverPoolClass | None:
+    """
+    Returns the DriverPoolClass instance shared by the program.
+
+    Optional Arguments:
+        - start_flag: A boolean indicating whether the pool should be started if it isn't running,
+        None is returned for a stopped pool otherwise.
+        - primary: A logged in Chrome webdriver object whose session is shared with the pooled
+        drivers when the pool is started.
+    """
+
+    global __pool
+
+    with __pool_lock:
+        if __pool is None and start_flag:
+            __pool = DriverPoolClass(primary = primary)
+    return __pool
+
+
+def ShutdownDriverPool() -> None:
+    """Stops the shared driver pool (if started), waiting for queued calls to be processed."""
+
+    global __pool
+
+    with __pool_lock:
+        pool, __pool = __pool, None
+
+    if pool is not None:
+        pool.Shutdown()
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
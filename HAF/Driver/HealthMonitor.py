@@ -0,0 +1,199 @@
+"""Samples Chrome memory between tickets and recycles tabs or drivers that grew too large."""
+
+#Native Modules:
+import os
+import weakref
+import threading
+from datetime import datetime
+
+#External Modules:
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+#Optional External Modules:
+try:
+    import psutil
+except ImportError:
+    psutil = None #Chrome resident memory isn't sampled without psutil, only the JS heap is.
+
+#Internal Modules:
+from HAF.Driver.DriverLock import GetDriverLock
+from HAF.Driver.DriverHandler import ApplyResourceBlocking
+from HAF.Driver.PrefetchHandler import CloseSpareTab
+from HAF.Driver.LocatorHandler import InvalidateElements
+from HAF.Driver.RetryHandler import RunWithRetry
+from HAF.Constants import Health, Paths, URL, LogConstants
+
+#Global Variables:
+__ticket_counts:weakref.WeakKeyDictionary = weakref.WeakKeyDictionary() #Tickets processed on each tab, for each driver.
+__replaceable:weakref.WeakSet = weakref.WeakSet() #Drivers that may be quit and replaced by their owner.
+__recycle_reasons:weakref.WeakKeyDictionary = weakref.WeakKeyDictionary() #Reason each driver is due to be replaced.
+__health_lock = threading.Lock()
+
+
+def SampleResources(driver:webdriver.Chrome) -> dict:
+    """
+    Samples the memory used by a driver, the driver lock should be held.\n
+    Returns a dictionary with the following keys (None if they couldn't be sampled):
+        - RSS_MB: Resident memory (in megabytes) of the chromedriver and Chrome process tree.
+        - Heap_MB: JS heap (in megabytes) used by the current tab.
+        - Nodes: Number of DOM nodes of the current tab.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+    """
+
+    sample = {'RSS_MB': None, 'Heap_MB': None, 'Nodes': None}
+
+    try:
+        driver.execute_cdp_cmd('Performance.enable', {})
+        metrics = {
+            metric['name']: metric['value']
+            for metric in driver.execute_cdp_cmd('Performance.getMetrics', {}).get('metrics', [])
+        }
+        sample['Heap_MB'] = metrics.get('JSHeapUsedSize', 0) / 2 ** 20
+        sample['Nodes'] = int(metrics.get('Nodes', 0))
+    except WebDriverException:
+        pass
+
+    #Persistent sessions attach to a Chrome that isn't a child of chromedriver, so only chromedriver is counted there.
+    process = getattr(getattr(driver, 'service', None), 'process', None)
+    if psutil is not None and process is not None:
+        try:
+            root = psutil.Process(process.pid)
+            sample['RSS_MB'] = sum(
+                child.memory_info().rss for child in [root] + root.children(recursive = True)
+            ) / 2 ** 20
+        except psutil.Error:
+            pass
+
+    return sample
+
+
+def __LogRecycle(action:str, reason:str) -> None:
+    """
+    Private function: Prints a recycle and appends it to the health log file.
+
+    Arguments:
+        - action: A string with what was recycled.
+        - reason: A string with why it was recycled.
+    """
+
+    line = f'{datetime.now().strftime(LogConstants.DATE_FORMAT)} | {action} | {reason}'
+    print(f'\n- Recycled {action.lower()} ({reason}).')
+
+    with __health_lock:
+        os.makedirs(os.path.dirname(Paths.HEALTH_LOG_PATH), exist_ok = True)
+        with open(Paths.HEALTH_LOG_PATH, 'a', encoding = 'utf-8') as logfile:
+            logfile.write(line + '\n')
+
+
+def RecycleTab(driver:webdriver.Chrome, reason:str) -> None:
+    """
+    Replaces the calling thread tab (and its spare tab) with a fresh tab on the portal, the
+    renderer memory of the old tab is freed once it's closed.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+        - reason: A string with why the tab is recycled, for the health log.
+    """
+
+    with GetDriverLock(driver) as lock:
+        CloseSpareTab(driver)
+        old_handle = lock.GetBoundHandle
+
+        driver.switch_to.new_window('tab')
+        new_handle = str(driver.current_window_handle)
+        lock.SwitchTab(new_handle)
+        ApplyResourceBlocking(driver)
+
+        lock.SwitchTab(old_handle)
+        driver.close()
+        lock.SwitchTab(new_handle)
+
+        RunWithRetry('Navigate', lambda: driver.get(URL.PORTAL_URL), driver)
+        InvalidateElements(driver)
+
+    __LogRecycle('Tab', reason)
+
+
+def SetReplaceable(driver:webdriver.Chrome) -> None:
+    """
+    Marks a driver as replaceable by its owner (i.e. pooled drivers), drivers over
+    'Health.DRIVER_RSS_LIMIT' are then flagged for replacement (see :mod:`PopRecycleReason()`)
+    instead of having their tab recycled.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+    """
+
+    with __health_lock:
+        __replaceable.add(driver)
+
+
+def PopRecycleReason(driver:webdriver.Chrome) -> str:
+    """
+    Returns why a replaceable driver should be quit and loaded again, empty if it's healthy.\n
+    The reason is cleared once returned.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+    """
+
+    with __health_lock:
+        return __recycle_reasons.pop(driver, '')
+
+
+def CheckResources(driver:webdriver.Chrome) -> None:
+    """
+    Samples the calling thread tab every 'Health.SAMPLE_EVERY' tickets and recycles what grew over
+    its limit, should be called between tickets:
+        - Tabs over 'Health.TAB_HEAP_LIMIT' are recycled.
+        - Replaceable drivers over 'Health.DRIVER_RSS_LIMIT' are flagged for replacement, other drivers
+        have their tab recycled and their memory caches cleared.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+
+    Dependencies:
+        - :mod:`SampleResources()`: For memory sampling.
+        - :mod:`RecycleTab()`: For tab recycling.
+    """
+
+    with GetDriverLock(driver) as lock:
+        handle = lock.GetBoundHandle
+
+        with __health_lock:
+            counts = __ticket_counts.setdefault(driver, {})
+            counts[handle] = counts.get(handle, 0) + 1
+            if counts[handle] < Health.SAMPLE_EVERY:
+                return
+            counts.pop(handle)
+
+        sample = SampleResources(driver)
+
+        if sample['RSS_MB'] is not None and sample['RSS_MB'] > Health.DRIVER_RSS_LIMIT:
+            reason = f'Chrome RSS {sample["RSS_MB"]:.0f} MB over {Health.DRIVER_RSS_LIMIT} MB'
+
+            with __health_lock:
+                replaceable_flag = driver in __replaceable
+                if replaceable_flag:
+                    __recycle_reasons[driver] = reason
+
+            if replaceable_flag:
+                __LogRecycle('Driver', reason)
+            else:
+                RecycleTab(driver, reason + ', driver is not replaceable')
+                try:
+                    driver.execute_cdp_cmd('HeapProfiler.collectGarbage', {})
+                    driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+                except WebDriverException:
+                    pass
+
+        elif sample['Heap_MB'] is not None and sample['Heap_MB'] > Health.TAB_HEAP_LIMIT:
+            RecycleTab(driver, f'JS heap {sample["Heap_MB"]:.0f} MB over {Health.TAB_HEAP_LIMIT} MB, {sample["Nodes"]} DOM nodes')
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
@@ -0,0 +1,173 @@
+"""Fast text entry for Fenix ITSM portal fields."""
+
+#Native Modules:
+import time
+import threading
+
+#External Modules:
+from selenium import webdriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import WebDriverException
+
+#Internal Modules:
+from HAF.Metrics.Instruments import Observe
+from HAF.Constants import Input
+
+#Global Constants:
+TEXT_METHODS = ('insert', 'value', 'keys')
+READ_VALUE_SCRIPT = '''
+    var element = arguments[0] || document.activeElement;
+    if (!element) { return ''; }
+    return ('value' in element ? element.value : element.innerText || element.textContent) || '';
+'''
+SELECT_ALL_SCRIPT = '''
+    var element = arguments[0] || document.activeElement;
+    if (!element) { return; }
+    element.focus();
+    if (typeof element.select === 'function') {
+        element.select();
+    } else {
+        var range = document.createRange();
+        range.selectNodeContents(element);
+        var selection = window.getSelection();
+        selection.removeAllRanges();
+        selection.addRange(range);
+    }
+'''
+SET_VALUE_SCRIPT = '''
+    var element = arguments[0] || document.activeElement;
+    if (!element || !('value' in element)) { return false; }
+    var prototype = Object.getPrototypeOf(element);
+    var setter = Object.getOwnPropertyDescriptor(prototype, 'value');
+    if (setter && setter.set) { setter.set.call(element, arguments[1]); } else { element.value = arguments[1]; }
+    element.dispatchEvent(new Event('input', {bubbles: true}));
+    element.dispatchEvent(new Event('change', {bubbles: true}));
+    return true;
+'''
+
+#Fastest text method accepted by each field, fields that keep rejecting a method skip it afterwards.
+__field_methods:dict[str, str] = {}
+__field_failures:dict[str, int] = {} #Failed attempts in a row of the remembered method of each field.
+__field_methods_lock = threading.Lock()
+
+
+def __Normalize(text:str) -> str:
+    """
+    Private function: Removes every whitespace character of a string, fields (mainly contenteditable
+    ones) may rewrite new lines and spaces of the entered text.
+
+    Arguments:
+        - text: The string to be normalized.
+    """
+
+    return ''.join(str(text).split())
+
+
+def __ReadValue(driver:webdriver.Chrome, element:WebElement | None) -> str:
+    """
+    Private function: Reads the value (or text content) of a field.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+        - element: The field WebElement, None for the focused element.
+    """
+
+    return str(driver.execute_script(READ_VALUE_SCRIPT, element))
+
+
+def __TryMethod(driver:webdriver.Chrome, method:str, text:str, element:WebElement | None) -> bool:
+    """
+    Private function: Enters text into a field with one of 'TEXT_METHODS' and checks that the
+    field accepted it.\n
+    Returns True if the field value contains the text afterwards, False otherwise.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+        - method: 'insert' (DevTools Input.insertText), 'value' (value set and input events)
+        or 'keys' (one keystroke per character).
+        - text: The string to be entered.
+        - element: The field WebElement, None for the focused element.
+
+    Dependencies:
+        - :mod:`__ReadValue()`: For entry verification.
+        - :mod:`__Normalize()`: For whitespace insensitive comparison.
+    """
+
+    try:
+        match method:
+            case 'insert':
+                if element is not None:
+                    driver.execute_script('arguments[0].focus();', element)
+                driver.execute_cdp_cmd('Input.insertText', {'text': text})
+
+            case 'value':
+                if not driver.execute_script(SET_VALUE_SCRIPT, element, text):
+                    return False
+
+            case 'keys':
+                (element or driver.switch_to.active_element).send_keys(text)
+                return True #Keystrokes are the last resort, there is nothing left to fall back to.
+
+        return __Normalize(text) in __Normalize(__ReadValue(driver, element))
+    except WebDriverException:
+        return False
+
+
+def InsertText(driver:webdriver.Chrome, text:str, element:WebElement | None = None, field:str = '') -> str:
+    """
+    Enters a whole string into a field in a single operation, falling back to value setting and
+    then to keystrokes for fields that reject it, the whole field is selected before each fallback
+    so text left by a failed attempt is replaced.\n
+    The selected text of the field (if any) is replaced, the time taken is recorded to the
+    'text_entry_seconds' histogram (see Metrics package), out of the latency profile used for step
+    timeouts. A field only starts from a slower method after its remembered one failed
+    'Input.METHOD_FAILURES' times in a row.\n
+    Returns the name of the method that entered the text.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+        - text: The string to be entered.
+
+    Optional Arguments:
+        - element: The field WebElement, defaults on the focused element.
+        - field: A string naming the field, used to remember its accepted method and to record timings.
+
+    Dependencies:
+        - :mod:`__TryMethod()`: For each entry attempt.
+    """
+
+    text = str(text)
+    start = time.monotonic()
+
+    with __field_methods_lock:
+        first_method = __field_methods.get(field, TEXT_METHODS[0])
+
+    for attempt, method in enumerate(TEXT_METHODS[TEXT_METHODS.index(first_method):]):
+        if attempt:
+            try:
+                driver.execute_script(SELECT_ALL_SCRIPT, element)
+            except WebDriverException:
+                pass
+
+        if __TryMethod(driver, method, text, element):
+            break
+
+    if field:
+        with __field_methods_lock:
+            if method == first_method:
+                __field_failures.pop(field, None)
+            else:
+                failures = __field_failures.get(field, 0) + 1
+                if failures >= Input.METHOD_FAILURES:
+                    __field_methods[field] = method
+                    __field_failures.pop(field, None)
+                else:
+                    __field_failures[field] = failures
+        Observe('text_entry_seconds', time.monotonic() - start, field = field, method = method)
+
+    return method
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
@@ -0,0 +1,217 @@
+"""Registry of Fenix ITSM portal and Microsoft login element locators, with a per-page element cache."""
+
+#Native Modules:
+import re
+import weakref
+import threading
+
+#External Modules:
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import WebDriverException
+
+#Internal Modules:
+from HAF.Driver.DriverLock import GetDriverLock
+from HAF.Driver.WaitHandler import WaitForClickable
+from HAF.Constants import Wait
+
+#Global Constants:
+LOCATORS:dict[str, dict[str, str]] = {
+    'Login': {
+        'ProfileTile': '//*[@id="tilesHolder"]/div[1]/div/div[1]/div/div[2]/div',
+        'EmailInput': '//*[@id="i0116"]',
+        'PasswordInput': '//*[@id="i0118"]',
+        'KeepSignedInCheckbox': '//*[@id="KmsiCheckboxField"]',
+        'ConfirmButton': '//*[@id="idSIButton9"]',
+        'MFATimeoutCheckbox': '//*[@id="idChkBx_SAOTCAS_TD"]',
+        'MFATitle': '//*[@id="idDiv_SAOTCAS_Title"]'
+    },
+    'SmartRecorder': {
+        'MainBar': '//*[@id="main"]/div/div[2]/div[1]/div[1]/smart-recorder-input/div/div[2]',
+        'TemplateIcon': '//*[@id="main"]/div/div[2]/div[3]/div/div/div[2]/rs/div/div[2]/rs-dwp-catalog/div/div/div/div[1]/i[1]',
+        'CreateButton': '//*[@id="main"]/div/div[3]/button[1]'
+    },
+    'TicketPage': {
+        'TaskTab': '//fulfillment-map/div/div[2]/div[2]/div/div[2]',
+        'EditorButton': '/html/body/div[2]/div/div[2]/div/div[2]/div/div/div/div[3]/div[2]/div'
+    },
+    'TicketEditor': {
+        'TitleInput': '//*[@id="ticket-record-summary"]/div[3]/title-bar/div[2]/div/div[1]/label/input',
+        'StatusButton': '//*[@id="ticket-record-summary"]/div[3]/div[1]/div/div/div[1]/label/div/button',
+        'StatusOngoing': '//*[@id="ticket-record-summary"]/div[3]/div[1]/div/div/div[1]/label/div/ul/li[2]/a',
+        'StatusConcluded': '//*[@id="ticket-record-summary"]/div[3]/div[1]/div/div/div[1]/label/div/ul/li[4]/a',
+        'StatusReasonButton': '//*[@id="ticket-record-summary"]/div[3]/div[1]/div/div[1]/div[2]/div/label/div/button',
+        'StatusReasonSolution': '//*[@id="ticket-record-summary"]/div[3]/div[1]/div/div[1]/div[2]/div/label/div/ul/li[1]/a',
+        'DefinitionButton1': '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[1]/div[1]/div[1]/div/div[3]/div/div/label/div/div/div/button',
+        'DefinitionOption1': '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[1]/div[1]/div[1]/div/div[3]/div/div/label/div/div/div/ul/li[1]/a',
+        'DefinitionOption4': '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[1]/div[1]/div[1]/div/div[3]/div/div/label/div/div/div/ul/li[4]/a',
+        'DefinitionButton2': '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[1]/div[1]/div[1]/div/div[4]/div/div/label/div/div/div/button',
+        'DefinitionOption2': '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[1]/div[1]/div[1]/div/div[4]/div/div/label/div/div/div/ul/li[1]/a',
+        'DefinitionButton3': '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[1]/div[1]/div[1]/div/div[5]/div/div/label/div/div/div/button',
+        'DefinitionOption3': '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[1]/div[1]/div[1]/div/div[5]/div/div/label/div/div/div/ul/li[2]/a',
+        'CategoryButton': '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[2]/div/div[2]/div/div/div/div/div[2]/button[1]',
+        'CategoryOperational': '//*[@id="category-dropdown-operational"]',
+        'CategoryTier1': '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[2]/div/div[2]/div/div/div/div[1]/ul/li[22]/div',
+        'CategoryTier2Button': '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[2]/div/div[2]/div/div/div/div[2]/div',
+        'CategoryTier2': '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[2]/div/div[2]/div/div/div/div[2]/ul/li[7]/div',
+        'AssignToMe': '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[3]/div[1]/div/div[1]/div/div/div[2]/div/a',
+        'DesignationMenuButton': '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[3]/div[2]/div/div[1]/div/div/label/span',
+        'SolutionTextarea': '//*[@id="ticket-record-summary"]/div[3]/div[1]/div/div[2]/div/label/textarea',
+        'SaveButton': '//*[@id="ticket-record-summary"]/div[2]/div/button[1]',
+        'EditButton': '//*[@id="ticket-record-summary"]/div[2]/div'
+    },
+    'DesignationMenu': {
+        'GroupButton': '//assignee-chooser/div[2]/div[3]/label/div/button',
+        'GroupAll': '//assignee-chooser/div[2]/div[3]/label/div/ul/li[3]/a',
+        'TeamButton': '//assignee-chooser/div[2]/div[4]/label/div/button',
+        'TeamInput': '//assignee-chooser/div[2]/div[4]/label/div/ul/li[1]/input',
+        'FirstResult': '//assignee-chooser/div[3]/div[1]',
+        'ConfirmButton': '/html/body/div[5]/div/div/div/div/div/button[1]'
+    }
+}
+XPATH_ROOTS = (
+    (re.compile(r'^//\*\[@id="([A-Za-z_][\w-]*)"\]'), lambda match: '#' + match.group(1)),
+    (re.compile(r'^//([A-Za-z][\w-]*)(?=/|$)'), lambda match: match.group(1)),
+    (re.compile(r'^/html/body(?=/|$)'), lambda match: 'html > body')
+)
+XPATH_STEP = re.compile(r'^([A-Za-z][\w-]*)(?:\[(\d+)\])?$')
+
+#Compiled selectors and cached elements of each driver, entries are dropped with their drivers.
+__selectors:dict[tuple[str, str], str] = {}
+__elements:weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+__elements_lock = threading.Lock()
+
+
+def CompileXPath(xpath:str) -> str:
+    """
+    Compiles a simple XPath (id, tag or document rooted, followed by child steps with optional
+    positions) into the equivalent CSS selector, which browsers resolve faster.\n
+    Returns the CSS selector, or the unchanged XPath if it can't be expressed as one.
+
+    Arguments:
+        - xpath: The XPath string to be compiled.
+    """
+
+    for pattern, Root in XPATH_ROOTS:
+        match = pattern.match(xpath)
+        if match:
+            break
+    else:
+        return xpath
+
+    parts = [Root(match)]
+    for step in filter(None, xpath[match.end():].split('/')):
+        step_match = XPATH_STEP.match(step)
+        if step_match is None:
+            return xpath #Descendant axes and attribute predicates are kept as XPath.
+
+        tag, position = step_match.groups()
+        parts.append(f'{tag}:nth-of-type({position})' if position else tag)
+
+    return ' > '.join(parts)
+
+
+def GetBy(selector:str) -> str:
+    """
+    Returns the Selenium By strategy of a compiled selector (XPath or CSS).
+
+    Arguments:
+        - selector: A selector string returned by :mod:`Locator()`.
+    """
+
+    return By.XPATH if selector.startswith(('/', '(')) else By.CSS_SELECTOR
+
+
+def Locator(page:str, name:str) -> str:
+    """
+    Returns the compiled selector (CSS if possible, XPath otherwise) of a registered element.
+
+    Arguments:
+        - page: A string with the page name, see 'LOCATORS'.
+        - name: A string with the element name.
+
+    Dependencies:
+        - :mod:`CompileXPath()`: For selector compiling.
+    """
+
+    key = (page, name)
+    if key not in __selectors:
+        __selectors[key] = CompileXPath(LOCATORS[page][name])
+    return __selectors[key]
+
+
+def InvalidateElements(driver:webdriver.Chrome, page:str | None = None) -> None:
+    """
+    Drops the cached elements of a driver, should be called after navigating or refreshing.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+
+    Optional Arguments:
+        - page: A string with the page name whose elements should be dropped, defaults on every page.
+    """
+
+    with __elements_lock:
+        cache = __elements.get(driver, {})
+        for key in [key for key in cache if page is None or key[1] == page]:
+            del cache[key]
+
+
+def FindElement(
+    driver:webdriver.Chrome,
+    page:str,
+    name:str,
+    wait_flag:bool = False,
+    timeout:float = Wait.ELEMENT_TIMEOUT,
+    step:str = ''
+) -> WebElement:
+    """
+    Finds a registered element, reusing the element found earlier on the same page and tab:
+        - Plain lookups return it right away while it's still attached to the document.
+        - Awaited lookups check it first (see :mod:`WaitForClickable()`), so a clickable cached
+        element saves the lookup while the wait and its step timing still happen.\n
+    Returns the found WebElement.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+        - page: A string with the page name, see 'LOCATORS'.
+        - name: A string with the element name.
+
+    Optional Arguments:
+        - wait_flag: A boolean indicating whether the element should be awaited until clickable
+        (see :mod:`WaitForClickable()`), it's looked up right away otherwise.
+        - timeout: Deadline (in seconds) for the wait.
+        - step: A string naming the ticket step being awaited, see :mod:`WaitUntil()`.
+
+    Dependencies:
+        - :mod:`Locator()`: For selector compiling.
+    """
+
+    #Cache keys include the tab, as elements of one tab can't be used from another.
+    key = (GetDriverLock(driver).GetActiveHandle, page, name)
+    selector = Locator(page, name)
+
+    with __elements_lock:
+        cached = __elements.setdefault(driver, {}).get(key)
+
+    if wait_flag:
+        element = WaitForClickable(driver, selector, timeout, step, GetBy(selector), cached)
+    else:
+        if cached is not None:
+            try:
+                cached.is_enabled()
+                return cached
+            except WebDriverException:
+                pass #Stale element, the page was reloaded or re-rendered.
+
+        element = driver.find_element(GetBy(selector), selector)
+
+    with __elements_lock:
+        __elements.setdefault(driver, {})[key] = element
+    return element
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
@@ -0,0 +1,254 @@
+"""Follows Fenix ITSM portal network traffic through the DevTools performance log."""
+
+#Native Modules:
+import re
+import json
+import weakref
+import threading
+
+#External Modules:
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+#Internal Modules:
+from HAF.Driver.DriverLock import GetDriverLock
+from HAF.Driver.WaitHandler import WaitUntil
+from HAF.Constants import Network
+
+
+class NetworkMonitorClass():
+    """
+    Buffers the network events of a Chrome webdriver performance log, so requests sent by the
+    portal can be awaited and their responses read as soon as they finish loading.\n
+    The driver has to be loaded with performance logging enabled, see :mod:`LoadDriver()`.
+    * Uses double undescore to specify private methods/attributes instead of the convenional single underscore.
+
+    Private Attributes:
+        - __driver: A weak reference to the loaded Chrome webdriver object.
+        - __events: A list of (tab target ID, method, params) tuples, oldest first.
+        - __offset: Number (integer) of events dropped from the start of '__events'.
+        - __lock: A threading lock guarding '__events' and '__offset'.
+    """
+
+    def __init__(self, driver:webdriver.Chrome) -> None:
+        """
+        Creates a new NetworkMonitorClass instance.
+
+        Arguments:
+            - driver: A loaded Chrome webdriver object.
+        """
+
+        self.__driver = weakref.ref(driver)
+        self.__events:list[tuple[str, str, dict]] = []
+        self.__offset = 0
+        self.__lock = threading.Lock()
+
+
+    def Poll(self) -> None:
+        """Drains the driver performance log into the event buffer, keeping only network events."""
+
+        driver = self.__driver()
+        if driver is None:
+            return
+
+        try:
+            entries = driver.get_log('performance')
+        except WebDriverException:
+            return #Performance logging is disabled for this driver.
+
+        with self.__lock:
+            for entry in entries:
+                try:
+                    message = json.loads(entry['message'])
+                except (KeyError, ValueError):
+                    continue
+
+                method = message.get('message', {}).get('method', '')
+                if method in Network.TRACKED_EVENTS:
+                    self.__events.append((str(message.get('webview', '')), method, message['message'].get('params', {})))
+
+            overflow = len(self.__events) - Network.MAX_BUFFERED_EVENTS
+            if overflow > 0:
+                del self.__events[:overflow]
+                self.__offset += overflow
+
+
+    def Mark(self) -> int:
+        """
+        Returns the position of the next buffered event, requests are only awaited from a mark on
+        so earlier traffic isn't mistaken for the awaited one.
+
+        Dependencies:
+            - :mod:`Poll()`: For buffer update.
+        """
+
+        self.Poll()
+        with self.__lock:
+            return self.__offset + len(self.__events)
+
+
+    def FindRequest(self, mark:int, url_pattern:str, method:str = 'POST', tab:str = '') -> tuple[str, str] | None:
+        """
+        Looks for a request sent after 'mark' whose URL matches 'url_pattern'.
+
+        Return:
+            - None if no matching request was sent.
+            - A (request ID, status) tuple otherwise, status being 'pending', 'finished' or 'failed'.
+
+        Arguments:
+            - mark: An event position returned by :mod:`Mark()`.
+            - url_pattern: A regular expression string searched in the request URL.
+
+        Optional Arguments:
+            - method: The HTTP method string of the request.
+            - tab: The window handle string of the tab that sent the request, defaults on any tab.
+        """
+
+        self.Poll()
+        request_ID:str | None = None
+
+        with self.__lock:
+            for webview, event, params in self.__events[max(mark - self.__offset, 0):]:
+                if tab and webview and not tab.endswith(webview):
+                    continue
+
+                if request_ID is None and event == 'Network.requestWillBeSent':
+                    request = params.get('request', {})
+                    if request.get('method') == method and re.search(url_pattern, request.get('url', '')):
+                        request_ID = params.get('requestId')
+
+                elif request_ID is not None and params.get('requestId') == request_ID:
+                    if event == 'Network.loadingFinished':
+                        return (request_ID, 'finished')
+                    elif event == 'Network.loadingFailed':
+                        return (request_ID, 'failed')
+
+        return None if request_ID is None else (request_ID, 'pending')
+
+
+    def GetResponseBody(self, request_ID:str) -> str:
+        """
+        Returns the response body string of a finished request, empty if it's no longer available.\n
+        Must be called with the driver switched to the tab that sent the request.
+
+        Arguments:
+            - request_ID: A request ID string returned by :mod:`FindRequest()`.
+        """
+
+        driver = self.__driver()
+        if driver is None:
+            return ''
+
+        try:
+            return str(driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_ID}).get('body', ''))
+        except WebDriverException:
+            return ''
+
+
+#Global monitor registry, entries are dropped with their drivers.
+__monitors:weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+__monitors_lock = threading.Lock()
+
+
+def GetNetworkMonitor(driver:webdriver.Chrome) -> NetworkMonitorClass:
+    """
+    Returns the NetworkMonitorClass instance of a driver, creating it on the first call.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+    """
+
+    with __monitors_lock:
+        if driver not in __monitors:
+            __monitors[driver] = NetworkMonitorClass(driver)
+        return __monitors[driver]
+
+
+def __FindTicketID(data:object) -> str:
+    """
+    Private function: Searches a decoded JSON response for the first numeric value stored
+    under one of 'Network.TICKET_ID_KEYS'.\n
+    Returns the ticket ID string, empty if none is found.
+
+    Arguments:
+        - data: The decoded JSON response.
+    """
+
+    if isinstance(data, dict):
+        for key in Network.TICKET_ID_KEYS:
+            if str(data.get(key, '')).isnumeric():
+                return str(data[key])
+        data = list(data.values())
+
+    if isinstance(data, list):
+        for item in data:
+            ticket_ID = __FindTicketID(item)
+            if ticket_ID:
+                return ticket_ID
+
+    return ''
+
+
+def WaitForCreatedTicket(driver:webdriver.Chrome, mark:int, timeout:float, url_prefix:str = '', step:str = '') -> tuple[str, bool]:
+    """
+    Waits for the ticket creation request sent after 'mark' and reads the new ticket ID from
+    its response as soon as it finishes loading.
+
+    Return:
+        - A (ticket ID, request flag) tuple, the ticket ID is empty if it couldn't be read and the
+        request flag is True if the creation request was sent and didn't fail (the ticket may
+        exist even if its ID is empty).
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+        - mark: An event position returned by :mod:`NetworkMonitorClass.Mark()`.
+        - timeout: Deadline (in seconds) for the wait.
+
+    Optional Arguments:
+        - url_prefix: The ticket page URL prefix string, if the portal redirects there before the
+        response is read (or performance logging is disabled) the ticket ID is taken from the URL.
+        - step: A string naming the ticket step being awaited, see :mod:`WaitUntil()`.
+
+    Dependencies:
+        - :mod:`__FindTicketID()`: For ticket ID parsing.
+    """
+
+    monitor = GetNetworkMonitor(driver)
+    tab = GetDriverLock(driver).GetActiveHandle
+
+    def __Created(driver:webdriver.Chrome) -> tuple[str, str] | None:
+        request = monitor.FindRequest(mark, Network.TICKET_CREATE_PATTERN, tab = tab)
+        if request and request[1] != 'pending':
+            return request
+        elif url_prefix and driver.current_url.startswith(url_prefix):
+            return ('', 'redirected')
+        return None
+
+    #The driver isn't handed over while waiting, response bodies can only be read from their own tab.
+    request = WaitUntil(driver, __Created, timeout, raise_on_timeout = False, step = step, safe_point = False)
+
+    #Slow responses of requests already in flight are given one more full timeout.
+    if not request and monitor.FindRequest(mark, Network.TICKET_CREATE_PATTERN, tab = tab) is not None:
+        request = WaitUntil(driver, __Created, timeout, raise_on_timeout = False, safe_point = False)
+        if not request:
+            return ('', True)
+
+    if not request:
+        return ('', False)
+
+    match request[1]:
+        case 'failed':
+            return ('', False)
+        case 'redirected':
+            ticket_ID = driver.current_url.removeprefix(url_prefix)
+            return (ticket_ID if ticket_ID.isnumeric() else '', True)
+
+    try:
+        return (__FindTicketID(json.loads(monitor.GetResponseBody(request[0]))), True)
+    except ValueError:
+        return ('', True)
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
@@ -0,0 +1,140 @@
+"""Keeps spare browser tabs pre-navigated to the next page a tab will need."""
+
+#Native Modules:
+import weakref
+import threading
+
+#External Modules:
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+#Internal Modules:
+from HAF.Driver.DriverLock import GetDriverLock
+from HAF.Driver.DriverHandler import ApplyResourceBlocking
+
+#Global Constants:
+NAVIGATE_SCRIPT = '''
+    var target = arguments[0];
+    if (location.href.split('#')[0] === target.split('#')[0]) {
+        history.replaceState(null, '', target);
+        location.reload();
+    } else {
+        location.replace(target);
+    }
+'''
+
+#Global Variables:
+__spares:weakref.WeakKeyDictionary = weakref.WeakKeyDictionary() #Working tab handles and their spare tab handles, for each driver.
+__spares_lock = threading.Lock()
+
+
+def PrefetchPage(driver:webdriver.Chrome, url:str) -> None:
+    """
+    Starts loading a page on the spare tab of the calling thread tab (opening it if needed) and
+    goes back to the working tab right away, the page keeps loading in the background.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+        - url: The URL string to be prefetched.
+    """
+
+    with GetDriverLock(driver) as lock:
+        working_handle = lock.GetBoundHandle
+
+        with __spares_lock:
+            spare_handle = __spares.setdefault(driver, {}).get(working_handle)
+
+        try:
+            if spare_handle is None:
+                driver.switch_to.new_window('tab')
+                spare_handle = str(driver.current_window_handle)
+                lock.SwitchTab(spare_handle)
+                ApplyResourceBlocking(driver)
+            else:
+                lock.SwitchTab(spare_handle)
+
+            #Navigation is started from the page so this call doesn't wait for it, hash routes of the
+            #same page are reloaded as well so the spare page is always fresh.
+            driver.execute_script(NAVIGATE_SCRIPT, url)
+        except WebDriverException:
+            spare_handle = None #Spare tab was closed, a new one is opened next time.
+        finally:
+            lock.SwitchTab(working_handle)
+
+        with __spares_lock:
+            if spare_handle is None:
+                __spares[driver].pop(working_handle, None)
+            else:
+                __spares[driver][working_handle] = spare_handle
+
+
+def UseSparePage(driver:webdriver.Chrome, url:str) -> bool:
+    """
+    Swaps the calling thread tab with its spare tab if the spare navigated to 'url' (its elements
+    may still be loading), the previous working tab becomes the new spare.
+
+    Return:
+        - True if the driver is now on a tab with 'url'.
+        - False otherwise (no spare tab, or it is still on another page).
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+        - url: The URL string the spare tab should have loaded.
+    """
+
+    with GetDriverLock(driver) as lock:
+        working_handle = lock.GetBoundHandle
+
+        with __spares_lock:
+            spare_handle = __spares.setdefault(driver, {}).get(working_handle)
+        if spare_handle is None:
+            return False
+
+        try:
+            lock.SwitchTab(spare_handle)
+            ready = driver.current_url.startswith(url)
+        except WebDriverException:
+            ready = False
+
+        if not ready:
+            try:
+                lock.SwitchTab(working_handle)
+            except WebDriverException:
+                pass
+            return False
+
+        with __spares_lock:
+            spares = __spares[driver]
+            spares.pop(working_handle, None)
+            spares[spare_handle] = working_handle
+        return True
+
+
+def CloseSpareTab(driver:webdriver.Chrome) -> None:
+    """
+    Closes the spare tab of the calling thread tab (if any).
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+    """
+
+    with GetDriverLock(driver) as lock:
+        working_handle = lock.GetBoundHandle
+
+        with __spares_lock:
+            spare_handle = __spares.get(driver, {}).pop(working_handle, None)
+        if spare_handle is None:
+            return
+
+        try:
+            lock.SwitchTab(spare_handle)
+            driver.close()
+        except WebDriverException:
+            pass #Tab was already closed.
+        finally:
+            lock.SwitchTab(working_handle)
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
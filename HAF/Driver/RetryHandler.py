@@ -0,0 +1,334 @@
+"""Retries portal operations with backoff and deadlines, failing fast while the portal is down."""
+
+#Native Modules:
+import time
+import random
+import threading
+from typing import Callable, Any
+
+#External Modules:
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException, InvalidSessionIdException, NoSuchWindowException
+
+#Internal Modules:
+from HAF.Driver.DriverLock import GetDriverLock
+from HAF.Constants import Retry
+
+#Global Constants:
+FATAL_EXCEPTIONS = (InvalidSessionIdException, NoSuchWindowException) #Retrying on a dead driver or tab is pointless.
+
+
+class RetryableError(Exception):
+    """Raised by operations that failed in a way that is safe to be tried again."""
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of running an operation while the circuit breaker is open.
+
+    Attributes:
+        - operation: The operation name string.
+        - retry_in: Time (in seconds) left until a trial call is let through.
+    """
+
+    def __init__(self, operation:str, retry_in:float) -> None:
+        self.operation = operation
+        self.retry_in = retry_in
+        super().__init__(f'Portal is unavailable, "{operation}" was not attempted (retrying in {retry_in:.0f}s).')
+
+
+class CircuitBreakerClass():
+    """
+    Portal wide circuit breaker, opens after 'Retry.FAILURE_THRESHOLD' failed attempts in a row so
+    calls fail fast instead of piling up on a degraded portal, then lets a single trial call
+    through every 'Retry.OPEN_TIME' seconds until one succeeds.
+    * Uses double undescore to specify private methods/attributes instead of the convenional single underscore.
+
+    Private Attributes:
+        - __failures: Number (integer) of failed attempts in a row.
+        - __opened_at: Monotonic time the breaker was opened at, None while closed.
+        - __trial_flag: A boolean indicating whether a trial call is running (or claimed).
+        - __trial_owner: Thread ID that claimed the trial call through :mod:`WaitUntilClosed()`,
+        None once its call starts or if the trial wasn't claimed.
+        - __condition: A threading condition guarding every attribute, notified when the breaker closes
+        or a trial call ends.
+    """
+
+    def __init__(self) -> None:
+        """Creates a new closed CircuitBreakerClass instance."""
+
+        self.__failures = 0
+        self.__opened_at:float | None = None
+        self.__trial_flag = False
+        self.__trial_owner:int | None = None
+        self.__condition = threading.Condition()
+
+
+    @property
+    def GetState(self) -> str:
+        """
+        Property: Gets the breaker state string, 'closed', 'open' or 'half-open' (trial calls allowed).
+
+        Usage:
+            >>> state:str = breaker.GetState
+        """
+
+        with self.__condition:
+            if self.__opened_at is None:
+                return 'closed'
+            return 'open' if self.__GetRetryIn() > 0 else 'half-open'
+
+
+    @property
+    def GetRetryIn(self) -> float:
+        """
+        Property: Gets the time (in seconds) left until a trial call is let through, 0 if closed.
+
+        Usage:
+            >>> seconds:float = breaker.GetRetryIn
+        """
+
+        with self.__condition:
+            return self.__GetRetryIn()
+
+
+    def Allow(self) -> bool:
+        """
+        Returns True if a call may run, only one trial call is allowed while half-open (it must
+        be followed by :mod:`RecordSuccess()`, :mod:`RecordFailure()` or :mod:`Release()`), a
+        trial claimed through :mod:`WaitUntilClosed()` is only let through on the claiming thread.
+        """
+
+        with self.__condition:
+            if self.__opened_at is None:
+                return True
+            if self.__trial_flag and self.__trial_owner == threading.get_ident():
+                self.__trial_owner = None
+                return True
+            if self.__GetRetryIn() > 0 or self.__trial_flag:
+                return False
+
+            self.__trial_flag = True
+            return True
+
+
+    def RecordSuccess(self) -> None:
+        """Records a successful attempt, closing the breaker."""
+
+        with self.__condition:
+            self.__failures = 0
+            self.__opened_at = None
+            self.__trial_flag = False
+            self.__trial_owner = None
+            self.__condition.notify_all()
+
+
+    def RecordFailure(self) -> None:
+        """Records a failed attempt, opening the breaker once the threshold is reached (or a trial fails)."""
+
+        with self.__condition:
+            self.__failures += 1
+            if self.__trial_flag or self.__failures >= Retry.FAILURE_THRESHOLD:
+                self.__opened_at = time.monotonic()
+            self.__trial_flag = False
+            self.__trial_owner = None
+            self.__condition.notify_all()
+
+
+    def Release(self) -> None:
+        """Ends a trial call that neither succeeded nor failed on the portal, another one may run."""
+
+        with self.__condition:
+            self.__trial_flag = False
+            self.__trial_owner = None
+            self.__condition.notify_all()
+
+
+    def ReleaseClaim(self) -> None:
+        """
+        Drops the trial call claimed by the calling thread through :mod:`WaitUntilClosed()` if it
+        was never started (i.e. the queued call didn't reach the portal), another waiter may claim it.
+        """
+
+        with self.__condition:
+            if self.__trial_flag and self.__trial_owner == threading.get_ident():
+                self.__trial_flag = False
+                self.__trial_owner = None
+                self.__condition.notify_all()
+
+
+    def WaitUntilClosed(self, timeout:float | None = None, claim_flag:bool = False) -> bool:
+        """
+        Blocks while the breaker is open or its trial call is running (or claimed), queued calls
+        wait here instead of failing fast.\n
+        Returns True if calls are allowed (closed, or half-open with no trial call running), False
+        if 'timeout' was reached.
+
+        Optional Arguments:
+            - timeout: Deadline (in seconds) for the wait, defaults on no deadline.
+            - claim_flag: A boolean indicating whether the trial call should be claimed for the
+            calling thread when the breaker is half-open, so the other waiters keep waiting for its
+            outcome instead of failing on :mod:`Allow()`. Claims must be followed by
+            :mod:`ReleaseClaim()` once the queued call ends.
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self.__condition:
+            while self.__opened_at is not None and (self.__GetRetryIn() > 0 or self.__trial_flag):
+                wait_time = self.__GetRetryIn() or None #Trial calls end with a notification.
+                if deadline is not None:
+                    wait_time = min(wait_time or float('inf'), deadline - time.monotonic())
+                    if wait_time <= 0:
+                        return False
+                self.__condition.wait(wait_time)
+
+            if claim_flag and self.__opened_at is not None:
+                self.__trial_flag = True
+                self.__trial_owner = threading.get_ident()
+            return True
+
+
+    def __GetRetryIn(self) -> float:
+        """Private method: Gets the open time left, must be called with '__condition' held."""
+
+        if self.__opened_at is None:
+            return 0.0
+        return max(self.__opened_at + Retry.OPEN_TIME - time.monotonic(), 0.0)
+
+
+class RetryPolicyClass():
+    """
+    Retry policy of an operation, see 'Retry.POLICIES'.
+    * Uses double undescore to specify private methods/attributes instead of the convenional single underscore.
+
+    Private Attributes:
+        - __operation: The operation name string.
+        - __attempts: Max number (integer) of attempts.
+        - __first_backoff: Backoff (in seconds) before the second attempt.
+        - __max_backoff: Max backoff (in seconds) between attempts.
+        - __deadline: Time (in seconds) after which no new attempt is started.
+        - __breaker: The CircuitBreakerClass instance attempts are recorded on.
+    """
+
+    def __init__(self, operation:str, breaker:CircuitBreakerClass | None = None) -> None:
+        """
+        Creates a new RetryPolicyClass instance.
+
+        Arguments:
+            - operation: The operation name string, operations without a policy use 'Retry.DEFAULT_POLICY'.
+
+        Optional Arguments:
+            - breaker: A CircuitBreakerClass instance, defaults on the portal wide breaker.
+        """
+
+        self.__operation = str(operation)
+        self.__attempts, self.__first_backoff, self.__max_backoff, self.__deadline = Retry.POLICIES.get(operation, Retry.DEFAULT_POLICY)
+        self.__breaker = breaker or GetCircuitBreaker()
+
+
+    def GetBackoff(self, attempt:int) -> float:
+        """
+        Returns the randomized backoff (in seconds) after a failed attempt.
+
+        Arguments:
+            - attempt: Number (integer) of the failed attempt, starting on 1.
+        """
+
+        backoff = min(self.__first_backoff * 2 ** (attempt - 1), self.__max_backoff)
+        return random.uniform(backoff / 2, backoff)
+
+
+    def Run(self, function:Callable[[], Any], driver:webdriver.Chrome | None = None) -> Any:
+        """
+        Runs 'function' until it succeeds, retrying WebDriverException and RetryableError exceptions
+        while attempts and deadline allow it.\n
+        Returns the value returned by 'function', the last exception is raised if every attempt failed
+        and CircuitOpenError is raised without running it while the breaker is open.
+
+        Arguments:
+            - function: A callable with no arguments.
+
+        Optional Arguments:
+            - driver: The Chrome webdriver object used by 'function', it is handed over to other tabs
+            during backoffs if its lock is held.
+
+        Dependencies:
+            - :mod:`GetBackoff()`: For backoff calculation.
+        """
+
+        deadline = time.monotonic() + self.__deadline
+        attempt = 0
+
+        while True:
+            attempt += 1
+            if not self.__breaker.Allow():
+                raise CircuitOpenError(self.__operation, self.__breaker.GetRetryIn)
+
+            try:
+                result = function()
+            except FATAL_EXCEPTIONS:
+                self.__breaker.Release()
+                raise
+            except (WebDriverException, RetryableError):
+                self.__breaker.RecordFailure()
+
+                backoff = self.GetBackoff(attempt)
+                if attempt >= self.__attempts or time.monotonic() + backoff > deadline:
+                    raise
+
+                lock = GetDriverLock(driver) if driver is not None else None
+                if lock is not None and lock.IsOwned:
+                    lock.Yield(backoff)
+                else:
+                    time.sleep(backoff)
+            except BaseException:
+                self.__breaker.Release()
+                raise
+            else:
+                self.__breaker.RecordSuccess()
+                return result
+
+
+#Global shared breaker and policies, lazily created.
+__breaker:CircuitBreakerClass | None = None
+__policies:dict[str, RetryPolicyClass] = {}
+__retry_lock = threading.Lock()
+
+
+def GetCircuitBreaker() -> CircuitBreakerClass:
+    """Returns the portal wide CircuitBreakerClass instance, creating it on the first call."""
+
+    global __breaker
+
+    with __retry_lock:
+        if __breaker is None:
+            __breaker = CircuitBreakerClass()
+    return __breaker
+
+
+def RunWithRetry(operation:str, function:Callable[[], Any], driver:webdriver.Chrome | None = None) -> Any:
+    """
+    Runs 'function' with the retry policy of 'operation', see :mod:`RetryPolicyClass.Run()`.
+
+    Arguments:
+        - operation: The operation name string, see 'Retry.POLICIES'.
+        - function: A callable with no arguments.
+
+    Optional Arguments:
+        - driver: The Chrome webdriver object used by 'function'.
+    """
+
+    breaker = GetCircuitBreaker()
+
+    with __retry_lock:
+        if operation not in __policies:
+            __policies[operation] = RetryPolicyClass(operation, breaker)
+        policy = __policies[operation]
+
+    return policy.Run(function, driver)
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
@@ -0,0 +1,137 @@
+"""Shares an authenticated portal session between drivers through cookie and storage export."""
+
+#Native Modules:
+import json
+import time
+import weakref
+import threading
+
+#External Modules:
+from selenium import webdriver
+
+#Internal Modules:
+from HAF.Constants import Session, URL
+
+#Global Constants:
+STORAGE_EXPORT_SCRIPT = '''
+    function Dump(storage) {
+        var items = {};
+        for (var i = 0; i < storage.length; i++) { items[storage.key(i)] = storage.getItem(storage.key(i)); }
+        return items;
+    }
+    return {origin: location.origin, local: Dump(localStorage), session: Dump(sessionStorage)};
+'''
+STORAGE_IMPORT_SCRIPT = '''
+    (function(origin, local, session) {{
+        if (location.origin !== origin) {{ return; }}
+        Object.keys(local).forEach(function(key) {{ localStorage.setItem(key, local[key]); }});
+        Object.keys(session).forEach(function(key) {{ sessionStorage.setItem(key, session[key]); }});
+    }})({Origin}, {Local}, {Session});
+'''
+COOKIE_FIELDS = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite', 'expires')
+
+#Global Variables:
+__imports:weakref.WeakKeyDictionary = weakref.WeakKeyDictionary() #Import status and storage script ID of each driver.
+__imports_lock = threading.Lock()
+
+
+def ExportSession(driver:webdriver.Chrome) -> dict:
+    """
+    Captures the portal and Microsoft cookies of an authenticated driver, plus the local and session
+    storage of its current tab if it's on the portal, the driver lock should be held.\n
+    Returns a session dictionary with 'Time', 'Cookies', 'Origin', 'Local_Storage' and 'Session_Storage' keys.
+
+    Arguments:
+        - driver: A loaded and logged in Chrome webdriver object.
+    """
+
+    cookies = [
+        {field: cookie[field] for field in COOKIE_FIELDS if field in cookie}
+        for cookie in driver.execute_cdp_cmd('Network.getAllCookies', {}).get('cookies', [])
+        if any(str(cookie.get('domain', '')).lstrip('.').endswith(domain) for domain in Session.COOKIE_DOMAINS)
+    ]
+
+    #Session cookies have no expiry date, sending a negative one would delete them.
+    for cookie in cookies:
+        if float(cookie.get('expires', -1)) <= 0:
+            cookie.pop('expires', None)
+
+    storage = {'origin': '', 'local': {}, 'session': {}}
+    if driver.current_url.startswith(URL.PORTAL_URL):
+        storage = driver.execute_script(STORAGE_EXPORT_SCRIPT)
+
+    return {
+        'Time': time.time(),
+        'Cookies': cookies,
+        'Origin': storage['origin'],
+        'Local_Storage': storage['local'],
+        'Session_Storage': storage['session']
+    }
+
+
+def ImportSession(driver:webdriver.Chrome, session:dict) -> None:
+    """
+    Injects a session captured by :mod:`ExportSession()` into a driver, must be called before the
+    driver first navigates to the portal and followed by :mod:`ConfirmImport()` once it has.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+        - session: A session dictionary returned by :mod:`ExportSession()`.
+    """
+
+    driver.execute_cdp_cmd('Network.enable', {})
+    if session['Cookies']:
+        driver.execute_cdp_cmd('Network.setCookies', {'cookies': session['Cookies']})
+
+    #Storage belongs to the portal origin, so it is written by the first portal document itself.
+    script_ID = ''
+    if session['Origin'] and (session['Local_Storage'] or session['Session_Storage']):
+        script_ID = driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+            'source': STORAGE_IMPORT_SCRIPT.format(
+                Origin = json.dumps(session['Origin']),
+                Local = json.dumps(session['Local_Storage']),
+                Session = json.dumps(session['Session_Storage'])
+            )
+        }).get('identifier', '')
+
+    with __imports_lock:
+        __imports[driver] = ('pending', script_ID)
+
+
+def ConfirmImport(driver:webdriver.Chrome, accepted_flag:bool) -> None:
+    """
+    Records whether the portal accepted the session imported into a driver and stops injecting
+    its storage into new pages.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+        - accepted_flag: A boolean indicating whether the portal loaded without asking for login.
+    """
+
+    with __imports_lock:
+        status, script_ID = __imports.get(driver, ('none', ''))
+        __imports[driver] = ('accepted' if accepted_flag else 'rejected', '')
+
+    if script_ID:
+        driver.execute_cdp_cmd('Page.removeScriptToEvaluateOnNewDocument', {'identifier': script_ID})
+
+
+def GetImportStatus(driver:webdriver.Chrome) -> str:
+    """
+    Returns the session import status string of a driver:
+        - 'none': No session was imported.
+        - 'pending': A session was imported and the portal wasn't loaded yet.
+        - 'accepted': The portal accepted the imported session.
+        - 'rejected': The portal asked for login, the driver logged in on its own.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+    """
+
+    with __imports_lock:
+        return __imports.get(driver, ('none', ''))[0]
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
@@ -0,0 +1,269 @@
+"""Keeps the portal session of idle drivers alive and renews it before it expires."""
+
+#Native Modules:
+import re
+import time
+import weakref
+import threading
+from typing import Callable
+from datetime import datetime
+
+#External Modules:
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+#Internal Modules:
+from HAF.Driver.DriverLock import GetDriverLock
+from HAF.Driver.LocatorHandler import InvalidateElements
+from HAF.Constants import Session, MicrosoftLogin, Wait, LogConstants
+
+#Global Constants:
+KEEPALIVE_SCRIPT = '''
+    var done = arguments[arguments.length - 1];
+    fetch(arguments[0], {credentials: 'include', cache: 'no-store', redirect: 'manual'})
+        .then(function(response) { done(response.type === 'opaqueredirect' ? 'redirect' : response.status); })
+        .catch(function(error) { done('error'); });
+'''
+
+
+class SessionKeeperClass():
+    """
+    Background thread that touches the portal every 'Session.INTERVAL' seconds while the driver is
+    idle, renewing the login as soon as the session is rejected or about to expire.\n
+    Checks only run while the driver lock is free and no ticket is in flight (see :mod:`IsYielded`),
+    tickets wait for a running renewal.
+    * Uses double undescore to specify private methods/attributes instead of the convenional single underscore.
+
+    Private Attributes:
+        - __driver: A weak reference to the loaded Chrome webdriver object.
+        - __renew: A callable that logs the driver in again.
+        - __stop_event: A threading event set to stop the keeper thread.
+        - __thread: The keeper thread, None if not started.
+        - __status: A dictionary with 'Last_Check', 'Expires_In', 'Renewals' and 'Last_Error' keys.
+        - __expiry: Expiry timestamp (float) of the earliest tracked cookie on the last check.
+        - __renewed_expiry: Cookie expiry timestamp (float) that was already renewed, expiries
+        the identity provider didn't extend aren't renewed again.
+    """
+
+    def __init__(self, driver:webdriver.Chrome, renew:Callable[[webdriver.Chrome], None]) -> None:
+        """
+        Creates a new SessionKeeperClass instance.
+
+        Arguments:
+            - driver: A loaded Chrome webdriver object.
+            - renew: A callable that receives the driver and logs it in again (see :mod:`RenewLogin()`).
+        """
+
+        self.__driver = weakref.ref(driver)
+        self.__renew = renew
+        self.__stop_event = threading.Event()
+        self.__thread:threading.Thread | None = None
+        self.__status = {'Last_Check': 'Never', 'Expires_In': None, 'Renewals': 0, 'Last_Error': 'None'}
+        self.__expiry:float | None = None
+        self.__renewed_expiry:float | None = None
+
+
+    @property
+    def GetStatus(self) -> dict:
+        """
+        Property: Gets a copy of the keeper status dictionary.
+
+        Usage:
+            >>> status:dict = keeper.GetStatus
+        """
+
+        return dict(self.__status)
+
+
+    def Start(self) -> None:
+        """Starts the keeper thread (if not running)."""
+
+        if self.__thread is None or not self.__thread.is_alive():
+            self.__stop_event.clear()
+            self.__thread = threading.Thread(target = self.__Loop, name = 'HAF-SessionKeeper', daemon = True)
+            self.__thread.start()
+
+
+    def Stop(self) -> None:
+        """Stops the keeper thread, a running check is finished first."""
+
+        self.__stop_event.set()
+        if self.__thread is not None and self.__thread is not threading.current_thread():
+            self.__thread.join()
+        self.__thread = None
+
+
+    def CheckSession(self, driver:webdriver.Chrome) -> tuple[str, float | None]:
+        """
+        Touches the portal and reads the session cookies expiry, must be called with the driver lock held.
+
+        Return:
+            - A (state, seconds to expiry) tuple, state being 'valid', 'expiring', 'expired' or
+            'unknown' (portal unreachable), the expiry is None if no tracked cookie expires.
+
+        Arguments:
+            - driver: A loaded Chrome webdriver object.
+
+        Dependencies:
+            - :mod:`__GetExpiry()`: For session cookies expiry.
+        """
+
+        expires_in = self.__GetExpiry(driver)
+
+        if driver.current_url.startswith(MicrosoftLogin.LOGIN_URL_PREFIX):
+            return ('expired', expires_in)
+
+        driver.set_script_timeout(Wait.ELEMENT_TIMEOUT)
+        match driver.execute_async_script(KEEPALIVE_SCRIPT, Session.KEEPALIVE_URL):
+            case 'redirect' | 401 | 403:
+                return ('expired', expires_in)
+            case 'error':
+                return ('unknown', expires_in)
+
+        if expires_in is not None and expires_in < Session.RENEW_MARGIN:
+            return ('expiring', expires_in)
+        return ('valid', expires_in)
+
+
+    def __GetExpiry(self, driver:webdriver.Chrome) -> float | None:
+        """
+        Private method: Gets the time (in seconds) left until the earliest tracked session cookie
+        expires, None if none of them has an expiry date (see 'Session.COOKIE_DOMAINS').
+
+        Arguments:
+            - driver: A loaded Chrome webdriver object.
+        """
+
+        cookies = driver.execute_cdp_cmd('Network.getAllCookies', {}).get('cookies', [])
+        expiries = [
+            float(cookie['expires']) for cookie in cookies
+            if float(cookie.get('expires', -1)) > 0
+            and str(cookie.get('domain', '')).lstrip('.') in Session.COOKIE_DOMAINS
+            and re.search(Session.COOKIE_NAME_PATTERN, str(cookie.get('name', '')))
+        ]
+
+        self.__expiry = min(expiries) if expiries else None
+        if self.__expiry is None or self.__expiry == self.__renewed_expiry:
+            return None #Already renewed, the identity provider keeps it as is.
+        return self.__expiry - time.time()
+
+
+    def __Renew(self, driver:webdriver.Chrome, state:str, expires_in:float | None) -> None:
+        """
+        Private method: Logs the driver in again and reports why, must be called with the driver lock held.
+
+        Arguments:
+            - driver: A loaded Chrome webdriver object.
+            - state: The session state string returned by :mod:`CheckSession()`.
+            - expires_in: The session expiry (in seconds) returned by :mod:`CheckSession()`.
+        """
+
+        reason = 'session expired' if state == 'expired' else f'session expiring in {expires_in / 60:.0f} minutes'
+        print(f'\n- Renewing portal login ({reason}).')
+
+        if state == 'expiring':
+            self.__renewed_expiry = self.__expiry
+
+        self.__renew(driver)
+        InvalidateElements(driver)
+        self.__status['Renewals'] += 1
+
+
+    def __Tick(self) -> float | None:
+        """
+        Private method: Runs one keeper check if the driver is idle.\n
+        Returns the delay (in seconds) until the next check, None if the driver is gone.
+
+        Dependencies:
+            - :mod:`CheckSession()`: For session state.
+            - :mod:`__Renew()`: For login renewal.
+        """
+
+        driver = self.__driver()
+        if driver is None:
+            return None
+
+        lock = GetDriverLock(driver)
+        if not lock.Acquire(False):
+            return Session.BUSY_RETRY
+
+        try:
+            if lock.IsYielded:
+                return Session.BUSY_RETRY
+
+            state, expires_in = self.CheckSession(driver)
+            if state in ('expired', 'expiring'):
+                self.__Renew(driver, state, expires_in)
+                state, expires_in = self.CheckSession(driver)
+
+            self.__status['Expires_In'] = expires_in
+            self.__status['Last_Error'] = 'None' if state != 'unknown' else 'Portal unreachable'
+        except WebDriverException as error:
+            self.__status['Last_Error'] = str(error.msg)
+        except Exception as error:
+            #Renewals fail with other exceptions (i.e. CircuitOpenError while the portal is down), the
+            #keeper keeps checking so the session is renewed once the portal is back.
+            self.__status['Last_Error'] = f'{type(error).__name__}: {error}'
+        finally:
+            self.__status['Last_Check'] = datetime.now().strftime(LogConstants.DATE_FORMAT)
+            lock.Release()
+
+        return Session.INTERVAL
+
+
+    def __Loop(self) -> None:
+        """
+        Private method: Keeper thread loop, checks are postponed by 'Session.BUSY_RETRY' seconds
+        while the driver is busy (the driver isn't referenced between checks).
+
+        Dependencies:
+            - :mod:`__Tick()`: For each check.
+        """
+
+        delay:float | None = Session.INTERVAL
+        while delay is not None and not self.__stop_event.wait(delay):
+            delay = self.__Tick()
+
+
+#Global keeper registry, entries are dropped with their drivers.
+__keepers:weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+__keepers_lock = threading.Lock()
+
+
+def StartSessionKeeper(driver:webdriver.Chrome, renew:Callable[[webdriver.Chrome], None]) -> SessionKeeperClass:
+    """
+    Starts the SessionKeeperClass instance of a driver, creating it on the first call.\n
+    Returns the running SessionKeeperClass instance.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+        - renew: A callable that receives the driver and logs it in again.
+    """
+
+    with __keepers_lock:
+        if driver not in __keepers:
+            __keepers[driver] = SessionKeeperClass(driver, renew)
+        keeper = __keepers[driver]
+
+    keeper.Start()
+    return keeper
+
+
+def StopSessionKeeper(driver:webdriver.Chrome) -> None:
+    """
+    Stops the SessionKeeperClass instance of a driver (if any), should be called before the driver quits.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+    """
+
+    with __keepers_lock:
+        keeper = __keepers.pop(driver, None)
+
+    if keeper is not None:
+        keeper.Stop()
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
@@ -0,0 +1,261 @@
+"""Splits the time of each named ticket step into server, render and idle time from inside the browser."""
+
+#Native Modules:
+import time
+import threading
+
+#External Modules:
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+#Internal Modules:
+from HAF.Metrics.Instruments import Observe
+from HAF.Driver.CommandTracer import TraceStep
+from HAF.FileHandler.JsonHandler import SaveJson
+from HAF.Constants import Profile, Paths, CLIConstants
+
+#Global Constants:
+PAGE_PERF_SCRIPT = '''
+    var state = window.__hafPerf;
+    if (!state) {
+        state = window.__hafPerf = {count: 0};
+        try { performance.setResourceTimingBufferSize(arguments[1]); } catch (error) {}
+        try {
+            new PerformanceObserver(function(list) {
+                state.count += list.getEntries().length;
+            }).observe({entryTypes: ['longtask']});
+        } catch (error) {}
+    }
+
+    var since = arguments[0];
+    var requests = [];
+    if (since !== null) {
+        if (performance.now() < since) { since = 0; }
+        performance.getEntriesByType('resource').forEach(function(entry) {
+            if (entry.responseEnd >= since) {
+                requests.push([Math.max(entry.requestStart || entry.startTime, since), entry.responseStart || entry.responseEnd]);
+            }
+        });
+        //The portal is never reloaded, a full buffer would hide every later request.
+        performance.clearResourceTimings();
+    }
+    return [performance.now(), state.count, requests];
+'''
+STEP_FIELDS = ('Wall', 'Server', 'Render', 'Idle', 'Requests', 'Long_Tasks')
+
+#Global Variables:
+__enabled = bool(Profile.ENABLED)
+__steps:dict[str, dict[str, float]] = {} #Totals of each profiled step, see 'STEP_FIELDS'.
+__steps_lock = threading.Lock()
+
+
+def __Snapshot(driver:webdriver.Chrome, since:float | None) -> dict:
+    """
+    Private function: Reads the browser counters of the current tab.\n
+    Returns a dictionary with the following keys (None if they couldn't be read):
+        - Time: The 'time.monotonic()' value once the snapshot was taken.
+        - Render: Total script, layout and style time (in seconds) of the tab, see 'Profile.RENDER_METRICS'.
+        - Page: A (page time in milliseconds, long task count, request list) tuple, the request list
+        has the [request start, response start] pairs of every resource answered after 'since' (page
+        time, in milliseconds).
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+        - since: The page time (in milliseconds) requests are listed from, None for no requests (the
+        resource timing buffer is cleared once they are listed).
+    """
+
+    snapshot = {'Time': 0.0, 'Render': None, 'Page': None}
+
+    try:
+        driver.execute_cdp_cmd('Performance.enable', {})
+        metrics = {
+            metric['name']: metric['value']
+            for metric in driver.execute_cdp_cmd('Performance.getMetrics', {}).get('metrics', [])
+        }
+        snapshot['Render'] = sum(float(metrics.get(name, 0)) for name in Profile.RENDER_METRICS)
+    except WebDriverException:
+        pass
+
+    try:
+        now, count, requests = driver.execute_script(PAGE_PERF_SCRIPT, since, Profile.RESOURCE_BUFFER_SIZE)
+        snapshot['Page'] = (float(now), int(count), list(requests))
+    except (WebDriverException, TypeError, ValueError):
+        pass
+
+    snapshot['Time'] = time.monotonic()
+    return snapshot
+
+
+def __UnionLength(intervals:list) -> float:
+    """
+    Private function: Gets the time covered by a list of intervals, overlapping requests are only counted once.\n
+    Returns the covered length, in the interval unit.
+
+    Arguments:
+        - intervals: A list of [start, end] pairs.
+    """
+
+    covered = 0.0
+    current_start = current_end = None
+
+    for start, end in sorted((float(start), float(end)) for start, end in intervals if end > start):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                covered += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+
+    if current_end is not None:
+        covered += current_end - current_start
+    return covered
+
+
+def StartProfiling() -> None:
+    """Starts profiling named ticket steps, totals profiled so far are kept."""
+
+    global __enabled
+    __enabled = True
+
+
+def StopProfiling() -> None:
+    """Stops profiling named ticket steps and saves their report to 'Paths.PERF_JSON_PATH'."""
+
+    global __enabled
+    __enabled = False
+    SaveJson(GetPerfReport(), Paths.PERF_JSON_PATH)
+
+
+def IsProfiling() -> bool:
+    """
+    Return:
+        - True if named ticket steps are being profiled.
+        - False otherwise.
+    """
+
+    return __enabled
+
+
+def StartStepCapture(driver:webdriver.Chrome) -> dict | None:
+    """
+    Takes the browser snapshot a named step is measured from, should be called as the step wait starts.\n
+    Returns the snapshot dictionary to be passed to :mod:`FinishStepCapture()`, None if profiling is off.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+
+    Dependencies:
+        - :mod:`__Snapshot()`: For browser counters.
+    """
+
+    if not __enabled:
+        return None
+    return __Snapshot(driver, None)
+
+
+def FinishStepCapture(driver:webdriver.Chrome, step:str, capture:dict | None) -> None:
+    """
+    Takes the browser snapshot a named step ends at and adds the step times to its totals, to the
+    'step_server', 'step_render' and 'step_idle' histograms next to 'step_seconds' (see Metrics package)
+    and to the step entry of the command trace while tracing (see CommandTracer module):
+        - Server: Time at least one resource answered during the step was awaited from the server.
+        - Render: Script, layout and style time of the tab.
+        - Idle: The rest of the step, time spent waiting on nothing (what shorter waits would save).
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object, on the same tab as the capture.
+        - step: A string with the step name.
+        - capture: The snapshot dictionary returned by :mod:`StartStepCapture()`, nothing is done for None.
+
+    Dependencies:
+        - :mod:`__Snapshot()`: For browser counters.
+        - :mod:`__UnionLength()`: For overlapping request time.
+        - :mod:`TraceStep()`: For the trace step entry.
+    """
+
+    if capture is None:
+        return
+
+    #The snapshots themselves aren't part of the step.
+    wall = time.monotonic() - capture['Time']
+    start_page = capture['Page']
+    end = __Snapshot(driver, start_page[0] if start_page else None)
+
+    #Counters restart on page loads, the whole new page is counted then.
+    render = 0.0
+    if capture['Render'] is not None and end['Render'] is not None:
+        render = end['Render'] - capture['Render'] if end['Render'] >= capture['Render'] else end['Render']
+
+    server = requests = long_tasks = 0
+    if start_page is not None and end['Page'] is not None:
+        now, count, request_list = end['Page']
+        server = __UnionLength(request_list) / 1000
+        requests = len(request_list)
+        long_tasks = count if now < start_page[0] else count - start_page[1]
+
+    #Browser and client clocks differ slightly, every time is kept within the step.
+    server = min(server, wall)
+    render = min(render, wall - server)
+    times = {
+        'Wall': wall,
+        'Server': server,
+        'Render': render,
+        'Idle': max(wall - server - render, 0.0),
+        'Requests': requests,
+        'Long_Tasks': long_tasks
+    }
+
+    with __steps_lock:
+        totals = __steps.setdefault(str(step), dict.fromkeys(STEP_FIELDS + ('Samples',), 0))
+        for field, value in times.items():
+            totals[field] += value
+        totals['Samples'] += 1
+
+    Observe('step_server_seconds', times['Server'], step = step)
+    Observe('step_render_seconds', times['Render'], step = step)
+    Observe('step_idle_seconds', times['Idle'], step = step)
+    TraceStep(step, time.perf_counter() - wall, wall, **{field.lower(): value for field, value in times.items() if field != 'Wall'})
+
+
+def GetPerfReport() -> list[dict]:
+    """
+    Returns a list with one dictionary per profiled step, with 'Step', 'Samples' and the average
+    'Wall', 'Server', 'Render', 'Idle', 'Requests' and 'Long_Tasks' of the step (times in seconds).
+    """
+
+    with __steps_lock:
+        return [
+            dict(
+                {field: totals[field] / totals['Samples'] for field in STEP_FIELDS},
+                Step = step,
+                Samples = int(totals['Samples'])
+            ) for step, totals in __steps.items() if totals['Samples']
+        ]
+
+
+def PrintPerfReport() -> None:
+    """
+    Prints the profiled steps ranked by their total server, render and idle time, the steps idle
+    the longest are the waits worth shortening.
+
+    Dependencies:
+        - :mod:`GetPerfReport()`: For step averages.
+    """
+
+    report = GetPerfReport()
+    if not report:
+        print('- No steps were profiled yet, use "perf start" and register some tickets first.\n')
+        return
+
+    print(CLIConstants.PERF_REPORT_HEADER.format(Samples = sum(step['Samples'] for step in report)))
+    for ranking in ('Server', 'Render', 'Idle'):
+        print(CLIConstants.PERF_REPORT_SECTION.format(Ranking = ranking.lower()))
+        for step in sorted(report, key = lambda step: -step[ranking] * step['Samples'])[:Profile.REPORT_ROWS]:
+            print(CLIConstants.PERF_REPORT_ROW.format(**step))
+    print('\n', end = '')
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
@@ -0,0 +1,213 @@
+"""Pipelines several calls through browser tabs of a single Chrome webdriver."""
+
+#Native Modules:
+import queue
+import threading
+from concurrent.futures import Future
+
+#External Modules:
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+#Internal Modules:
+from HAF.Driver.DriverLock import GetDriverLock
+from HAF.Driver.DriverHandler import ApplyResourceBlocking
+from HAF.Driver.PrefetchHandler import CloseSpareTab
+from HAF.Driver.RetryHandler import GetCircuitBreaker
+from HAF.FileHandler.Logger import LogClass
+from HAF.Ticket.TicketHandler import TicketProcessor
+from HAF.Constants import Pipeline
+
+
+class TabPipelineClass():
+    """
+    Runs one call per browser tab on a single Chrome webdriver, overlapping their page loads.\n
+    Only one tab drives the browser at a time, the driver is handed over to the next tab
+    whenever the active one reaches a safe wait point (see WaitHandler and DriverLock modules).
+    Chrome throttles background tabs of drivers loaded in 'standard' mode, 'background' or
+    'headless' modes should be used with pipelining.
+    * Uses double undescore to specify private methods/attributes instead of the convenional single underscore.
+
+    Private Attributes:
+        - __driver: A loaded Chrome webdriver object.
+        - __jobs: A queue of (Future, call data dictionary) tuples, None tells a worker to stop.
+        - __handles: A list of the window handle strings opened for this pipeline (spare tabs are
+        managed by the PrefetchHandler module).
+        - __workers: A list with one worker thread per tab.
+    """
+
+    def __init__(self, driver:webdriver.Chrome, tabs:int = Pipeline.TABS) -> None:
+        """
+        Creates a new TabPipelineClass instance, opening its tabs and starting its worker threads.
+
+        Arguments:
+            - driver: A loaded Chrome webdriver object, its current tab is left to the CLI/GUI.
+
+        Optional Arguments:
+            - tabs: Number (integer) of tabs (and calls in flight) of the pipeline.
+        """
+
+        self.__driver = driver
+        self.__jobs:queue.Queue[tuple[Future, dict] | None] = queue.Queue()
+        self.__handles:list[str] = []
+
+        #Opens the pipeline tabs and goes back to the home tab.
+        with GetDriverLock(driver):
+            home_handle = driver.current_window_handle
+
+            for i in range(max(1, int(tabs))):
+                driver.switch_to.new_window('tab')
+                ApplyResourceBlocking(driver)
+                self.__handles.append(driver.current_window_handle)
+
+            driver.switch_to.window(home_handle)
+
+        self.__workers = [
+            threading.Thread(target = self.__Worker, args = (handle,), name = f'HAF-Tab-{index}', daemon = True)
+            for index, handle in enumerate(self.__handles)
+        ]
+        for worker in self.__workers:
+            worker.start()
+
+
+    @property
+    def GetSize(self) -> int:
+        """
+        Returns the number of tabs in this pipeline.
+
+        Usage:
+            >>> size:int = pipeline.GetSize
+        """
+
+        return len(self.__handles)
+
+
+    @property
+    def GetPending(self) -> int:
+        """
+        Returns the approximate number of calls waiting for an idle tab.
+
+        Usage:
+            >>> pending:int = pipeline.GetPending
+        """
+
+        return self.__jobs.qsize()
+
+
+    def Submit(self, call_data:dict) -> Future:
+        """
+        Queues a call to be registered by the next idle tab.\n
+        Returns a Future that resolves to the LogClass object returned by :mod:`TicketProcessor()`.
+
+        Arguments:
+            - call_data: Dictionary with call data.
+        """
+
+        future = Future()
+        self.__jobs.put((future, dict(call_data)))
+        return future
+
+
+    def Shutdown(self) -> None:
+        """Stops every worker once the queued calls are processed and closes the pipeline tabs."""
+
+        for i in self.__workers:
+            self.__jobs.put(None)
+        for worker in self.__workers:
+            worker.join()
+
+        try:
+            with GetDriverLock(self.__driver):
+                home_handle = self.__driver.current_window_handle
+
+                for handle in self.__handles:
+                    self.__driver.switch_to.window(handle)
+                    self.__driver.close()
+
+                self.__driver.switch_to.window(home_handle)
+        except WebDriverException:
+            pass #Driver was already closed.
+
+
+    def __Worker(self, handle:str) -> None:
+        """
+        Private method: Worker thread loop, processes queued calls on its own tab.
+
+        Arguments:
+            - handle: The window handle string of the worker tab.
+        """
+
+        lock = GetDriverLock(self.__driver)
+        lock.BindTab(handle)
+
+        while True:
+            job = self.__jobs.get()
+            if job is None:
+                break
+
+            #Queued calls wait while the portal is down instead of failing one after another, the
+            #first one released runs the trial call while the others keep waiting for its outcome.
+            GetCircuitBreaker().WaitUntilClosed(claim_flag = True)
+
+            future, call_data = job
+            if not future.set_running_or_notify_cancel():
+                GetCircuitBreaker().ReleaseClaim()
+                continue
+
+            try:
+                log:LogClass | None = TicketProcessor(self.__driver, call_data)
+            except Exception as error:
+                GetCircuitBreaker().ReleaseClaim()
+                future.set_exception(error)
+            else:
+                GetCircuitBreaker().ReleaseClaim()
+                future.set_result(log)
+
+        #Tabs are swapped with their prefetched spare tabs, the current one is closed by Shutdown().
+        try:
+            CloseSpareTab(self.__driver)
+            self.__handles[self.__handles.index(handle)] = lock.GetBoundHandle
+        except WebDriverException:
+            pass #Driver was already closed.
+
+
+#Global shared pipeline, lazily started by GetTabPipeline().
+__pipeline:TabPipelineClass | None = None
+__pipeline_lock = threading.Lock()
+
+
+def GetTabPipeline(driver:webdriver.Chrome, start_flag:bool = True) -> TabPipelineClass | None:
+    """
+    Returns the TabPipelineClass instance shared by the program.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object, used if the pipeline has to be started.
+
+    Optional Arguments:
+        - start_flag: A boolean indicating whether the pipeline should be started if it isn't running,
+        None is returned for a stopped pipeline otherwise.
+    """
+
+    global __pipeline
+
+    with __pipeline_lock:
+        if __pipeline is None and start_flag:
+            __pipeline = TabPipelineClass(driver)
+    return __pipeline
+
+
+def ShutdownTabPipeline() -> None:
+    """Stops the shared tab pipeline (if started), waiting for queued calls to be processed."""
+
+    global __pipeline
+
+    with __pipeline_lock:
+        pipeline, __pipeline = __pipeline, None
+
+    if pipeline is not None:
+        pipeline.Shutdown()
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
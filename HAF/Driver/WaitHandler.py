@@ -0,0 +1,317 @@
+"""Condition-based waits for Fenix ITSM portal and Microsoft login pages."""
+
+#Native Modules:
+import time
+from typing import Callable, Any
+
+#External Modules:
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import WebDriverException, TimeoutException
+
+#Internal Modules:
+from HAF.Driver.DriverLock import GetDriverLock
+from HAF.Driver.StepProfiler import StartStepCapture, FinishStepCapture
+from HAF.FileHandler.Latency import GetLatencyProfile
+from HAF.Constants import Wait
+
+#Global Constants:
+XHR_TRACKER_SCRIPT = '''
+    if (!window.__hafXHR) {
+        window.__hafXHR = {pending: 0, last: Date.now()};
+        var send = XMLHttpRequest.prototype.send;
+        XMLHttpRequest.prototype.send = function() {
+            window.__hafXHR.pending++;
+            window.__hafXHR.last = Date.now();
+            this.addEventListener('loadend', function() {
+                window.__hafXHR.pending--;
+                window.__hafXHR.last = Date.now();
+            });
+            return send.apply(this, arguments);
+        };
+    }
+    return Date.now() - window.__hafXHR.last >= arguments[0] && window.__hafXHR.pending <= 0;
+'''
+ANGULAR_SETTLED_SCRIPT = '''
+    if (!window.angular) { return document.readyState === 'complete'; }
+    try {
+        var injector = window.angular.element(document.body).injector();
+        if (!injector) { return document.readyState === 'complete'; }
+        var root = injector.get('$rootScope');
+        return !root.$$phase && injector.get('$http').pendingRequests.length === 0;
+    } catch (error) {
+        return document.readyState === 'complete';
+    }
+'''
+
+
+def WaitUntil(
+    driver:webdriver.Chrome,
+    condition:Callable[[webdriver.Chrome], Any],
+    timeout:float,
+    poll_frequency:float = Wait.POLL_FREQUENCY,
+    raise_on_timeout:bool = True,
+    message:str = '',
+    step:str = '',
+    safe_point:bool = True
+) -> Any:
+    """
+    Polls 'condition' until it returns a truthy value or the deadline is reached.\n
+    Returns the last value returned by 'condition' (falsy if the deadline was reached
+    and 'raise_on_timeout' is False).
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+        - condition: A callable that receives the driver and returns a truthy value once the
+        awaited state is reached, WebDriverExceptions raised by it count as a falsy result.
+        - timeout: Deadline (in seconds) for the wait, works as an upper bound.
+
+    Optional Arguments:
+        - poll_frequency: Time (in seconds) between each poll, the polling budget of the wait
+        is 'timeout / poll_frequency' calls to 'condition'.
+        - raise_on_timeout: A boolean indicating whether a TimeoutException should be raised
+        once the deadline is reached.
+        - message: A string added to the TimeoutException message.
+        - step: A string naming the ticket step being awaited, named waits use the live timeout
+        from the latency profile instead of 'timeout' and record how long they took (waits that
+        raise on timeout only ever extend 'timeout', as giving up early would fail the ticket), they
+        are profiled from inside the browser as well while profiling is on (see StepProfiler module).
+        - safe_point: A boolean indicating whether other threads may use the driver (and switch
+        tabs) between polls, should be False while keyboard navigation is in progress.
+    """
+
+    lock = GetDriverLock(driver)
+
+    capture = None
+    default_timeout = float(timeout)
+    if step:
+        live_timeout = GetLatencyProfile().GetTimeout(step, timeout)
+        timeout = max(live_timeout, timeout) if raise_on_timeout else live_timeout
+        capture = StartStepCapture(driver)
+
+    start = time.monotonic()
+    deadline = start + float(timeout)
+    result = None
+
+    while True:
+        try:
+            result = condition(driver)
+        except WebDriverException:
+            result = None
+
+        if result:
+            break
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+
+        #Hands the driver over to other tabs while idle, see DriverLock module.
+        if safe_point and lock.IsOwned:
+            lock.Yield(min(poll_frequency, remaining))
+        else:
+            time.sleep(min(poll_frequency, remaining))
+
+    #Timed out waits count as the hand-tuned timeout, so slow periods raise the live timeout back
+    #to it right away without steps that never settle growing it every round.
+    if step:
+        GetLatencyProfile().Record(step, time.monotonic() - start, None if result else default_timeout)
+        FinishStepCapture(driver, step, capture)
+
+    if result or not raise_on_timeout:
+        return result
+    else:
+        raise TimeoutException(f'Condition not met after {timeout} seconds. {message}'.strip())
+
+
+def WaitForClickable(
+    driver:webdriver.Chrome,
+    xpath:str,
+    timeout:float = Wait.ELEMENT_TIMEOUT,
+    step:str = '',
+    by:str = By.XPATH,
+    candidate:WebElement | None = None
+) -> WebElement:
+    """
+    Waits for an element to be displayed and enabled.\n
+    Returns the found WebElement.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+        - xpath: XPath string of the awaited element.
+
+    Optional Arguments:
+        - timeout: Deadline (in seconds) for the wait.
+        - step: A string naming the ticket step being awaited, see :mod:`WaitUntil()`.
+        - by: The Selenium By strategy of 'xpath', allows CSS selectors to be awaited as well.
+        - candidate: A WebElement found earlier for 'xpath', checked before looking the element up
+        again on each poll (it's dropped once stale).
+    """
+
+    def __Clickable(driver:webdriver.Chrome) -> WebElement | None:
+        nonlocal candidate
+
+        if candidate is not None:
+            try:
+                if candidate.is_displayed() and candidate.is_enabled():
+                    return candidate
+            except WebDriverException:
+                candidate = None #Stale element, the page was reloaded or re-rendered.
+
+        for element in driver.find_elements(by, xpath):
+            if element.is_displayed() and element.is_enabled():
+                return element
+        return None
+
+    return WaitUntil(driver, __Clickable, timeout, message = f'Element "{xpath}" is not clickable.', step = step)
+
+
+def WaitForURLChange(driver:webdriver.Chrome, old_url:str, timeout:float, raise_on_timeout:bool = True, step:str = '') -> str:
+    """
+    Waits for the current URL to differ from 'old_url'.\n
+    Returns the new URL.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+        - old_url: The URL string before the awaited navigation.
+        - timeout: Deadline (in seconds) for the wait.
+
+    Optional Arguments:
+        - raise_on_timeout: A boolean indicating whether a TimeoutException should be raised
+        once the deadline is reached.
+        - step: A string naming the ticket step being awaited, see :mod:`WaitUntil()`.
+    """
+
+    WaitUntil(
+        driver,
+        lambda driver: driver.current_url != old_url,
+        timeout,
+        raise_on_timeout = raise_on_timeout,
+        message = f'URL did not change from "{old_url}".',
+        step = step
+    )
+    return driver.current_url
+
+
+def WaitForURLPrefix(driver:webdriver.Chrome, prefix:str, timeout:float, raise_on_timeout:bool = True, step:str = '') -> str:
+    """
+    Waits for the current URL to start with 'prefix'.\n
+    Returns the current URL.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+        - prefix: The URL prefix string that is awaited.
+        - timeout: Deadline (in seconds) for the wait.
+
+    Optional Arguments:
+        - raise_on_timeout: A boolean indicating whether a TimeoutException should be raised
+        once the deadline is reached.
+        - step: A string naming the ticket step being awaited, see :mod:`WaitUntil()`.
+    """
+
+    WaitUntil(
+        driver,
+        lambda driver: driver.current_url.startswith(prefix),
+        timeout,
+        raise_on_timeout = raise_on_timeout,
+        message = f'URL did not reach "{prefix}".',
+        step = step
+    )
+    return driver.current_url
+
+
+def WaitForXHRIdle(
+    driver:webdriver.Chrome,
+    timeout:float,
+    quiet_period:float = Wait.XHR_QUIET_PERIOD,
+    step:str = '',
+    safe_point:bool = True
+) -> bool:
+    """
+    Waits for the page XHR traffic to go quiet, the tracker is installed on the first poll
+    so requests sent before it are not awaited.\n
+    Returns True if the page went quiet before the deadline, False otherwise.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+        - timeout: Deadline (in seconds) for the wait, works as an upper bound.
+
+    Optional Arguments:
+        - quiet_period: Time (in seconds) without any XHR activity for the page to be considered idle.
+        - step: A string naming the ticket step being awaited, see :mod:`WaitUntil()`.
+        - safe_point: A boolean indicating whether the driver may be used by other threads, see :mod:`WaitUntil()`.
+    """
+
+    return bool(WaitUntil(
+        driver,
+        lambda driver: driver.execute_script(XHR_TRACKER_SCRIPT, int(quiet_period * 1000)),
+        timeout,
+        raise_on_timeout = False,
+        step = step,
+        safe_point = safe_point
+    ))
+
+
+def WaitForAngular(driver:webdriver.Chrome, timeout:float, step:str = '', safe_point:bool = True) -> bool:
+    """
+    Waits for the AngularJS digest cycle to settle with no pending $http requests.\n
+    Returns True if Angular settled before the deadline, False otherwise.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+        - timeout: Deadline (in seconds) for the wait, works as an upper bound.
+
+    Optional Arguments:
+        - step: A string naming the ticket step being awaited, see :mod:`WaitUntil()`.
+        - safe_point: A boolean indicating whether the driver may be used by other threads, see :mod:`WaitUntil()`.
+    """
+
+    return bool(WaitUntil(
+        driver,
+        lambda driver: driver.execute_script(ANGULAR_SETTLED_SCRIPT),
+        timeout,
+        raise_on_timeout = False,
+        step = step,
+        safe_point = safe_point
+    ))
+
+
+def WaitForPageReady(driver:webdriver.Chrome, timeout:float, step:str = '') -> bool:
+    """
+    Waits for both the Angular digest cycle and the XHR traffic to settle, sharing a single deadline.\n
+    Returns True if the page settled before the deadline, False otherwise.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+        - timeout: Deadline (in seconds) for the wait, works as an upper bound.
+
+    Optional Arguments:
+        - step: A string naming the ticket step being awaited, see :mod:`WaitUntil()`.
+
+    Dependencies:
+        - :mod:`WaitForAngular()`: For Angular digest settling.
+        - :mod:`WaitForXHRIdle()`: For XHR traffic settling.
+        - :mod:`StartStepCapture()`: For browser-side step profiling.
+    """
+
+    capture = None
+    default_timeout = float(timeout)
+    if step:
+        timeout = GetLatencyProfile().GetTimeout(step, timeout)
+        capture = StartStepCapture(driver)
+
+    start = time.monotonic()
+    ready = WaitForAngular(driver, timeout)
+    if ready:
+        ready = WaitForXHRIdle(driver, max(0, timeout - (time.monotonic() - start)))
+
+    if step:
+        GetLatencyProfile().Record(step, time.monotonic() - start, None if ready else default_timeout)
+        FinishStepCapture(driver, step, capture)
+    return ready
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
@@ -0,0 +1,248 @@
+"""Defines and handles JournalClass objects."""
+
+#Native Modules:
+import os
+import uuid
+import threading
+from datetime import datetime
+
+#Internal Modules:
+from HAF.FileHandler.JsonHandler import *
+from HAF.Constants import Paths, LogConstants
+
+
+class JournalClass():
+    """
+    Durable record of the steps a ticket went through, so an interrupted ticket can be resumed on
+    its existing ticket ID instead of being created again.\n
+    Each journal is stored in its own file inside 'Paths.JOURNAL_FOLDER_PATH' and removed once the
+    ticket is registered, journals are claimed while being processed (see :mod:`ClaimJournal()`) so
+    they are never resumed twice.
+    * Uses double undescore to specify private methods/attributes instead of the convenional single underscore.
+
+    Private Attributes:
+        - __journal_ID: String naming the journal file.
+        - __call_data: Call data dictionary the ticket is being processed with.
+        - __ticket_ID: String of the ticket ID, empty until the ticket is created.
+        - __steps: A list of dictionaries with the completed 'Step' names and their 'Time'.
+        - __time: String indicating date and hour of the journal creation.
+    """
+
+    def __init__(self, call_data:dict | None = None, journal_ID:str = '') -> None:
+        """
+        Creates a new instance of JournalClass.
+
+        Optional Arguments:
+            - call_data: Call data dictionary of a new journal (ignored if journal_ID is passed).
+            - journal_ID: String with the ID of a stored journal to be loaded.
+
+        Dependencies:
+            - :mod:`__Load()`: For stored journal loading.
+        """
+
+        if journal_ID:
+            self.__Load(journal_ID)
+        else:
+            self.__journal_ID = f'{datetime.now():%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:6]}'
+            self.__call_data = dict(call_data or {})
+            self.__ticket_ID = ''
+            self.__steps:list[dict] = []
+            self.__time = datetime.now().strftime(LogConstants.DATE_FORMAT)
+
+
+    @property
+    def GetJournalID(self) -> str:
+        """
+        Property: Gets __journal_ID string from this instance.
+
+        Usage:
+            >>> journal_ID:str = journal.GetJournalID
+        """
+
+        return self.__journal_ID
+
+
+    @property
+    def GetCallData(self) -> dict:
+        """
+        Property: Gets __call_data dictionary from this instance.
+
+        Usage:
+            >>> call_data:dict = journal.GetCallData
+        """
+
+        return self.__call_data
+
+
+    @property
+    def GetTicketID(self) -> str:
+        """
+        Property: Gets __ticket_ID string from this instance.
+
+        Usage:
+            >>> ticket_ID:str = journal.GetTicketID
+        """
+
+        return self.__ticket_ID
+
+
+    @property
+    def GetLastStep(self) -> str:
+        """
+        Property: Gets the name of the last completed step, empty if none was completed.
+
+        Usage:
+            >>> step:str = journal.GetLastStep
+        """
+
+        return self.__steps[-1]['Step'] if self.__steps else ''
+
+
+    @property
+    def GetTime(self) -> str:
+        """
+        Property: Gets __time string from this instance.
+
+        Usage:
+            >>> time:str = journal.GetTime
+        """
+
+        return self.__time
+
+
+    def IsDone(self, step:str) -> bool:
+        """
+        Returns True if 'step' was already completed.
+
+        Arguments:
+            - step: A step name string, see Journal class in Constants module.
+        """
+
+        return any(entry['Step'] == step for entry in self.__steps)
+
+
+    def Checkpoint(self, step:str, ticket_ID:str = '') -> None:
+        """
+        Records a completed step and writes the journal to disk before returning.
+
+        Arguments:
+            - step: A step name string, see Journal class in Constants module.
+
+        Optional Arguments:
+            - ticket_ID: String with the ticket ID, should be passed once the ticket is created.
+
+        Dependencies:
+            - :mod:`__Save()`: For journal file writing.
+        """
+
+        if ticket_ID:
+            self.__ticket_ID = str(ticket_ID)
+
+        if not self.IsDone(step):
+            self.__steps.append({'Step': str(step), 'Time': datetime.now().strftime(LogConstants.DATE_FORMAT)})
+        self.__Save()
+
+
+    def Finish(self) -> None:
+        """Removes the journal file, should be called once the ticket is registered."""
+
+        try:
+            os.remove(Paths.JOURNAL_FOLDER_PATH + self.__journal_ID + '.json')
+        except FileNotFoundError:
+            pass #No step was checkpointed.
+
+
+    def __Save(self) -> None:
+        """Durably writes this instance to its journal file."""
+
+        os.makedirs(Paths.JOURNAL_FOLDER_PATH, exist_ok = True)
+        SaveJson({
+            'Time': self.__time,
+            'Ticket_ID': self.__ticket_ID,
+            'Steps': self.__steps,
+            'Call_Data': self.__call_data
+        }, Paths.JOURNAL_FOLDER_PATH + self.__journal_ID + '.json', True)
+
+
+    def __Load(self, journal_ID:str) -> None:
+        """
+        Updates current instance information with a journal file data.
+
+        Arguments:
+            - journal_ID: String with the ID of the stored journal.
+        """
+
+        journal_json = LoadJson(Paths.JOURNAL_FOLDER_PATH + journal_ID + '.json')
+
+        self.__journal_ID = str(journal_ID)
+        self.__call_data = dict(journal_json['Call_Data'])
+        self.__ticket_ID = str(journal_json['Ticket_ID'])
+        self.__steps = list(journal_json['Steps'])
+        self.__time = journal_json['Time']
+
+
+#IDs of the journals being processed in this process, see ClaimJournal().
+__active:set[str] = set()
+__active_lock = threading.Lock()
+
+
+def ClaimJournal(journal:JournalClass) -> bool:
+    """
+    Marks a journal as being processed in this process, until :mod:`ReleaseJournal()` is called.
+
+    Return:
+        - True if the journal was claimed.
+        - False if it's already being processed (i.e. by a pool or pipeline worker).
+
+    Arguments:
+        - journal: The JournalClass object to be claimed.
+    """
+
+    with __active_lock:
+        if journal.GetJournalID in __active:
+            return False
+        __active.add(journal.GetJournalID)
+        return True
+
+
+def ReleaseJournal(journal:JournalClass) -> None:
+    """
+    Unmarks a journal claimed by :mod:`ClaimJournal()`, should be called once its run ends.
+
+    Arguments:
+        - journal: The JournalClass object to be released.
+    """
+
+    with __active_lock:
+        __active.discard(journal.GetJournalID)
+
+
+def GetPendingJournals() -> list[JournalClass]:
+    """
+    Returns the JournalClass objects of every interrupted ticket, newest first (unreadable journal
+    files and journals still being processed are skipped).
+    """
+
+    try:
+        file_names = os.listdir(Paths.JOURNAL_FOLDER_PATH)
+    except FileNotFoundError:
+        return []
+
+    journals = []
+    for file_name in sorted(file_names, reverse = True): #Journal IDs start with their creation time.
+        if file_name.endswith('.json'):
+            with __active_lock:
+                if file_name.removesuffix('.json') in __active:
+                    continue
+
+            try:
+                journals.append(JournalClass(journal_ID = file_name.removesuffix('.json')))
+            except (OSError, ValueError, KeyError):
+                continue
+
+    return journals
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
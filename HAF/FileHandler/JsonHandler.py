@@ -1,7 +1,14 @@
 """Manages JSON files read and write."""
 
 #Native Modules:
+import os
 import json
+import threading
+from types import MappingProxyType
+
+#Global Variables:
+__cache:dict[str, tuple[int, int, object]] = {} #Read-only views of cached files, with the (mtime, size) they were read at.
+__cache_lock = threading.Lock()
 
 
 def LoadJson(path:str) -> dict:
@@ -20,18 +27,80 @@ def LoadJson(path:str) -> dict:
     return data
 
 
-def SaveJson(data:dict, path:str) -> None:
+def __Freeze(data:object) -> object:
+    """
+    Private function: Converts decoded JSON data into a read-only view, dictionaries become
+    MappingProxyType objects and lists become tuples.\n
+    Returns the read-only data.
+
+    Arguments:
+        - data: The decoded JSON data.
+    """
+
+    if isinstance(data, dict):
+        return MappingProxyType({key: __Freeze(value) for key, value in data.items()})
+    if isinstance(data, list):
+        return tuple(__Freeze(value) for value in data)
+    return data
+
+
+def LoadCachedJson(path:str) -> MappingProxyType:
+    """
+    Manages read-only Json file reading, the file is only parsed again once its modification time or
+    size changes (or it's written by :mod:`SaveJson()`).\n
+    Returns a read-only view of the loaded JSON file data (nested dictionaries are read-only and lists
+    are tuples), :mod:`LoadJson()` should be used for data that will be changed and saved back.
+
+    Arguments:
+        - path: A string indicating what file should be loaded.
+
+    Dependencies:
+        - :mod:`__Freeze()`: For read-only view creation.
+    """
+
+    key = os.path.normcase(os.path.abspath(path))
+    status = os.stat(path)
+
+    with __cache_lock:
+        cached = __cache.get(key)
+    if cached is not None and cached[:2] == (status.st_mtime_ns, status.st_size):
+        return cached[2]
+
+    data = __Freeze(LoadJson(path))
+    with __cache_lock:
+        __cache[key] = (status.st_mtime_ns, status.st_size, data)
+    return data
+
+
+def SaveJson(data:dict, path:str, durable_flag:bool = False) -> None:
     """
     Manages Json file writing.
 
     Arguments:
         - data: A dictionary containing the updated data to be stored.
         - path: String indicating what file should be overwrited.
+
+    Optional Arguments:
+        - durable_flag: A boolean indicating whether the file should be written to a temporary file,
+        flushed to disk and then swapped in, so a crash never leaves it half written.
     """
 
-    with open(path, 'w', encoding = 'utf-8') as file:
+    #Writes within the file timestamp resolution wouldn't be noticed by LoadCachedJson().
+    with __cache_lock:
+        __cache.pop(os.path.normcase(os.path.abspath(path)), None)
+
+    if not durable_flag:
+        with open(path, 'w', encoding = 'utf-8') as file:
+            json.dump(data, file, indent = 4, ensure_ascii = False)
+        file.close()
+        return
+
+    temporary_path = path + '.tmp'
+    with open(temporary_path, 'w', encoding = 'utf-8') as file:
         json.dump(data, file, indent = 4, ensure_ascii = False)
-    file.close()
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary_path, path)
 
 
 #This is NOT a script file.
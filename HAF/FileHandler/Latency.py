@@ -0,0 +1,169 @@
+"""Defines and handles LatencyClass objects."""
+
+#Native Modules:
+import os
+import math
+import threading
+
+#Internal Modules:
+from HAF.FileHandler.JsonHandler import *
+from HAF.Metrics.Instruments import Observe
+from HAF.Constants import Paths, Latency
+
+
+class LatencyClass():
+    """
+    Keeps a rolling window of observed readiness times for each ticket step and derives
+    live timeouts from them.
+    * Uses double undescore to specify private methods/attributes instead of the convenional single underscore.
+
+    Private Attributes:
+        - __samples: A dictionary of step names and their list of observed times (in seconds).
+        - __timing_out: A set of the step names whose last wait timed out, they never get a live
+        timeout below their hand-tuned one until a wait succeeds again.
+        - __lock: A threading lock guarding '__samples' and '__timing_out', steps may be recorded by
+        several drivers.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates a new instance of LatencyClass with the samples stored in 'latency.json' file
+        (if existent).
+        """
+
+        self.__lock = threading.Lock()
+        self.__timing_out:set[str] = set()
+
+        try:
+            self.__samples:dict[str, list[float]] = dict(LoadJson(Paths.LATENCY_JSON_PATH))
+        except (OSError, ValueError):
+            self.__samples = {}
+
+
+    def Record(self, step:str, seconds:float, timeout_default:float | None = None) -> None:
+        """
+        Adds a new observed time to a step window, dropping the oldest samples once the
+        window is full.
+
+        Arguments:
+            - step: A string with the step name.
+            - seconds: Time (in seconds) the step took to become ready.
+
+        Optional Arguments:
+            - timeout_default: The hand-tuned timeout (in seconds) of a wait that timed out, it's
+            recorded instead of 'seconds' (slow periods raise the live timeout back to the hand-tuned
+            one, steps that never settle can't grow it past that) and the step timeout doesn't go
+            below it until a wait succeeds again.
+        """
+
+        sample = float(seconds) if timeout_default is None else float(timeout_default)
+
+        with self.__lock:
+            window = self.__samples.setdefault(str(step), [])
+            window.append(round(sample, 3))
+            del window[:-Latency.WINDOW_SIZE]
+
+            if timeout_default is None:
+                self.__timing_out.discard(str(step))
+            else:
+                self.__timing_out.add(str(step))
+
+        Observe('step_seconds', seconds, step = step)
+
+
+    def GetPercentile(self, step:str, percentile:float = Latency.PERCENTILE) -> float | None:
+        """
+        Gets the nearest-rank percentile of a step window.
+
+        Return:
+            - None if the step has less than 'Latency.MIN_SAMPLES' samples.
+            - The percentile value (in seconds) otherwise.
+
+        Arguments:
+            - step: A string with the step name.
+
+        Optional Arguments:
+            - percentile: The percentile (0 to 100) that should be calculated.
+        """
+
+        with self.__lock:
+            window = sorted(self.__samples.get(str(step), []))
+
+        if len(window) < Latency.MIN_SAMPLES:
+            return None
+
+        rank = max(math.ceil(percentile / 100 * len(window)), 1)
+        return window[rank - 1]
+
+
+    def GetTimeout(self, step:str, default:float) -> float:
+        """
+        Gets the live timeout of a step, calculated as its percentile plus the configured margin.\n
+        Returns 'default' while there aren't enough samples, the result is kept between
+        'Latency.MIN_TIMEOUT' and 'default * Latency.MAX_FACTOR' (and never below 'default' while
+        the step is timing out).
+
+        Arguments:
+            - step: A string with the step name.
+            - default: The hand-tuned timeout (in seconds) for the step.
+
+        Dependencies:
+            - :mod:`GetPercentile()`: For percentile calculation.
+        """
+
+        percentile = self.GetPercentile(step)
+        if percentile is None:
+            return float(default)
+
+        timeout = percentile * (1 + Latency.MARGIN)
+        with self.__lock:
+            if str(step) in self.__timing_out:
+                timeout = max(timeout, float(default))
+
+        return min(max(timeout, Latency.MIN_TIMEOUT), float(default) * Latency.MAX_FACTOR)
+
+
+    def Save(self) -> None:
+        """Writes the current samples to 'latency.json' file."""
+
+        with self.__lock:
+            os.makedirs(os.path.dirname(Paths.LATENCY_JSON_PATH), exist_ok = True)
+            SaveJson(self.__samples, Paths.LATENCY_JSON_PATH)
+
+
+#Global shared instance, lazily loaded by GetLatencyProfile().
+__profile:LatencyClass | None = None
+__profile_lock = threading.Lock()
+
+
+def GetLatencyProfile() -> LatencyClass:
+    """Returns the LatencyClass instance shared by every driver, loading it on the first call."""
+
+    global __profile
+
+    with __profile_lock:
+        if __profile is None:
+            __profile = LatencyClass()
+    return __profile
+
+
+def SetLatencyProfile(profile:LatencyClass | None) -> LatencyClass | None:
+    """
+    Replaces the LatencyClass instance shared by every driver, so benchmark samples are kept out
+    of the live profile.\n
+    Returns the replaced instance, None if it wasn't loaded yet.
+
+    Arguments:
+        - profile: The LatencyClass instance to be shared, None to load it from file on the next call.
+    """
+
+    global __profile
+
+    with __profile_lock:
+        previous, __profile = __profile, profile
+    return previous
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
@@ -2,11 +2,16 @@
 
 #Native Modules:
 from datetime import datetime
+import threading
 
 #Internal Modules:
 from HAF.FileHandler.JsonHandler import *
 from HAF.Constants import Paths, LogConstants
 from HAF.FileHandler.Config import ConfigClass
+from HAF.Metrics.Instruments import Instrumented
+
+#Global Constants:
+REGISTER_LOCK = threading.Lock() #Log, counter and persistent files may be updated by several drivers.
 
 
 class LogClass():
@@ -23,7 +28,7 @@ class LogClass():
         - __config: A loaded ConfigClass object.
     """
 
-    def __init__(self, log_type:int, ticket_ID:str = '') -> None:
+    def __init__(self, log_type:int, ticket_ID:str = '', call_data:dict | None = None) -> None:
         """
         Creates a new instance of LogClass.
 
@@ -34,6 +39,8 @@ class LogClass():
         Optional Arguments:
             - ticket_ID: String witht he ticket ID to be assigned to __ticket_ID (should be passed if 
             log_type is not 4).
+            - call_data: Call data dictionary assigned to __call_data, defaults on loading 'call.json'
+            file (ignored if log_type is 4).
 
         Dependencies:
             - :mod:`__LoadPersistent()`: For persistent file loading.
@@ -46,11 +53,11 @@ class LogClass():
             self.__log_type = int(log_type)
             self.__ticket_ID = str(ticket_ID)
 
-            self.__call_data = LoadJson(Paths.CALL_JSON_PATH)
+            self.__call_data = LoadJson(Paths.CALL_JSON_PATH) if call_data is None else dict(call_data)
 
             self.__time = datetime.now().strftime(LogConstants.DATE_FORMAT)
 
-        self.__ticket_data:dict = LoadJson(Paths.DICTIONARY_JSON_PATH)[self.__call_data['Required']['Call_Type']]
+        self.__ticket_data:dict = LoadCachedJson(Paths.DICTIONARY_JSON_PATH)[self.__call_data['Required']['Call_Type']]
 
         self.__config = ConfigClass()
 
@@ -101,6 +108,7 @@ class LogClass():
         )
 
 
+    @Instrumented('log_register')
     def Register(self) -> None:
         """
         Logs this intance to file and calls for persistent file update.
@@ -110,15 +118,16 @@ class LogClass():
             - :mod:`__SavePersistent()`: For persistent file update.
         """
 
-        with open(Paths.LOG_TXT_PATH, 'a') as logfile:
-            logfile.write(
-                LogConstants.LOG_DIVIDER + '\n' +
-                self.ConvertToString() + 
-                LogConstants.LOG_DIVIDER + '\n\n\n'
-            )
+        with REGISTER_LOCK:
+            with open(Paths.LOG_TXT_PATH, 'a') as logfile:
+                logfile.write(
+                    LogConstants.LOG_DIVIDER + '\n' +
+                    self.ConvertToString() + 
+                    LogConstants.LOG_DIVIDER + '\n\n\n'
+                )
 
-        self.__config.UpdateCounter()
-        self.__SavePersistent()
+            self.__config.UpdateCounter()
+            self.__SavePersistent()
 
 
     def __SavePersistent(self) -> None:
@@ -15,7 +15,7 @@ from selenium import webdriver
 #Internal Modules:
 from HAF.GUI.CallHandler.CallEditor import NewCall
 from HAF.Constants import Paths, GUIConstants, URL
-from HAF.FileHandler.JsonHandler import LoadJson
+from HAF.FileHandler.JsonHandler import LoadJson, LoadCachedJson
 from HAF.FileHandler.Config import ConfigClass
 from HAF import __version__ as HAFVersion
 
@@ -345,7 +345,7 @@ class CallTab(tk.Frame):
         self.__StatusBar = StatusBar
         self.__lang = dict(selected_language)
 
-        self.__call_dictionary = LoadJson(Paths.DICTIONARY_JSON_PATH)
+        self.__call_dictionary = LoadCachedJson(Paths.DICTIONARY_JSON_PATH)
         self.__usernamecash = []
 
         self.__valid_user_ID_flag = bool(False)
@@ -1163,7 +1163,7 @@ class TemplateTab(tk.Frame): #TODO: All
         super().__init__()
 
         self.__lang = dict(selected_language)
-        self.__call_dictionary = LoadJson(Paths.DICTIONARY_JSON_PATH)
+        self.__call_dictionary = LoadCachedJson(Paths.DICTIONARY_JSON_PATH)
 
         self.master = FatherTab
 
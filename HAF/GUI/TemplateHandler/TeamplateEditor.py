@@ -5,15 +5,18 @@ from HAF.Constants import Paths
 from HAF.FileHandler.JsonHandler import *
 
 
-def SortDictionary(unsorteddict:dict = LoadJson(Paths.DICTIONARY_JSON_PATH)) -> None:
+def SortDictionary(unsorteddict:dict | None = None) -> None:
     """
     Reorganizes template dictionary in alphabetical order.
     
     Arguments:
-        - unsorteddict: a loaded template dictionary, defaults on loading the file,
+        - unsorteddict: a loaded template dictionary, defaults on loading the file when called,
         but can be passed as an argument for recent changes.
     """
 
+    if unsorteddict is None:
+        unsorteddict = LoadJson(Paths.DICTIONARY_JSON_PATH)
+
     sorteddict = {}
     sortedkeys = sorted(unsorteddict.keys(), key = lambda x:x.lower())
 
@@ -0,0 +1,187 @@
+"""Serves the recorded metrics in Prometheus text format on localhost and snapshots them to file."""
+
+#Native Modules:
+import os
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+#Internal Modules:
+from HAF.Metrics.Instruments import GetInstruments, SetMetricsEnabled, IsMetricsEnabled
+from HAF.Constants import Metrics, Paths
+
+#Global Constants:
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+#Global Variables:
+__server:ThreadingHTTPServer | None = None
+__server_lock = threading.Lock()
+
+
+def __FormatLabels(labels:tuple, extra:tuple = ()) -> str:
+    """
+    Private function: Formats a label tuple as a Prometheus label set.\n
+    Returns the label set string (i.e. '{outcome="ok"}'), empty if there are no labels.
+
+    Arguments:
+        - labels: A tuple of (label, value) pairs.
+
+    Optional Arguments:
+        - extra: A tuple of (label, value) pairs appended after 'labels' (i.e. the 'le' bucket label).
+    """
+
+    pairs = [
+        '{}="{}"'.format(label, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for label, value in labels + extra
+    ]
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def __FormatNumber(value:float) -> str:
+    """
+    Private function: Formats a sample value, integers are written without decimals.\n
+    Returns the value string.
+
+    Arguments:
+        - value: The sample value.
+    """
+
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def __GetDescription(name:str) -> str:
+    """
+    Private function: Gets the HELP text of a metric from 'Metrics.DESCRIPTIONS', span suffixes
+    are ignored.\n
+    Returns the description string, the metric name if it has none.
+
+    Arguments:
+        - name: The metric name string, without 'Metrics.PREFIX'.
+    """
+
+    return Metrics.DESCRIPTIONS.get(name.removesuffix('_total').removesuffix('_seconds'), name)
+
+
+def RenderMetrics() -> str:
+    """
+    Returns every recorded counter and histogram in Prometheus text exposition format.
+
+    Dependencies:
+        - :mod:`__FormatLabels()`: For label sets.
+        - :mod:`__FormatNumber()`: For sample values.
+        - :mod:`__GetDescription()`: For HELP lines.
+    """
+
+    counters, histograms = GetInstruments()
+    lines:list[str] = []
+
+    for counter in counters:
+        name = Metrics.PREFIX + counter.Name
+        lines.append(f'# HELP {name} {__GetDescription(counter.Name)}')
+        lines.append(f'# TYPE {name} counter')
+        for labels, value in sorted(counter.GetValues().items()):
+            lines.append(f'{name}{__FormatLabels(labels)} {__FormatNumber(value)}')
+
+    for histogram in histograms:
+        name = Metrics.PREFIX + histogram.Name
+        bounds = [__FormatNumber(bound) for bound in histogram.Buckets] + ['+Inf']
+        lines.append(f'# HELP {name} {__GetDescription(histogram.Name)}')
+        lines.append(f'# TYPE {name} histogram')
+        for labels, (buckets, total, count) in sorted(histogram.GetValues().items()):
+            cumulative = 0
+            for bound, bucket in zip(bounds, buckets):
+                cumulative += bucket
+                lines.append(f'{name}_bucket{__FormatLabels(labels, (("le", bound),))} {cumulative}')
+            lines.append(f'{name}_sum{__FormatLabels(labels)} {__FormatNumber(total)}')
+            lines.append(f'{name}_count{__FormatLabels(labels)} {count}')
+
+    return '\n'.join(lines) + '\n' if lines else ''
+
+
+def SaveMetricsSnapshot(path:str) -> None:
+    """
+    Writes the recorded metrics to a file in Prometheus text format (see :mod:`RenderMetrics()`).
+
+    Arguments:
+        - path: A string with the snapshot file path.
+    """
+
+    os.makedirs(os.path.dirname(path), exist_ok = True)
+    with open(path, 'w', encoding = 'utf-8') as file:
+        file.write(RenderMetrics())
+
+
+def StartMetrics(print_message_flag:bool = True) -> bool:
+    """
+    Enables instrumentation and serves the metrics at 'http://Metrics.HOST:Metrics.PORT/metrics' on a
+    background thread, instruments keep recording (for the exit snapshot) if the port is taken.
+
+    Return:
+        - True if the endpoint is being served.
+        - False otherwise.
+
+    Optional Arguments:
+        - print_message_flag: A boolean indicating whether the endpoint address should be printed.
+    """
+
+    global __server
+
+    SetMetricsEnabled(True)
+
+    with __server_lock:
+        if __server is not None:
+            return True
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+
+                body = RenderMetrics().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *arguments) -> None:
+                pass #Keeps the CLI clean.
+
+        try:
+            __server = ThreadingHTTPServer((Metrics.HOST, Metrics.PORT), Handler)
+        except OSError as error:
+            if print_message_flag:
+                print(f'- Metrics endpoint could not be started ({error}), metrics are still saved on exit.')
+            return False
+
+        __server.daemon_threads = True
+        threading.Thread(target = __server.serve_forever, name = 'HAF-Metrics', daemon = True).start()
+
+    if print_message_flag:
+        print(f'- Serving metrics at http://{Metrics.HOST}:{Metrics.PORT}/metrics.')
+    return True
+
+
+def StopMetrics() -> None:
+    """
+    Stops the metrics endpoint (if running), saves a snapshot to 'Paths.METRICS_SNAPSHOT_PATH' and
+    disables instrumentation, nothing is saved if it wasn't enabled.
+    """
+
+    global __server
+
+    with __server_lock:
+        server, __server = __server, None
+
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+
+    if IsMetricsEnabled():
+        SaveMetricsSnapshot(Paths.METRICS_SNAPSHOT_PATH)
+        SetMetricsEnabled(False)
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
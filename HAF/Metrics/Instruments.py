@@ -0,0 +1,308 @@
+"""Counters, histograms and spans recorded on ticket processing hot paths, see Exporter module for their output."""
+
+#Native Modules:
+import time
+import bisect
+import functools
+import threading
+import contextlib
+from types import TracebackType
+from typing import Callable
+
+#Internal Modules:
+from HAF.Constants import Metrics
+
+
+class CounterClass():
+    """
+    Monotonic counter with one value per label set.
+    * Uses double undescore to specify private methods/attributes instead of the convenional single underscore.
+
+    Attributes:
+        - Name: The metric name string, without 'Metrics.PREFIX'.
+
+    Private Attributes:
+        - __values: A dictionary of label tuples (sorted (label, value) pairs) and their count.
+        - __lock: A threading lock guarding '__values'.
+    """
+
+    def __init__(self, name:str) -> None:
+        """
+        Creates a new CounterClass instance.
+
+        Arguments:
+            - name: The metric name string, without 'Metrics.PREFIX'.
+        """
+
+        self.Name = str(name)
+        self.__values:dict[tuple, float] = {}
+        self.__lock = threading.Lock()
+
+
+    def Increment(self, labels:tuple, amount:float = 1) -> None:
+        """
+        Adds to the counter of a label set.
+
+        Arguments:
+            - labels: A tuple of sorted (label, value) pairs.
+
+        Optional Arguments:
+            - amount: The non negative amount to be added.
+        """
+
+        with self.__lock:
+            self.__values[labels] = self.__values.get(labels, 0) + amount
+
+
+    def GetValues(self) -> dict[tuple, float]:
+        """Returns a copy of the count of each label set."""
+
+        with self.__lock:
+            return dict(self.__values)
+
+
+class HistogramClass():
+    """
+    Histogram of times with one set of buckets per label set, buckets are cumulated on export.
+    * Uses double undescore to specify private methods/attributes instead of the convenional single underscore.
+
+    Attributes:
+        - Name: The metric name string, without 'Metrics.PREFIX'.
+        - Buckets: A tuple of bucket upper bounds (in seconds), sorted.
+
+    Private Attributes:
+        - __values: A dictionary of label tuples and their [bucket counts list, sum, count] lists, the
+        last bucket count is the '+Inf' bucket.
+        - __lock: A threading lock guarding '__values'.
+    """
+
+    def __init__(self, name:str, buckets:tuple = Metrics.BUCKETS) -> None:
+        """
+        Creates a new HistogramClass instance.
+
+        Arguments:
+            - name: The metric name string, without 'Metrics.PREFIX'.
+
+        Optional Arguments:
+            - buckets: A tuple of bucket upper bounds (in seconds).
+        """
+
+        self.Name = str(name)
+        self.Buckets = tuple(sorted(float(bound) for bound in buckets))
+        self.__values:dict[tuple, list] = {}
+        self.__lock = threading.Lock()
+
+
+    def Observe(self, labels:tuple, seconds:float) -> None:
+        """
+        Adds an observed time to the histogram of a label set.
+
+        Arguments:
+            - labels: A tuple of sorted (label, value) pairs.
+            - seconds: The observed time (in seconds).
+        """
+
+        index = bisect.bisect_left(self.Buckets, seconds)
+
+        with self.__lock:
+            values = self.__values.get(labels)
+            if values is None:
+                values = self.__values[labels] = [[0] * (len(self.Buckets) + 1), 0.0, 0]
+            values[0][index] += 1
+            values[1] += seconds
+            values[2] += 1
+
+
+    def GetValues(self) -> dict[tuple, tuple[list[int], float, int]]:
+        """Returns a copy of the (bucket counts list, sum, count) tuple of each label set."""
+
+        with self.__lock:
+            return {labels: (list(values[0]), values[1], values[2]) for labels, values in self.__values.items()}
+
+
+class SpanClass():
+    """
+    Context manager that times a block and records it in the '<name>_seconds' histogram and the
+    '<name>_total' counter, with an 'outcome' label set to 'ok' or 'error'.
+    * Uses double undescore to specify private methods/attributes instead of the convenional single underscore.
+
+    Private Attributes:
+        - __name: The span name string.
+        - __labels: A dictionary of label names and values.
+        - __start: The 'time.perf_counter()' value the block started at.
+    """
+
+    def __init__(self, name:str, labels:dict) -> None:
+        """
+        Creates a new SpanClass instance.
+
+        Arguments:
+            - name: The span name string.
+            - labels: A dictionary of label names and values.
+        """
+
+        self.__name = name
+        self.__labels = labels
+        self.__start = 0.0
+
+
+    def __enter__(self) -> 'SpanClass':
+        self.__start = time.perf_counter()
+        return self
+
+
+    def __exit__(self, exc_type:type | None, exc_value:BaseException | None, traceback:TracebackType | None) -> bool:
+        seconds = time.perf_counter() - self.__start
+        labels = dict(self.__labels, outcome = 'ok' if exc_type is None else 'error')
+
+        Observe(self.__name + '_seconds', seconds, **labels)
+        Increment(self.__name + '_total', **labels)
+        return False
+
+
+#Global Variables:
+__enabled = bool(Metrics.ENABLED)
+__counters:dict[str, CounterClass] = {}
+__histograms:dict[str, HistogramClass] = {}
+__registry_lock = threading.Lock()
+__NO_SPAN = contextlib.nullcontext() #Returned by every span while disabled.
+
+
+def __Labels(labels:dict) -> tuple:
+    """
+    Private function: Converts a label dictionary into the hashable key used by instruments.\n
+    Returns a tuple of (label, value string) pairs sorted by label.
+
+    Arguments:
+        - labels: A dictionary of label names and values.
+    """
+
+    return tuple(sorted((str(label), str(value)) for label, value in labels.items()))
+
+
+def SetMetricsEnabled(enabled_flag:bool) -> None:
+    """
+    Turns instrumentation on or off, values recorded so far are kept.
+
+    Arguments:
+        - enabled_flag: A boolean indicating whether instruments should record.
+    """
+
+    global __enabled
+    __enabled = bool(enabled_flag)
+
+
+def IsMetricsEnabled() -> bool:
+    """
+    Return:
+        - True if instruments are recording.
+        - False otherwise.
+    """
+
+    return __enabled
+
+
+def Increment(name:str, amount:float = 1, **labels) -> None:
+    """
+    Adds to a counter, created on first use, does nothing while disabled.
+
+    Arguments:
+        - name: The counter name string, without 'Metrics.PREFIX' (should end with '_total').
+
+    Optional Arguments:
+        - amount: The non negative amount to be added.
+        - labels: Label names and values of the counter.
+    """
+
+    if not __enabled:
+        return
+
+    counter = __counters.get(name)
+    if counter is None:
+        with __registry_lock:
+            counter = __counters.setdefault(name, CounterClass(name))
+    counter.Increment(__Labels(labels), amount)
+
+
+def Observe(name:str, seconds:float, **labels) -> None:
+    """
+    Adds a time to a histogram, created on first use with 'Metrics.BUCKETS', does nothing while disabled.
+
+    Arguments:
+        - name: The histogram name string, without 'Metrics.PREFIX' (should end with '_seconds').
+        - seconds: The observed time (in seconds).
+
+    Optional Arguments:
+        - labels: Label names and values of the histogram.
+    """
+
+    if not __enabled:
+        return
+
+    histogram = __histograms.get(name)
+    if histogram is None:
+        with __registry_lock:
+            histogram = __histograms.setdefault(name, HistogramClass(name))
+    histogram.Observe(__Labels(labels), float(seconds))
+
+
+def Span(name:str, **labels) -> SpanClass | contextlib.nullcontext:
+    """
+    Times a block as a span (see SpanClass), a shared no-op context manager is returned while disabled.
+
+    Arguments:
+        - name: The span name string, without 'Metrics.PREFIX' (see 'Metrics.DESCRIPTIONS').
+
+    Optional Arguments:
+        - labels: Label names and values of the span.
+
+    Usage:
+        >>> with Span('ticket', template = 'mfa'):
+        >>>     ...
+    """
+
+    if not __enabled:
+        return __NO_SPAN
+    return SpanClass(name, labels)
+
+
+def Instrumented(name:str, **labels) -> Callable[[Callable], Callable]:
+    """
+    Decorator that runs every call of a function inside a span (see :mod:`Span()`), while disabled
+    each call only costs the flag check.
+
+    Arguments:
+        - name: The span name string, without 'Metrics.PREFIX' (see 'Metrics.DESCRIPTIONS').
+
+    Optional Arguments:
+        - labels: Label names and values of the span.
+
+    Usage:
+        >>> @Instrumented('login')
+        >>> def Login(driver): ...
+    """
+
+    def Decorator(function:Callable) -> Callable:
+        @functools.wraps(function)
+        def Wrapper(*args, **kwargs):
+            if not __enabled:
+                return function(*args, **kwargs)
+            with SpanClass(name, labels):
+                return function(*args, **kwargs)
+        return Wrapper
+    return Decorator
+
+
+def GetInstruments() -> tuple[list[CounterClass], list[HistogramClass]]:
+    """Returns a (counters list, histograms list) tuple with every instrument created, sorted by name."""
+
+    with __registry_lock:
+        return (
+            sorted(__counters.values(), key = lambda counter: counter.Name),
+            sorted(__histograms.values(), key = lambda histogram: histogram.Name)
+        )
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
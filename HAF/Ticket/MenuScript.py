@@ -0,0 +1,115 @@
+"""Compiles ticket menu navigation scripts into batched keystroke actions."""
+
+#External Modules:
+from selenium import webdriver
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.common.action_chains import ActionChains
+
+#Internal Modules:
+from HAF.Driver.WaitHandler import WaitForXHRIdle, WaitForAngular
+from HAF.Driver.InputHandler import InsertText
+from HAF.Constants import Menu, MenuScripts
+
+
+def GetMenuScript(template_type:str) -> list[tuple]:
+    """
+    Returns the menu script of a ticket template 'Type' (see Constants.MenuScripts), a ValueError
+    naming the type is raised if it has none, as running no script would leave the menu unfilled.
+
+    Arguments:
+        - template_type: The ticket template 'Type' string.
+    """
+
+    try:
+        return MenuScripts.SCRIPTS[template_type]
+    except KeyError:
+        raise ValueError(f"No menu script for ticket template type '{template_type}', check the ticket dictionary.") from None
+
+
+def CompileMenuScript(script:list[tuple], fields:dict[str, str]) -> list[tuple]:
+    """
+    Compiles a menu script (see Constants.MenuScripts) into a list of batches, consecutive
+    keystrokes and animation pauses are merged into a single batch.\n
+    Returns a list of ('keys', [('keys', string) | ('pause', seconds), ...]),
+    ('insert', field, text) and ('xhr' | 'settle', step, timeout) tuples.
+
+    Arguments:
+        - script: A list of menu script steps.
+        - fields: Dictionary of field names and their text values.
+    """
+
+    compiled:list[tuple] = []
+    batch:list[tuple] = []
+
+    def Push(kind:str, value:str | float) -> None:
+        #Merges consecutive keystrokes into a single send_keys call.
+        if kind == 'keys' and batch and batch[-1][0] == 'keys':
+            batch[-1] = ('keys', batch[-1][1] + value)
+        else:
+            batch.append((kind, value))
+
+    for step in script:
+        match step[0]:
+            case 'tab':
+                Push('keys', Keys.TAB * int(step[1]))
+            case 'space':
+                Push('keys', Keys.SPACE)
+            case 'text':
+                Push('keys', str(fields[step[1]]))
+            case 'animation':
+                Push('pause', Menu.GENERAL_ANIMATION_DELAY)
+            case 'insert' | 'xhr' | 'settle':
+                if batch:
+                    compiled.append(('keys', batch))
+                    batch = []
+
+                if step[0] == 'insert':
+                    compiled.append(('insert', step[1], str(fields[step[1]])))
+                else:
+                    compiled.append(tuple(step))
+            case _:
+                raise ValueError(f"Invalid menu script step: '{step[0]}'.")
+
+    if batch:
+        compiled.append(('keys', batch))
+
+    return compiled
+
+
+def RunMenuScript(driver:webdriver.Chrome, script:list[tuple], fields:dict[str, str]) -> None:
+    """
+    Compiles and runs a menu script on the focused page, with a single perform() call per batch.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+        - script: A list of menu script steps.
+        - fields: Dictionary of field names and their text values.
+
+    Dependencies:
+        - :mod:`CompileMenuScript()`: For script batching.
+    """
+
+    for batch in CompileMenuScript(script, fields):
+        match batch[0]:
+            case 'keys':
+                action = ActionChains(driver)
+                for kind, value in batch[1]:
+                    if kind == 'keys':
+                        action.send_keys(value)
+                    else:
+                        action.pause(value)
+                action.perform()
+
+            case 'insert':
+                InsertText(driver, batch[2], field = batch[1])
+
+            case 'xhr':
+                WaitForXHRIdle(driver, batch[2], step = batch[1], safe_point = False)
+
+            case 'settle':
+                WaitForAngular(driver, batch[2], step = batch[1], safe_point = False)
+
+
+#This is NOT a script file.
+if __name__ == '__main__':
+    exit('ERROR: Not a script file!')
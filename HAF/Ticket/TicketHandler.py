@@ -5,39 +5,38 @@ import time
 
 #External Modules:
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import WebDriverException
-from selenium.webdriver.common.action_chains import ActionChains
 
 #Internal Modules:
+from HAF.Driver.DriverLock import GetDriverLock
+from HAF.Driver.DriverHandler import FocusPage
+from HAF.Driver.DomHandler import RunDomBatch
+from HAF.Driver.InputHandler import InsertText
+from HAF.Driver.WaitHandler import WaitForPageReady
+from HAF.Driver.NetworkHandler import GetNetworkMonitor, WaitForCreatedTicket
+from HAF.Driver.LocatorHandler import FindElement, Locator, InvalidateElements
+from HAF.Driver.PrefetchHandler import PrefetchPage, UseSparePage
+from HAF.Driver.RetryHandler import RunWithRetry, RetryableError
+from HAF.Driver.HealthMonitor import CheckResources
+from HAF.Driver.CommandTracer import TraceDriver, TraceFlow
+from HAF.Metrics.Instruments import Span, Instrumented
 from HAF.FileHandler.Logger import LogClass
-from HAF.FileHandler.JsonHandler import LoadJson
-from HAF.Constants import Menu, Paths, URL, LogConstants
+from HAF.FileHandler.Latency import GetLatencyProfile
+from HAF.FileHandler.JsonHandler import LoadJson, LoadCachedJson
+from HAF.FileHandler.Journal import JournalClass, GetPendingJournals, ClaimJournal, ReleaseJournal
+from HAF.Ticket.MenuScript import RunMenuScript, GetMenuScript
+from HAF.Constants import Menu, Wait, Paths, URL, LogConstants, Journal
 
-#Global Constants:
-MAX_RECURSION = 3
 
+class TicketSentError(RuntimeError):
+    """Raised when a ticket may have been created but its ID is unknown, it must not be created again."""
 
-def __TabPresser(action:ActionChains, iterations:int) -> None:
-    """
-    Repeats tab pressing for Menu Navigation.
 
-    Arguments:
-        - action: A loaded ActionChains object vinculated to the driver.
-        - iterations: The number (integer) of times the tab pressing should be repeated.
+def __TicketMenuNavigator(driver:webdriver.Chrome, call_data:dict, ticket_data:dict) -> tuple[str, bool]: #TODO ATTACHMENTS
     """
-
-    for i in range(iterations):
-        action.send_keys(Keys.TAB)
-        action.perform()
-        time.sleep(Menu.GENERAL_TAB_DELAY)
-
-
-def __TicketMenuNavigator(driver:webdriver.Chrome, call_data:dict, ticket_data:dict) -> str: #TODO ATTACHMENTS
-    """
-    Navigates javascrpit menu during ticket creation and returns the ticket ID as a string.\n
-    Returns the ticket ID as a string.
+    Navigates javascrpit menu during ticket creation.\n
+    Returns a (ticket ID, request flag) tuple, see :mod:`WaitForCreatedTicket()`.
 
     Arguments:
         - driver: A loaded Chrome webdriver object.
@@ -45,136 +44,113 @@ def __TicketMenuNavigator(driver:webdriver.Chrome, call_data:dict, ticket_data:d
         - ticket_data: Dictionary with ticket data.
 
     Dependencies:
-        - :mod:`__TabPresser()`: for repeated tab pressing.
+        - :mod:`GetMenuScript()`: For the template menu script.
+        - :mod:`RunMenuScript()`: For batched menu navigation.
+        - :mod:`WaitForCreatedTicket()`: For ticket ID capture.
     """
 
-    #Changes focust to driver (menu navigation won't work minimized).
-    try:
-        driver.maximize_window()
-    except WebDriverException:
-        pass #Webdriver gives unknown exception if driver is minimezed for some reason...
-
-    time.sleep(Menu.TICKETMENU_LOAD_DELAY)
-    action = ActionChains(driver)
-
-    match ticket_data['Type']:
-        case 'ticket':
-            #Ticket description.
-            __TabPresser(action, 1)
-            action.send_keys(str(ticket_data['Body']).format(
-                User_ID = call_data['Required']['User_ID'],
-                Contact = call_data['Required']['Contact'],
-                Hostname = str(call_data['Required']['Hostname']).upper(),
-                Variable = str(call_data['Optional']['Variable'])
-            ))
-            action.perform()
-
-            #Fills "How is this affecting you?" field.
-            __TabPresser(action, 1)
-            action.send_keys(Keys.SPACE)
-            action.perform()
-            time.sleep(Menu.GENERAL_ANIMATION_DELAY)
-            __TabPresser(action, 4)
-            action.send_keys(Keys.SPACE)
-            action.perform()
-            time.sleep(Menu.GENERAL_ANIMATION_DELAY)
-
-            #Fills "Degree of affectation" field.
-            __TabPresser(action, 1)
-            action.send_keys(Keys.SPACE)
-            action.perform()
-            time.sleep(Menu.GENERAL_ANIMATION_DELAY)
-            __TabPresser(action, 1)
-            action.send_keys(Keys.SPACE)
-            action.perform()
-            time.sleep(Menu.GENERAL_ANIMATION_DELAY)
-
-            #Fills "Application" field.
-            __TabPresser(action, 1)
-            action.send_keys(ticket_data['Application'])
-            action.perform()
-            time.sleep(Menu.TICKETMENU_APPLICATION_DELAY)
-
-            #Fills "Phone contact" field.
-            __TabPresser(action, 3)
-            action.send_keys(call_data['Required']['Contact'])
-            action.perform()
-            time.sleep(Menu.TICKETMENU_SENDBUTTON_DELAY)
-
-            #Sends ticket.
-            __TabPresser(action, 3)
-            time.sleep(Menu.GENERAL_ANIMATION_DELAY)
-            __TabPresser(action, 1)
-            action.send_keys(Keys.SPACE)
-            action.perform()
-
-        case 'mfa':
-            #Ticket description.
-            __TabPresser(action, 2)
-            action.send_keys(str(ticket_data['Body']).format(
-                User_ID = call_data['Required']['User_ID'],
-                Contact = call_data['Required']['Contact'],
-                Hostname = str(call_data['Required']['Hostname']).upper(),
-                Variable = str(call_data['Optional']['Variable'])
-            ))
-            action.perform()
-
-            time.sleep(Menu.TICKETMENU_SENDBUTTON_DELAY)
-
-            #Sends ticket.
-            __TabPresser(action, 3)
-            time.sleep(Menu.GENERAL_ANIMATION_DELAY)
-            __TabPresser(action, 1)
-            action.send_keys(Keys.SPACE)
-            action.perform()
-
-    time.sleep(Menu.TICKETPAGE_LOAD_DELAY)
-    return driver.current_url.removeprefix('https://prosegur-smartit.onbmc.com/smartit/app/#/sberequest/')
-
-
-def __OpenTicket(driver:webdriver.Chrome, call_data:dict, ticket_data:dict, current_try:int = 0) -> LogClass:
+    #Unknown template types fail before anything is typed into the menu.
+    script = GetMenuScript(ticket_data['Type'])
+
+    #Makes the page behave as focused (menu navigation won't work otherwise).
+    FocusPage(driver)
+
+    WaitForPageReady(driver, Menu.TICKETMENU_LOAD_DELAY, step = 'TicketMenu_Load')
+
+    #Fills and sends the menu with the template 'Type' script.
+    mark = GetNetworkMonitor(driver).Mark()
+    RunMenuScript(driver, script, {
+        'Body': str(ticket_data['Body']).format(
+            User_ID = call_data['Required']['User_ID'],
+            Contact = call_data['Required']['Contact'],
+            Hostname = str(call_data['Required']['Hostname']).upper(),
+            Variable = str(call_data['Optional']['Variable'])
+        ),
+        'Application': str(ticket_data.get('Application', '')),
+        'Contact': str(call_data['Required']['Contact'])
+    })
+
+    #Reads the new ticket ID from the creation request response as soon as it arrives.
+    return WaitForCreatedTicket(driver, mark, Menu.TICKETPAGE_LOAD_DELAY, URL.TICKED_ID_PREFIX, step = 'TicketPage_Load')
+
+
+def __CreateTicket(driver:webdriver.Chrome, call_data:dict, ticket_data:dict, journal:JournalClass) -> str:
     """
-    Private function: Opens a ticket and based on the call data and its ticket template.\n
-    Returns a LogClass object with the ticket details.
-    
+    Private function: Makes a single ticket creation attempt on the smart recorder.\n
+    Returns the new ticket ID string, RetryableError is raised if the portal never sent the ticket.
+
     Dependencies:
-        - :mod:`__MenuNavigator()`: To navigate the javascript menu (Selenium 
+        - :mod:`__TicketMenuNavigator()`: To navigate the javascript menu (Selenium 
         API has a hard time locating elements there).
 
     Arguments:
         - driver: A loaded Chrome webdriver object.
         - call_data: Dictionary with call data.
         - ticket_data: Dictionary with ticket data.
-
-    Opitional Arguments:
-        - current_try: Shouldn't be passed manually, will be increased by one every time this function 
-        is called recursively, once it reaches 'MAX_RECURSION' value a RecursionError is raised.
+        - journal: The JournalClass object of the ticket, its ID is checkpointed once created.
     """
 
-    if current_try == MAX_RECURSION:
-        raise RecursionError('Reached max number of retries for ticket creation, try restasting HAF.')
-
-    driver.refresh()
-    driver.get(URL.SMART_RECORDER_URL)
+    #Uses the smart recorder prefetched after the last ticket, loading it only once otherwise.
+    if not UseSparePage(driver, URL.SMART_RECORDER_URL):
+        if driver.current_url.startswith(URL.SMART_RECORDER_URL):
+            driver.refresh()
+        else:
+            driver.get(URL.SMART_RECORDER_URL)
+    InvalidateElements(driver)
 
-    main_bar = driver.find_element(By.XPATH, '//*[@id="main"]/div/div[2]/div[1]/div[1]/smart-recorder-input/div/div[2]')
+    main_bar = FindElement(driver, 'SmartRecorder', 'MainBar', True)
     main_bar.send_keys('@' + call_data['Required']['User_ID'])
-    time.sleep(Menu.USER_LOAD_DELAY)
+    WaitForPageReady(driver, Menu.USER_LOAD_DELAY, step = 'User_Load')
     main_bar.send_keys(Keys.ENTER + ticket_data['Type'])
 
-    driver.find_element(By.XPATH, '//*[@id="main"]/div/div[2]/div[3]/div/div/div[2]/rs/div/div[2]/rs-dwp-catalog/div/div/div/div[1]/i[1]').click()
-    driver.find_element(By.XPATH, '//*[@id="main"]/div/div[3]/button[1]').click()
+    FindElement(driver, 'SmartRecorder', 'TemplateIcon', True).click()
+    FindElement(driver, 'SmartRecorder', 'CreateButton', True).click()
 
-    ticket_ID = __TicketMenuNavigator(driver, call_data, ticket_data)
+    #Failures inside the menu aren't retried, the ticket may have been sent already.
+    try:
+        ticket_ID, request_flag = __TicketMenuNavigator(driver, call_data, ticket_data)
+    except WebDriverException as error:
+        journal.Checkpoint(Journal.SENT)
+        raise TicketSentError(f'Ticket menu failed ({error.msg}), check the portal before trying again.') from error
 
-    #Checks if tickets was succesfully generated, otherwise it tries again.
+    #Checks if tickets was succesfully generated, otherwise it may be tried again (only if the
+    #portal never sent it, retrying a sent ticket would create a duplicate).
     if ticket_ID.isnumeric():
-        return LogClass(LogConstants.TICKET_CREATED, ticket_ID)
+        journal.Checkpoint(Journal.CREATED, ticket_ID)
+        return ticket_ID
+    elif request_flag:
+        journal.Checkpoint(Journal.SENT)
+        raise TicketSentError('Ticket was sent but its ID could not be read, check the portal before trying again.')
     else:
-        return __OpenTicket(driver, call_data, ticket_data, (current_try + 1))
+        raise RetryableError('Ticket creation request was never sent.')
+
+
+@Instrumented('ticket_stage', stage = 'open')
+def __OpenTicket(driver:webdriver.Chrome, call_data:dict, ticket_data:dict, journal:JournalClass) -> LogClass:
+    """
+    Private function: Opens a ticket and based on the call data and its ticket template.\n
+    Returns a LogClass object with the ticket details, resumed tickets aren't opened again.
+    
+    Dependencies:
+        - :mod:`__CreateTicket()`: For each creation attempt, retried with the 'OpenTicket' policy
+        (see RetryHandler module).
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+        - call_data: Dictionary with call data.
+        - ticket_data: Dictionary with ticket data.
+        - journal: The JournalClass object of the ticket, its ID is checkpointed once created.
+    """
+
+    if journal.IsDone(Journal.CREATED):
+        return LogClass(LogConstants.TICKET_CREATED, journal.GetTicketID, call_data)
+
+    ticket_ID = RunWithRetry('OpenTicket', lambda: __CreateTicket(driver, call_data, ticket_data, journal), driver)
+    return LogClass(LogConstants.TICKET_CREATED, ticket_ID, call_data)
 
 
-def __CloseTicket(driver:webdriver.Chrome, call_data:dict, ticket_data:dict) -> LogClass:
+@Instrumented('ticket_stage', stage = 'close')
+def __CloseTicket(driver:webdriver.Chrome, call_data:dict, ticket_data:dict, journal:JournalClass) -> LogClass:
     """
     Private function: Closes a ticket and based on the call data and its ticket template.\n
     Returns a LogClass object with the ticket details.
@@ -186,74 +162,94 @@ def __CloseTicket(driver:webdriver.Chrome, call_data:dict, ticket_data:dict) ->
         - driver: A loaded Chrome webdriver object.
         - call_data: Dictionary with call data, mainly to be passed to :mod:`__OpenTicket()`:.
         - ticket_data: Dictionary with ticket data, mainly to be passed to :mod:`__OpenTicket()`:.
+        - journal: The JournalClass object of the ticket, steps already checkpointed are skipped.
     """
 
     #Calls for ticket creation.
-    Ticket_Log = __OpenTicket(driver, call_data, ticket_data)
-    driver.get(URL.TICKED_ID_PREFIX + Ticket_Log.GetTicketID)
-
-    #Opens ticket editor.
-    driver.find_element(By.XPATH, '/html/body/div[2]/div/div[2]/div/div[1]/div/div/div[2]/div[2]/div[4]/div/div/div/fulfillment-map/div/div[2]/div[2]/div/div[2]').click()
-    driver.find_element(By.XPATH, '/html/body/div[2]/div/div[2]/div/div[2]/div/div/div/div[3]/div[2]/div').click()
-    time.sleep(Menu.TICKETEDITOR_LOAD_DELAY)
-
-    #Edits ticket title.
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/title-bar/div[2]/div/div[1]/label/input').send_keys(Keys.CONTROL + 'a')
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/title-bar/div[2]/div/div[1]/label/input').send_keys(str(ticket_data['Title']).format(
-        User_ID = call_data['Required']['User_ID'],
-        Contact = call_data['Required']['Contact'],
-        Hostname = str(call_data['Required']['Hostname']).upper(),
-        Variable = str(call_data['Optional']['Variable']).upper()
-    ))
-
-    #Changes status to "ongoing".
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[1]/div/div/div[1]/label/div/button').click()
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[1]/div/div/div[1]/label/div/ul/li[2]/a').click()
-
-    #Sets standard ticket definition.
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[1]/div[1]/div[1]/div/div[3]/div/div/label/div/div/div/button').click()
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[1]/div[1]/div[1]/div/div[3]/div/div/label/div/div/div/ul/li[1]/a').click()
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[1]/div[1]/div[1]/div/div[4]/div/div/label/div/div/div/button').click()
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[1]/div[1]/div[1]/div/div[4]/div/div/label/div/div/div/ul/li[1]/a').click()
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[1]/div[1]/div[1]/div/div[5]/div/div/label/div/div/div/button').click()
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[1]/div[1]/div[1]/div/div[5]/div/div/label/div/div/div/ul/li[2]/a').click()
-    
-    #Sets operational category.
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[2]/div/div[2]/div/div/div/div/div[2]/button[1]').click()
-    driver.find_element(By.XPATH, '//*[@id="category-dropdown-operational"]').click()
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[2]/div/div[2]/div/div/div/div[1]/ul/li[22]/div').click()
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[2]/div/div[2]/div/div/div/div[2]/div').click()
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[2]/div/div[2]/div/div/div/div[2]/ul/li[7]/div').click()
-
-    #Changes ticket disignation to self and reopens ticket editor.
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[3]/div[1]/div/div[1]/div/div/div[2]/div/a').click()
-    time.sleep(Menu.DESIGNATION_LOAD_DELAY)
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[2]/div/button[1]').click()
-    time.sleep(Menu.TICKETEDITOR_LOAD_DELAY)
-    driver.refresh()
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[2]/div').click()
-    time.sleep(Menu.TICKETEDITOR_LOAD_DELAY)
+    Ticket_Log = __OpenTicket(driver, call_data, ticket_data, journal)
+    Ticket_Log.UpdateType(LogConstants.TICKET_CLOSED) #Updates ticket status to closed.
+    if journal.IsDone(Journal.CONCLUDED):
+        return Ticket_Log
+
+    RunWithRetry('Navigate', lambda: driver.get(URL.TICKED_ID_PREFIX + Ticket_Log.GetTicketID), driver)
+    InvalidateElements(driver)
+
+    #Tickets resumed after their designation was saved go straight to the conclusion.
+    if not journal.IsDone(Journal.DESIGNATED):
+        #Opens ticket editor.
+        FindElement(driver, 'TicketPage', 'TaskTab', True).click()
+        FindElement(driver, 'TicketPage', 'EditorButton').click()
+
+        #Edits ticket title.
+        title_input = FindElement(driver, 'TicketEditor', 'TitleInput', True, Menu.TICKETEDITOR_LOAD_DELAY + Wait.ELEMENT_TIMEOUT, step = 'TicketEditor_Load')
+        title_input.send_keys(Keys.CONTROL + 'a')
+        InsertText(driver, str(ticket_data['Title']).format(
+            User_ID = call_data['Required']['User_ID'],
+            Contact = call_data['Required']['Contact'],
+            Hostname = str(call_data['Required']['Hostname']).upper(),
+            Variable = str(call_data['Optional']['Variable']).upper()
+        ), title_input, 'Title')
+
+        #Sets status to "ongoing", standard ticket definition and operational category, then designates the ticket to self.
+        RunDomBatch(driver, [
+            #Changes status to "ongoing".
+            ('click', Locator('TicketEditor', 'StatusButton')),
+            ('click', Locator('TicketEditor', 'StatusOngoing')),
+
+            #Sets standard ticket definition.
+            ('click', Locator('TicketEditor', 'DefinitionButton1')),
+            ('click', Locator('TicketEditor', 'DefinitionOption1')),
+            ('click', Locator('TicketEditor', 'DefinitionButton2')),
+            ('click', Locator('TicketEditor', 'DefinitionOption2')),
+            ('click', Locator('TicketEditor', 'DefinitionButton3')),
+            ('click', Locator('TicketEditor', 'DefinitionOption3')),
+
+            #Sets operational category.
+            ('click', Locator('TicketEditor', 'CategoryButton')),
+            ('click', Locator('TicketEditor', 'CategoryOperational')),
+            ('click', Locator('TicketEditor', 'CategoryTier1')),
+            ('click', Locator('TicketEditor', 'CategoryTier2Button')),
+            ('click', Locator('TicketEditor', 'CategoryTier2')),
+
+            #Changes ticket disignation to self and reopens ticket editor.
+            ('click', Locator('TicketEditor', 'AssignToMe'))
+        ])
+
+        WaitForPageReady(driver, Menu.DESIGNATION_LOAD_DELAY, step = 'Designation_Load')
+        FindElement(driver, 'TicketEditor', 'SaveButton', True).click()
+
+        #Unconfirmed saves aren't checkpointed, a resumed ticket designates it again.
+        if WaitForPageReady(driver, Menu.TICKETEDITOR_LOAD_DELAY, step = 'TicketEditor_Save'):
+            journal.Checkpoint(Journal.DESIGNATED)
+        driver.refresh()
+        InvalidateElements(driver)
+
+    FindElement(driver, 'TicketEditor', 'EditButton', True).click()
 
     #Changes status to "concluded" and status reason to "solution informed".
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[1]/div/div/div[1]/label/div/button').click()
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[1]/div/div/div[1]/label/div/ul/li[4]/a').click()
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[1]/div/div[1]/div[2]/div/label/div/button').click()
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[1]/div/div[1]/div[2]/div/label/div/ul/li[1]/a').click()
+    FindElement(driver, 'TicketEditor', 'StatusButton', True, Menu.TICKETEDITOR_LOAD_DELAY + Wait.ELEMENT_TIMEOUT, step = 'TicketEditor_Reload').click()
+    RunDomBatch(driver, [
+        ('click', Locator('TicketEditor', 'StatusConcluded')),
+        ('click', Locator('TicketEditor', 'StatusReasonButton')),
+        ('click', Locator('TicketEditor', 'StatusReasonSolution'))
+    ])
 
     #Edits ticket solution and saves changes.
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[1]/div/div[2]/div/label/textarea').send_keys(str(ticket_data['Answer'][int(call_data['Optional']['Solution'])]).format(
+    InsertText(driver, str(ticket_data['Answer'][int(call_data['Optional']['Solution'])]).format(
         User_ID = call_data['Required']['User_ID'],
         Contact = call_data['Required']['Contact'],
         Hostname = str(call_data['Required']['Hostname']).upper(),
         Variable = call_data['Optional']['Variable']
-    ))
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[2]/div/button[1]').click()
+    ), FindElement(driver, 'TicketEditor', 'SolutionTextarea'), 'Answer')
+    FindElement(driver, 'TicketEditor', 'SaveButton').click()
+    if WaitForPageReady(driver, Menu.TICKETEDITOR_LOAD_DELAY, step = 'TicketEditor_Save'):
+        journal.Checkpoint(Journal.CONCLUDED)
 
-    Ticket_Log.UpdateType(LogConstants.TICKET_CLOSED) #Updates ticket status to closed.
     return Ticket_Log
 
 
-def __EscalateTicket(driver:webdriver.Chrome, call_data:dict, ticket_data:dict) -> LogClass:
+@Instrumented('ticket_stage', stage = 'escalate')
+def __EscalateTicket(driver:webdriver.Chrome, call_data:dict, ticket_data:dict, journal:JournalClass) -> LogClass:
     """
     Private function: Escalates a ticket and based on the call data and its ticket template.\n
     Returns a LogClass object with the ticket details.
@@ -265,70 +261,83 @@ def __EscalateTicket(driver:webdriver.Chrome, call_data:dict, ticket_data:dict)
         - driver: A loaded Chrome webdriver object.
         - call_data: Dictionary with call data, mainly to be passed to :mod:`__OpenTicket()`:.
         - ticket_data: Dictionary with ticket data, mainly to be passed to :mod:`__OpenTicket()`:.
+        - journal: The JournalClass object of the ticket, steps already checkpointed are skipped.
     """
 
     #Calls for ticket creation.
-    Ticket_Log = __OpenTicket(driver, call_data, ticket_data)
-    driver.get(URL.TICKED_ID_PREFIX + Ticket_Log.GetTicketID)
+    Ticket_Log = __OpenTicket(driver, call_data, ticket_data, journal)
+    Ticket_Log.UpdateType(LogConstants.TICKET_ESCALATED) #Updates ticket status to escalated.
+    if journal.IsDone(Journal.ESCALATED):
+        return Ticket_Log
+
+    RunWithRetry('Navigate', lambda: driver.get(URL.TICKED_ID_PREFIX + Ticket_Log.GetTicketID), driver)
+    InvalidateElements(driver)
 
     #Opens ticket editor.
-    driver.find_element(By.XPATH, '/html/body/div[2]/div/div[2]/div/div[1]/div/div/div[2]/div[2]/div[4]/div/div/div/fulfillment-map/div/div[2]/div[2]/div/div[2]').click()
-    driver.find_element(By.XPATH, '/html/body/div[2]/div/div[2]/div/div[2]/div/div/div/div[3]/div[2]/div').click()
-    time.sleep(Menu.TICKETEDITOR_LOAD_DELAY)
+    FindElement(driver, 'TicketPage', 'TaskTab', True).click()
+    FindElement(driver, 'TicketPage', 'EditorButton').click()
 
     #Edits ticket title.
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/title-bar/div[2]/div/div[1]/label/input').send_keys(Keys.CONTROL + 'a')
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/title-bar/div[2]/div/div[1]/label/input').send_keys(str(ticket_data['Title']).format(
+    title_input = FindElement(driver, 'TicketEditor', 'TitleInput', True, Menu.TICKETEDITOR_LOAD_DELAY + Wait.ELEMENT_TIMEOUT, step = 'TicketEditor_Load')
+    title_input.send_keys(Keys.CONTROL + 'a')
+    InsertText(driver, str(ticket_data['Title']).format(
         Contact = call_data['Required']['Contact'],
         Hostname = call_data['Required']['Hostname'],
         Variable = call_data['Optional']['Variable']
-    ))
+    ), title_input, 'Title')
     
-    #Sets standard ticket definition.
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[1]/div[1]/div[1]/div/div[3]/div/div/label/div/div/div/button').click()
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[1]/div[1]/div[1]/div/div[3]/div/div/label/div/div/div/ul/li[4]/a').click()
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[1]/div[1]/div[1]/div/div[4]/div/div/label/div/div/div/button').click()
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[1]/div[1]/div[1]/div/div[4]/div/div/label/div/div/div/ul/li[1]/a').click()
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[1]/div[1]/div[1]/div/div[5]/div/div/label/div/div/div/button').click()
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[2]/div[1]/div[1]/div[1]/div/div[5]/div/div/label/div/div/div/ul/li[2]/a').click()
+    #Sets standard ticket definition and opens the ticket designation menu.
+    RunDomBatch(driver, [
+        #Sets standard ticket definition.
+        ('click', Locator('TicketEditor', 'DefinitionButton1')),
+        ('click', Locator('TicketEditor', 'DefinitionOption4')),
+        ('click', Locator('TicketEditor', 'DefinitionButton2')),
+        ('click', Locator('TicketEditor', 'DefinitionOption2')),
+        ('click', Locator('TicketEditor', 'DefinitionButton3')),
+        ('click', Locator('TicketEditor', 'DefinitionOption3')),
+
+        ('click', Locator('TicketEditor', 'DesignationMenuButton')) #Opens ticket designation menu.
+    ])
 
     ## The following block works inside the ticket designation menu.
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[3]/div[2]/div/div[3]/div[2]/div/div[1]/div/div/label/span').click() #Opens ticket designation menu.
-
-    #Changes focust to driver (menu navigation won't work minimized).
-    try:
-        driver.maximize_window()
-    except WebDriverException:
-        pass #Webdriver gives unknown exception if driver is minimezed for some reason...
-
-    time.sleep(Menu.DESIGNATIONMENU_LOAD_DELAY)
+    #Makes the page behave as focused (menu navigation won't work otherwise).
+    FocusPage(driver)
 
     #Changes search group to all.
-    driver.find_element(By.XPATH, '/html/body/div[5]/div/div/div/form/div[2]/div[2]/div/div/assignee-chooser/div[2]/div[3]/label/div/button').click()
-    driver.find_element(By.XPATH, '/html/body/div[5]/div/div/div/form/div[2]/div[2]/div/div/assignee-chooser/div[2]/div[3]/label/div/ul/li[3]/a').click()
+    FindElement(driver, 'DesignationMenu', 'GroupButton', True, Menu.DESIGNATIONMENU_LOAD_DELAY + Wait.ELEMENT_TIMEOUT, step = 'DesignationMenu_Load').click()
+    RunDomBatch(driver, [
+        ('click', Locator('DesignationMenu', 'GroupAll')),
+
+        #Opens team search from ticket template.
+        ('click', Locator('DesignationMenu', 'TeamButton'))
+    ])
 
     #Selects team from ticket template.
-    driver.find_element(By.XPATH, '/html/body/div[5]/div/div/div/form/div[2]/div[2]/div/div/assignee-chooser/div[2]/div[4]/label/div/button').click()
-    driver.find_element(By.XPATH, '/html/body/div[5]/div/div/div/form/div[2]/div[2]/div/div/assignee-chooser/div[2]/div[4]/label/div/ul/li[1]/input').send_keys(ticket_data['Team'])
-    time.sleep(Menu.DESIGNATIONMENU_TEAMLOAD_DELAY)
-    driver.find_element(By.XPATH, '/html/body/div[5]/div/div/div/form/div[2]/div[2]/div/div/assignee-chooser/div[2]/div[4]/label/div/ul/li[1]/input').send_keys(Keys.ENTER)
+    FindElement(driver, 'DesignationMenu', 'TeamInput').send_keys(ticket_data['Team'])
+    WaitForPageReady(driver, Menu.DESIGNATIONMENU_TEAMLOAD_DELAY, step = 'DesignationMenu_TeamLoad')
+    FindElement(driver, 'DesignationMenu', 'TeamInput').send_keys(Keys.ENTER)
     time.sleep(Menu.GENERAL_ANIMATION_DELAY)
 
     #Designates to selected team.
-    driver.find_element(By.XPATH, '/html/body/div[5]/div/div/div/form/div[2]/div[2]/div/div/assignee-chooser/div[3]/div[1]').click()
-    driver.find_element(By.XPATH, '/html/body/div[5]/div/div/div/div/div/button[1]').click()
+    FindElement(driver, 'DesignationMenu', 'FirstResult', True).click()
+    FindElement(driver, 'DesignationMenu', 'ConfirmButton').click()
 
     #Saves Changes.
-    driver.find_element(By.XPATH, '//*[@id="ticket-record-summary"]/div[2]/div/button[1]').click()
+    FindElement(driver, 'TicketEditor', 'SaveButton').click()
+    if WaitForPageReady(driver, Menu.TICKETEDITOR_LOAD_DELAY, step = 'TicketEditor_Save'):
+        journal.Checkpoint(Journal.ESCALATED)
 
-    Ticket_Log.UpdateType(LogConstants.TICKET_ESCALATED) #Updates ticket status to escalated.
     return Ticket_Log
 
 
-def TicketProcessor(driver:webdriver.Chrome) -> None: #!INCONPLETE
+def TicketProcessor(driver:webdriver.Chrome, call_data:dict | None = None, journal:JournalClass | None = None) -> LogClass | None: #!INCONPLETE
     """
     Processes call data into a ticket and returns a log object with it's details.
 
+    Return:
+        - None if the call data is invalid.
+        - The registered LogClass object otherwise.
+
     Dependencies:
         - :mod:`__OpenTicket()`: For ticket creation.
         - :mod:`__CloseTicket()`: For ticket closing.
@@ -336,39 +345,106 @@ def TicketProcessor(driver:webdriver.Chrome) -> None: #!INCONPLETE
 
     Arguments:
         - driver: A loaded Chrome webdriver object.
+
+    Optional Arguments:
+        - call_data: Dictionary with call data, defaults on loading 'call.json' file (should be
+        passed when several drivers are processing calls at once).
+        - journal: The JournalClass object of an interrupted ticket to be resumed from its last
+        completed step, its call data replaces 'call_data' (see :mod:`ResumeTicket()`).
     """
 
-    call_data = LoadJson(Paths.CALL_JSON_PATH)
+    if journal is not None:
+        call_data = journal.GetCallData
+    elif call_data is None:
+        call_data = LoadJson(Paths.CALL_JSON_PATH)
     
     try:
-        ticket_data = LoadJson(Paths.DICTIONARY_JSON_PATH)[call_data['Required']['Call_Type']]
+        ticket_data = LoadCachedJson(Paths.DICTIONARY_JSON_PATH)[call_data['Required']['Call_Type']]
     except KeyError:
         print("- ERROR 01: 'Invalid Ticket Type', check your call information.\n")
-        return
+        return None
 
     if ticket_data['Process-Type'] == 'close':
         if call_data['Optional']['Solution'] + 1 > len(ticket_data['Answer']) or call_data['Optional']['Solution'] < 0:
             print("- ERROR 02: 'Invalid Solution ID', check your optinal call paramaters.\n")
-            return
+            return None
 
     #TODO catch if variable is 'none' and there is a {variable} block on the template
 
-    match ticket_data['Process-Type']:
-        case 'open':
-            log = __OpenTicket(driver, call_data, ticket_data)
+    if journal is None:
+        journal = JournalClass(call_data)
 
-            if(call_data['Required']['Call_Type'] != 'mfa'):
-                driver.get(URL.TICKED_ID_PREFIX + log.GetTicketID)
-                driver.find_element(By.XPATH, '/html/body/div[2]/div/div[2]/div/div[1]/div/div/div[2]/div[2]/div[4]/div/div/div/fulfillment-map/div/div[2]/div[2]/div/div[2]').click()
+    #Journals are claimed for the whole run, so other tabs can't resume them meanwhile.
+    if not ClaimJournal(journal):
+        print("- ERROR 08: 'Ticket In Progress', the interrupted ticket is still being processed by another tab.\n")
+        return None
 
-        case 'close':
-            log = __CloseTicket(driver, call_data, ticket_data)
-
-        case 'escalate':
-            log = __EscalateTicket(driver, call_data, ticket_data)
+    try:
+        if journal.IsDone(Journal.SENT) and not journal.IsDone(Journal.CREATED):
+            journal.Finish()
+            print("- ERROR 05: 'Unknown Ticket ID', the ticket was sent but its ID was never read, check the portal before registering it again.\n")
+            return None
+
+        #Commands are recorded under the ticket process type while tracing is running (see CommandTracer module).
+        TraceDriver(driver)
+        with TraceFlow(ticket_data['Process-Type']), Span('ticket', template = call_data['Required']['Call_Type'], process = ticket_data['Process-Type']):
+            #Holds the driver, waits at safe points may still hand it over to other tabs.
+            with GetDriverLock(driver):
+                match ticket_data['Process-Type']:
+                    case 'open':
+                        log = __OpenTicket(driver, call_data, ticket_data, journal)
+
+                        if(call_data['Required']['Call_Type'] != 'mfa'):
+                            RunWithRetry('Navigate', lambda: driver.get(URL.TICKED_ID_PREFIX + log.GetTicketID), driver)
+                            InvalidateElements(driver)
+                            FindElement(driver, 'TicketPage', 'TaskTab', True).click()
+
+                    case 'close':
+                        log = __CloseTicket(driver, call_data, ticket_data, journal)
+
+                    case 'escalate':
+                        log = __EscalateTicket(driver, call_data, ticket_data, journal)
+
+            log.Register()
+            journal.Finish()
+            GetLatencyProfile().Save()
+
+            #Replaces the tab between tickets if it grew too large.
+            CheckResources(driver)
+
+            #Warms up the smart recorder for the next call.
+            PrefetchPage(driver, URL.SMART_RECORDER_URL)
+    finally:
+        ReleaseJournal(journal)
 
-    log.Register()
     print('Done. Use "details" for more details.\n')
+    return log
+
+
+def ResumeTicket(driver:webdriver.Chrome) -> LogClass | None:
+    """
+    Resumes the newest interrupted ticket (not being processed by another tab) on its existing ticket
+    ID, from its last completed step.
+
+    Return:
+        - None if there is no interrupted ticket or it can't be resumed.
+        - The registered LogClass object otherwise.
+
+    Dependencies:
+        - :mod:`TicketProcessor()`: For ticket processing.
+
+    Arguments:
+        - driver: A loaded Chrome webdriver object.
+    """
+
+    journals = GetPendingJournals()
+    if not journals:
+        print('- There are no interrupted tickets to resume.\n')
+        return None
+
+    journal = journals[0]
+    print(f'- Resuming ticket {journal.GetTicketID or "(not created)"} after step "{journal.GetLastStep}" ({len(journals) - 1} more interrupted).')
+    return TicketProcessor(driver, journal = journal)
 
 
 #This is NOT a script file.
@@ -0,0 +1,65 @@
+"""Tests for the element cache of LocatorHandler module."""
+
+#External Modules:
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+
+#Internal Modules:
+from HAF.Driver.LocatorHandler import FindElement, InvalidateElements
+
+
+class FakeElement():
+    """Element stub that counts its round trips and can be made stale."""
+
+    def __init__(self) -> None:
+        self.Stale = False
+        self.Calls = 0
+
+    def is_enabled(self) -> bool:
+        self.Calls += 1
+        if self.Stale:
+            raise StaleElementReferenceException('stale element reference')
+        return True
+
+
+class FakeDriver():
+    """Driver stub that counts its element lookups."""
+
+    current_window_handle = 'home'
+
+    def __init__(self) -> None:
+        self.Lookups = 0
+
+    def find_element(self, by:str, selector:str) -> FakeElement:
+        self.Lookups += 1
+        return FakeElement()
+
+
+@pytest.fixture
+def driver() -> FakeDriver:
+    return FakeDriver()
+
+
+def test_repeated_lookup_reuses_cached_element(driver:FakeDriver) -> None:
+    first = FindElement(driver, 'DesignationMenu', 'TeamInput')
+    second = FindElement(driver, 'DesignationMenu', 'TeamInput')
+
+    assert second is first
+    assert driver.Lookups == 1
+
+
+def test_stale_cached_element_is_looked_up_again(driver:FakeDriver) -> None:
+    first = FindElement(driver, 'DesignationMenu', 'TeamInput')
+    first.Stale = True
+    second = FindElement(driver, 'DesignationMenu', 'TeamInput')
+
+    assert second is not first
+    assert driver.Lookups == 2
+
+
+def test_invalidated_elements_are_looked_up_again(driver:FakeDriver) -> None:
+    FindElement(driver, 'DesignationMenu', 'TeamInput')
+    InvalidateElements(driver, 'DesignationMenu')
+    FindElement(driver, 'DesignationMenu', 'TeamInput')
+
+    assert driver.Lookups == 2